@@ -0,0 +1,125 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Nenhum destes deve ser carregado antes da janela principal aparecer.
+MODULOS_PESADOS = ("matplotlib", "pandas", "openpyxl", "reportlab")
+
+# Código de saída usado quando o Tk não consegue abrir uma janela.
+SEM_DISPLAY = 3
+
+CODIGO_PINTURA = """
+import time
+inicio = time.perf_counter()
+import sys
+import tkinter as tk
+from src.gui.app import App
+try:
+    root = tk.Tk()
+except tk.TclError:
+    sys.exit(%d)
+App(root)
+root.update()
+print(time.perf_counter() - inicio)
+root.destroy()
+""" % SEM_DISPLAY
+
+
+def medir_importacao() -> tuple:
+    resultado = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.gui.app"],
+        cwd=RAIZ,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    modulos = set()
+    for linha in resultado.stderr.splitlines():
+        if not linha.startswith("import time:") or "|" not in linha:
+            continue
+        _, acumulado, nome = linha.split("|")
+        if not acumulado.strip().isdigit():
+            continue
+        nome = nome.strip()
+        modulos.add(nome.split(".")[0])
+        if nome == "src.gui.app":
+            total_us = int(acumulado)
+    return total_us / 1000, sorted(modulos & set(MODULOS_PESADOS))
+
+
+def medir_primeira_pintura() -> float:
+    # Pasta de dados vazia: a medida não depende (nem mexe) no saves/ real.
+    with tempfile.TemporaryDirectory() as pasta:
+        resultado = subprocess.run(
+            [sys.executable, "-c", CODIGO_PINTURA],
+            cwd=RAIZ,
+            capture_output=True,
+            text=True,
+            env={**os.environ, "REGISTRO_SAVES_DIR": pasta},
+        )
+    if resultado.returncode == SEM_DISPLAY:
+        return -1.0
+    if resultado.returncode != 0:
+        raise RuntimeError(resultado.stderr.strip() or f"código {resultado.returncode}")
+    return float(resultado.stdout.strip().splitlines()[-1]) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Mede o tempo de abertura do Registro ULTIMATE de Jogos."
+    )
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--limite-importacao", type=float, default=250.0)
+    # A primeira pintura nunca foi medida num ambiente com display, então não
+    # há número de referência: sem --limite-pintura o tempo só é informado.
+    parser.add_argument("--limite-pintura", type=float, default=None)
+    args = parser.parse_args()
+
+    falhou = False
+
+    importacoes = []
+    for _ in range(args.repeticoes):
+        tempo, pesados = medir_importacao()
+        importacoes.append(tempo)
+        if pesados:
+            print(f"FALHA: módulos pesados carregados na abertura: {pesados}")
+            falhou = True
+            break
+    mediana = statistics.median(importacoes)
+    print(
+        f"Importação de src.gui.app: {mediana:.1f} ms (limite {args.limite_importacao:.0f} ms)"
+    )
+    if mediana > args.limite_importacao:
+        print("FALHA: importação acima do limite.")
+        falhou = True
+
+    try:
+        pinturas = [medir_primeira_pintura() for _ in range(args.repeticoes)]
+    except RuntimeError as e:
+        print(f"FALHA: o app não abriu.\n{e}")
+        return 1
+    if min(pinturas) < 0:
+        print("Primeira pintura não medida (sem display disponível).")
+    else:
+        mediana = statistics.median(pinturas)
+        if args.limite_pintura is None:
+            print(f"Primeira pintura da janela: {mediana:.1f} ms (sem limite)")
+        else:
+            print(
+                f"Primeira pintura da janela: {mediana:.1f} ms (limite {args.limite_pintura:.0f} ms)"
+            )
+            if mediana > args.limite_pintura:
+                print("FALHA: primeira pintura acima do limite.")
+                falhou = True
+
+    return 1 if falhou else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+ESTADOS_PENDENTES = ["Planejo Jogar", "Desistência"]
+ESTADOS_GENEROS = ["História", "100%", "Platina", "Desistência"]
+
+
+def novos_agregados() -> dict:
+    return {
+        "total_jogos": 0,
+        "plataformas": {},
+        "notas_plataforma": {},
+        "minutos_plataforma": {},
+        "jogos_ano": {},
+        "generos_ano": {},
+        "histograma_notas": {},
+        "generos": {},
+        "status": {},
+        "zerados": 0,
+        "minutos_zerados": 0,
+        "soma_notas_zerados": 0.0,
+        "qtd_notas_zerados": 0,
+        "generos_zerados": {},
+    }
+
+
+def _somar(contagem: dict, chave, valor=1):
+    contagem[chave] = contagem.get(chave, 0) + valor
+
+
+def _ajustar(contagem: dict, chave, delta):
+    valor = contagem.get(chave, 0) + delta
+    if valor:
+        contagem[chave] = valor
+    else:
+        contagem.pop(chave, None)
+
+
+def aplicar_jogo(ag: dict, jogo, sinal: int = 1):
+    estado = jogo.estado
+    plataforma = jogo.plataforma
+    genero = jogo.genero
+    nota = jogo.nota_valor
+
+    ag["total_jogos"] += sinal
+    _ajustar(ag["status"], estado, sinal)
+    if estado in ESTADOS_GENEROS:
+        _ajustar(ag["generos"], genero, sinal)
+
+    if estado not in ESTADOS_PENDENTES:
+        _ajustar(ag["plataformas"], plataforma, sinal)
+        if nota is not None:
+            soma = ag["notas_plataforma"].setdefault(plataforma, [0.0, 0])
+            soma[0] += sinal * nota
+            soma[1] += sinal
+            if not soma[1]:
+                del ag["notas_plataforma"][plataforma]
+            _ajustar(ag["histograma_notas"], int(nota), sinal)
+        if jogo.tempo:
+            _ajustar(ag["minutos_plataforma"], plataforma, sinal * jogo.minutos)
+
+    if jogo.data:
+        ag["zerados"] += sinal
+        ag["minutos_zerados"] += sinal * jogo.minutos
+        if nota:
+            ag["soma_notas_zerados"] += sinal * nota
+            ag["qtd_notas_zerados"] += sinal
+        _ajustar(ag["generos_zerados"], genero, sinal)
+
+        if jogo.ano:
+            _ajustar(ag["jogos_ano"], jogo.ano, sinal)
+            por_genero = ag["generos_ano"].setdefault(jogo.ano, {})
+            _ajustar(por_genero, genero, sinal)
+            if not por_genero:
+                del ag["generos_ano"][jogo.ano]
+
+
+def agregados_equivalentes(a, b, tolerancia: float = 1e-4) -> bool:
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(
+            agregados_equivalentes(a[k], b[k], tolerancia) for k in a
+        )
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(
+            agregados_equivalentes(x, y, tolerancia) for x, y in zip(a, b)
+        )
+    if isinstance(a, float) or isinstance(b, float):
+        return abs(a - b) <= tolerancia * max(1.0, abs(a), abs(b))
+    return a == b
@@ -3,12 +3,20 @@ import os
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 ASSETS_DIR = os.path.join(BASE_DIR, "assets")
-SAVES_DIR = os.path.join(BASE_DIR, "saves")
+# REGISTRO_SAVES_DIR troca a pasta de dados (usado pelos benchmarks)
+SAVES_DIR = os.environ.get("REGISTRO_SAVES_DIR") or os.path.join(BASE_DIR, "saves")
 FONT_PATH = os.path.join(ASSETS_DIR, "font", "MPLUS1p-Regular.ttf")
 
 ICON_PATH = os.path.join(ASSETS_DIR, "icon.ico")
 WALLPAPER_PATH = os.path.join(ASSETS_DIR, "wallpaper.png")
 BACKGROUND_PATH = os.path.join(ASSETS_DIR, "Background.png")
+FUNDO_CACHE_PATH = os.path.join(SAVES_DIR, "fundo.png")
+
+# "json" (padrão), "sqlite" ou "mmap" (somente leitura)
+BACKEND_DADOS = os.environ.get("REGISTRO_BACKEND", "json").lower()
+
+# Cópia binária (saves/jogos.bin) do jogos.json para abrir o app mais rápido
+SNAPSHOT_BINARIO = os.environ.get("REGISTRO_SNAPSHOT_BINARIO", "1") != "0"
 
 GENEROS = [
     "RPG",
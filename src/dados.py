@@ -1,19 +1,131 @@
+import codecs
+import copy
 import json
 import os
-import re
 import shutil
-from datetime import datetime
-from src.constantes import SAVES_DIR
+import threading
+from bisect import bisect_left, bisect_right, insort
+from typing import Optional
+from src.constantes import SAVES_DIR, BACKEND_DADOS, SNAPSHOT_BINARIO
+from src.modelo import Jogo
+from src.agregados import aplicar_jogo, agregados_equivalentes
+from src.tabela import TabelaJogos
+from src.indice_busca import IndiceBusca, refinar_por_titulo
+from src.duplicados import IndiceDuplicados
+from src.ordenacao import OrdenadorJogos, normalizar_criterios
+from src.snapshot import carregar_snapshot, salvar_snapshot
+from src.salvamento import SalvadorAutomatico
+
+TAMANHO_BLOCO = 1 << 16
+# Passando de qualquer um dos limites o journal é incorporado ao jogos.json.
+LIMITE_JOURNAL = 500
+LIMITE_BYTES_JOURNAL = 4 << 20
+
+
+def serializar_jogo(obj):
+    if isinstance(obj, Jogo):
+        return obj.para_dict()
+    return str(obj)
+
+
+def iterar_lista_json(arquivo, progresso=None):
+    total = os.fstat(arquivo.fileno()).st_size
+    decodificador = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    pos = 0
+    lidos = 0
+    fim = False
+    aberta = False
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+            pos += 1
+
+        if pos < len(buffer):
+            if not aberta:
+                if buffer[pos] != "[":
+                    raise json.JSONDecodeError("Esperado '['", buffer, pos)
+                aberta = True
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                item, pos = decodificador.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Registro cortado no fim do bloco: lê mais e tenta de novo.
+                if fim:
+                    raise
+            else:
+                yield item
+                continue
+        elif fim:
+            raise json.JSONDecodeError("Lista JSON incompleta", buffer, pos)
+
+        bloco = arquivo.read(TAMANHO_BLOCO)
+        lidos += len(bloco)
+        fim = not bloco
+        buffer = buffer[pos:] + utf8.decode(bloco, final=fim)
+        pos = 0
+        if progresso:
+            progresso(lidos, total)
+
+
+def ordenar_por_data(lista_jogos: list) -> list:
+    jogos_com_data = []
+    jogos_sem_data = []
+    for jogo in lista_jogos:
+        if jogo.data_ordinal:
+            jogos_com_data.append(jogo)
+        else:
+            jogos_sem_data.append(jogo)
+
+    jogos_com_data.sort(key=lambda jogo: jogo.data_ordinal)
+    return jogos_com_data + jogos_sem_data
+
+
+def chave_data(jogo) -> tuple:
+    # Mesma ordem de ordenar_por_data: datados primeiro, sem data no fim.
+    return (not jogo.data_ordinal, jogo.data_ordinal or 0)
 
 
 class GerenciadorDados:
-    def __init__(self):
+    somente_leitura = False
+
+    def __init__(self, usar_journal: bool = True):
         self.arquivo_jogos = os.path.join(SAVES_DIR, "jogos.json")
+        self.arquivo_journal = os.path.join(SAVES_DIR, "jogos.journal")
         self.arquivo_tarefas = os.path.join(SAVES_DIR, "tarefas.json")
+        self.arquivo_snapshot = os.path.join(SAVES_DIR, "jogos.bin")
+
+        self.usar_journal = usar_journal
+        self.tamanho_journal = 0
+        self._seq = 0
+        self._seq_base = 0
+        self._linhas_pendentes = []
+
+        self.versao = 0
+        self._cache = {}
+        self._agregados = None
+        self._indice = None
+        self._duplicados = None
+        self._ordenador = None
+        self._por_id = {}
+        self._proximo_id = 1
+        self.ids_migrados = 0
+        self.erro_carregamento = None
+        self._trava = threading.RLock()
+        # Separada da trava acima para o Tk nunca esperar por um fsync.
+        self._trava_journal = threading.RLock()
+        self._salvador = None
+        self._tarefas_pendentes = None
 
         os.makedirs(SAVES_DIR, exist_ok=True)
 
-    def _salvar_arquivo_seguro(self, caminho: str, dados: list) -> bool:
+    def _salvar_arquivo_seguro(
+        self, caminho: str, dados: list, antes_de_substituir=None
+    ) -> bool:
         temp_file = f"{caminho}.tmp"
         try:
             with open(temp_file, "w", encoding="utf-8") as arquivo:
@@ -21,6 +133,8 @@ class GerenciadorDados:
                 arquivo.flush()
                 os.fsync(arquivo.fileno())
 
+            if antes_de_substituir is not None:
+                antes_de_substituir(temp_file)
             os.replace(temp_file, caminho)
             return True
         except Exception as e:
@@ -29,39 +143,546 @@ class GerenciadorDados:
                 os.remove(temp_file)
             return False
 
-    def carregar_jogos(self) -> list:
+    def _assinatura_snapshot(self) -> Optional[list]:
         try:
-            with open(self.arquivo_jogos, "r", encoding="utf-8") as arquivo:
-                lista_jogos = json.load(arquivo)
-
-            jogos_com_data = [
-                jogo
-                for jogo in lista_jogos
-                if jogo.get("Data de Zeramento")
-                and re.match(r"^\d{2}/\d{2}/\d{4}$", jogo["Data de Zeramento"])
-            ]
-            jogos_sem_data = [
-                jogo
-                for jogo in lista_jogos
-                if not jogo.get("Data de Zeramento")
-                or not re.match(r"^\d{2}/\d{2}/\d{4}$", jogo["Data de Zeramento"])
-            ]
-
-            jogos_com_data.sort(
-                key=lambda jogo: datetime.strptime(
-                    jogo["Data de Zeramento"], "%d/%m/%Y"
+            info = os.stat(self.arquivo_jogos)
+            return [info.st_size, info.st_mtime_ns]
+        except FileNotFoundError:
+            return None
+
+    def _vincular_id(self, jogo) -> bool:
+        atual = jogo.id
+        if (
+            type(atual) is not int
+            or atual <= 0
+            or self._por_id.get(atual, jogo) is not jogo
+        ):
+            jogo.id = self._proximo_id
+        self._por_id[jogo.id] = jogo
+        self._proximo_id = max(self._proximo_id, jogo.id + 1)
+        return jogo.id != atual
+
+    def _registrar_ids(self, lista_jogos: list) -> int:
+        # IDs que já existem são reservados antes de numerar os que faltam,
+        # assim a migração dá sempre o mesmo resultado para o mesmo arquivo.
+        self._por_id = {}
+        self._proximo_id = 1
+        for jogo in lista_jogos:
+            if type(jogo.id) is int and jogo.id > 0 and jogo.id not in self._por_id:
+                self._por_id[jogo.id] = jogo
+                self._proximo_id = max(self._proximo_id, jogo.id + 1)
+        migrados = 0
+        for jogo in lista_jogos:
+            if self._por_id.get(jogo.id) is not jogo:
+                self._vincular_id(jogo)
+                migrados += 1
+        return migrados
+
+    def jogo_por_id(self, id_jogo) -> Optional[Jogo]:
+        return self._por_id.get(id_jogo)
+
+    def _incluir(self, jogo):
+        self._vincular_id(jogo)
+        if self._agregados is not None:
+            aplicar_jogo(self._agregados, jogo, 1)
+        if self._indice is not None:
+            self._indice.adicionar(jogo)
+        if self._duplicados is not None:
+            self._duplicados.adicionar(jogo)
+
+    def _excluir(self, jogo):
+        if self._por_id.get(jogo.id) is jogo:
+            del self._por_id[jogo.id]
+        if self._ordenador is not None:
+            self._ordenador.esquecer(jogo)
+        if self._agregados is not None:
+            aplicar_jogo(self._agregados, jogo, -1)
+        if self._indice is not None:
+            self._indice.remover(jogo)
+        if self._duplicados is not None:
+            self._duplicados.remover(jogo)
+
+    def _marcar_alteracao(self, operacao: str = "", **dados):
+        self.versao += 1
+        if operacao == "adicionar":
+            for jogo in dados.get("jogos", []):
+                self._incluir(jogo)
+        elif operacao == "remover":
+            self._excluir(dados["jogo"])
+        elif operacao == "editar":
+            # O jogo editado assume o lugar e o ID do original.
+            dados["novo"].id = dados["jogo"].id
+            self._excluir(dados["jogo"])
+            self._incluir(dados["novo"])
+        elif operacao != "hidden_gem":
+            self._agregados = None
+            self._indice = None
+            self._duplicados = None
+            self._ordenador = None
+            self._por_id = {}
+            self._proximo_id = 1
+
+    def memorizar(self, chave: str, calcular):
+        versao, valor = self._cache.get(chave, (None, None))
+        if versao != self.versao:
+            valor = calcular()
+            self._cache[chave] = (self.versao, valor)
+        return valor
+
+    def registrar_alteracao(self, operacao: str, **dados) -> bool:
+        self._marcar_alteracao(operacao, **dados)
+        if not self.usar_journal:
+            return False
+
+        # Aqui só se monta a linha; gravar e sincronizar fica com a thread
+        # de salvamento.
+        registro = {"op": operacao}
+        for chave, valor in dados.items():
+            if chave == "jogo":
+                registro["id"] = valor.id
+            else:
+                registro[chave] = valor
+        with self._trava:
+            self._seq += 1
+            registro["seq"] = self._seq
+            self._linhas_pendentes.append(
+                json.dumps(registro, ensure_ascii=False, default=serializar_jogo) + "\n"
+            )
+        self._agendar("journal", self._gravar_journal, atraso=0)
+        return True
+
+    def _gravar_journal(self) -> bool:
+        with self._trava_journal:
+            with self._trava:
+                linhas = self._linhas_pendentes
+                self._linhas_pendentes = []
+            if not linhas:
+                return True
+
+            tamanho = None
+            try:
+                with open(self.arquivo_journal, "a", encoding="utf-8") as arquivo:
+                    tamanho = arquivo.tell()
+                    if not tamanho:
+                        cabecalho = {"base": self._assinatura_snapshot()}
+                        arquivo.write(json.dumps(cabecalho) + "\n")
+                    arquivo.write("".join(linhas))
+                    arquivo.flush()
+                    os.fsync(arquivo.fileno())
+                    self.tamanho_journal = arquivo.tell()
+                return True
+            except Exception as e:
+                print(f"Erro ao registrar alteração no journal: {e}")
+                # Uma linha pela metade no fim esconderia as próximas.
+                if tamanho is not None:
+                    try:
+                        os.truncate(self.arquivo_journal, tamanho)
+                    except OSError:
+                        pass
+                with self._trava:
+                    self._linhas_pendentes[:0] = linhas
+                return False
+
+    @property
+    def entradas_journal(self) -> int:
+        # Alterações que ainda não estão no jogos.json, gravadas ou não.
+        with self._trava:
+            return self._seq - self._seq_base
+
+    def precisa_compactar(self) -> bool:
+        return (
+            not self.usar_journal
+            or self.entradas_journal >= LIMITE_JOURNAL
+            or self.tamanho_journal >= LIMITE_BYTES_JOURNAL
+        )
+
+    def _descartar_journal(self):
+        with self._trava_journal:
+            if os.path.exists(self.arquivo_journal):
+                os.remove(self.arquivo_journal)
+            self.tamanho_journal = 0
+            with self._trava:
+                self._linhas_pendentes = []
+                self._seq_base = self._seq
+
+    def _posicao_journal(self) -> int:
+        with self._trava:
+            return self._seq
+
+    def _ler_journal(self) -> tuple:
+        # Só valem linhas completas; o que vier depois da primeira linha
+        # cortada ou inválida é descartado do arquivo.
+        try:
+            with open(self.arquivo_journal, "rb") as arquivo:
+                bruto = arquivo.read()
+        except FileNotFoundError:
+            return None, []
+
+        registros = []
+        valido = 0
+        for linha in bruto.splitlines(keepends=True):
+            if not linha.endswith(b"\n"):
+                break
+            try:
+                registros.append(json.loads(linha))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                break
+            valido += len(linha)
+
+        if valido < len(bruto):
+            print("Journal com linha incompleta; o restante foi descartado.")
+            try:
+                os.truncate(self.arquivo_journal, valido)
+            except OSError as e:
+                print(f"Erro ao corrigir o journal: {e}")
+        if not registros or not isinstance(registros[0], dict):
+            return {}, []
+        return registros[0], [r for r in registros[1:] if isinstance(r, dict)]
+
+    def _reescrever_journal(self, cabecalho: dict, registros: list):
+        temporario = f"{self.arquivo_journal}.tmp"
+        with open(temporario, "w", encoding="utf-8") as arquivo:
+            for registro in [cabecalho, *registros]:
+                arquivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+            self.tamanho_journal = arquivo.tell()
+        os.replace(temporario, self.arquivo_journal)
+
+    def _preparar_journal(self, nova: list, posicao: int):
+        # Gravado antes de trocar o jogos.json: se o programa cair no meio do
+        # salvamento, a próxima abertura sabe com qual arquivo o journal vale
+        # e quais entradas já estão nele.
+        with self._trava_journal:
+            atual, registros = self._ler_journal()
+            anterior = self._assinatura_snapshot()
+            if atual and atual.get("base") == anterior and "posicao" in atual:
+                # Sobras de um salvamento interrompido que já estão no arquivo.
+                registros = [r for r in registros if r.get("seq", 0) > atual["posicao"]]
+            cabecalho = {"base": nova, "anterior": anterior, "posicao": posicao}
+            self._reescrever_journal(cabecalho, registros)
+
+    def _podar_journal(self, posicao: int):
+        with self._trava_journal:
+            with self._trava:
+                self._seq_base = max(self._seq_base, posicao)
+            try:
+                _, registros = self._ler_journal()
+                restantes = [r for r in registros if r.get("seq", 0) > posicao]
+                if not restantes:
+                    if os.path.exists(self.arquivo_journal):
+                        os.remove(self.arquivo_journal)
+                    self.tamanho_journal = 0
+                    return
+                # Alterações feitas enquanto o arquivo era gravado continuam
+                # no journal, agora apontando para o jogos.json novo.
+                self._reescrever_journal(
+                    {"base": self._assinatura_snapshot()}, restantes
                 )
+            except OSError as e:
+                print(f"Erro ao compactar o journal: {e}")
+
+    @staticmethod
+    def _localizar(lista_jogos: list, dados: dict, ignorar: set) -> Optional[Jogo]:
+        for atual in lista_jogos:
+            if atual in ignorar:
+                continue
+            registro = atual.para_dict()
+            registro.pop("ID", None)
+            if registro == dados:
+                return atual
+        return None
+
+    def _aplicar_journal(self, lista_jogos: list) -> int:
+        cabecalho, registros = self._ler_journal()
+        if cabecalho is None:
+            return 0
+
+        atual = self._assinatura_snapshot()
+        if cabecalho.get("base") == atual:
+            # Salvamento interrompido depois da troca do jogos.json: as
+            # entradas até "posicao" já estão nele.
+            incorporadas = cabecalho.get("posicao")
+        elif "anterior" in cabecalho and cabecalho["anterior"] == atual:
+            # Interrompido antes da troca: o jogos.json ainda é o antigo.
+            incorporadas = None
+        else:
+            # Journal de um jogos.json anterior: já foi incorporado.
+            self._descartar_journal()
+            return 0
+
+        self._seq = max((r.get("seq", 0) for r in registros), default=0)
+        if incorporadas is not None:
+            registros = [r for r in registros if r.get("seq", 0) > incorporadas]
+
+        aplicadas = 0
+        removidos = set()
+        substituidos = {}
+        for registro in registros:
+            operacao = registro.get("op")
+            if operacao == "adicionar":
+                for dados in registro.get("jogos", []):
+                    jogo = Jogo.de_dict(dados)
+                    self._vincular_id(jogo)
+                    lista_jogos.append(jogo)
+            elif operacao in ("remover", "hidden_gem", "editar"):
+                if "id" in registro:
+                    jogo = self._por_id.get(registro["id"])
+                else:
+                    # Journal gravado antes dos IDs: procura pelo conteúdo.
+                    jogo = self._localizar(lista_jogos, registro.get("jogo"), removidos)
+                if jogo is not None:
+                    if operacao == "remover":
+                        removidos.add(jogo)
+                        self._por_id.pop(jogo.id, None)
+                    elif operacao == "editar":
+                        novo = Jogo.de_dict(registro["novo"])
+                        novo.id = jogo.id
+                        self._por_id[jogo.id] = novo
+                        substituidos[jogo] = novo
+                    else:
+                        jogo["Hidden Gem"] = registro.get("valor", False)
+            aplicadas += 1
+
+        if removidos or substituidos:
+            atualizada = []
+            for jogo in lista_jogos:
+                while jogo in substituidos:
+                    jogo = substituidos[jogo]
+                if jogo not in removidos:
+                    atualizada.append(jogo)
+            lista_jogos[:] = atualizada
+        return aplicadas
+
+    def _salvar_snapshot_binario(self, lista_jogos: list):
+        assinatura = self._assinatura_snapshot()
+        if SNAPSHOT_BINARIO and assinatura:
+            salvar_snapshot(
+                self.arquivo_snapshot, ordenar_por_data(lista_jogos), assinatura
             )
 
-            return jogos_com_data + jogos_sem_data
+    def carregar_jogos(self, progresso=None) -> list:
+        self._marcar_alteracao("carregar")
+        lista_jogos = None
+        assinatura = self._assinatura_snapshot()
+        if SNAPSHOT_BINARIO and assinatura:
+            lista_jogos = carregar_snapshot(self.arquivo_snapshot, assinatura)
+        if lista_jogos is None:
+            lista_jogos = self._carregar_json(progresso)
+            if lista_jogos is None:
+                self._guardar_corrompido()
+                return []
+            if lista_jogos and assinatura:
+                self._salvar_snapshot_binario(lista_jogos)
 
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+        self.ids_migrados = self._registrar_ids(lista_jogos)
+
+        if self.usar_journal:
+            self._seq = 0
+            self._seq_base = 0
+            self.tamanho_journal = 0
+            aplicadas = self._aplicar_journal(lista_jogos)
+            self._seq_base = self._seq - aplicadas
+            if os.path.exists(self.arquivo_journal):
+                self.tamanho_journal = os.path.getsize(self.arquivo_journal)
+            if aplicadas:
+                lista_jogos = ordenar_por_data(lista_jogos)
+
+        return lista_jogos
+
+    def _guardar_corrompido(self):
+        # O próximo salvamento escreve um jogos.json novo por cima; o original
+        # fica guardado ao lado. O journal vai junto porque vale para ele.
+        destino = f"{self.arquivo_jogos}.corrompido"
+        try:
+            shutil.copy2(self.arquivo_jogos, destino)
+            if os.path.exists(self.arquivo_journal):
+                os.replace(self.arquivo_journal, f"{self.arquivo_journal}.corrompido")
+        except OSError as e:
+            print(f"Erro ao guardar cópia de {self.arquivo_jogos}: {e}")
+            # Sem cópia, nada pode ser gravado por cima do arquivo.
+            self.somente_leitura = True
+            self.erro_carregamento = (
+                f"Não foi possível ler {self.arquivo_jogos} nem guardar uma cópia "
+                "dele. A biblioteca foi aberta somente para leitura."
+            )
+            return
+        self.erro_carregamento = (
+            f"Não foi possível ler {self.arquivo_jogos}. A biblioteca foi aberta "
+            f"vazia e o arquivo original foi guardado em {destino}."
+        )
+
+    def _carregar_json(self, progresso=None) -> Optional[list]:
+        jogos_com_data = []
+        jogos_sem_data = []
+        try:
+            with open(self.arquivo_jogos, "rb") as arquivo:
+                for item in iterar_lista_json(arquivo, progresso):
+                    if not isinstance(item, dict):
+                        print(f"Registro ignorado em {self.arquivo_jogos}: {item!r}")
+                        continue
+                    jogo = Jogo.de_dict(item)
+                    if jogo.data_ordinal:
+                        jogos_com_data.append(jogo)
+                    else:
+                        jogos_sem_data.append(jogo)
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            print(f"Erro ao ler {self.arquivo_jogos}: {e}")
+            return None
+
+        jogos_com_data.sort(key=lambda jogo: jogo.data_ordinal)
+        jogos_com_data.extend(jogos_sem_data)
+        return jogos_com_data
+
+    def salvar_jogos(self, lista_jogos: list, posicao: Optional[int] = None) -> bool:
+        if self.somente_leitura:
+            print("Biblioteca aberta somente para leitura; nada foi salvo.")
+            return False
+        if posicao is None:
+            posicao = self._posicao_journal()
+        if self.usar_journal:
+            # As entradas até "posicao" precisam estar no arquivo antes do
+            # cabeçalho novo ser gravado.
+            self._gravar_journal()
+
+        def preparar(temporario):
+            if self.usar_journal:
+                info = os.stat(temporario)
+                self._preparar_journal([info.st_size, info.st_mtime_ns], posicao)
+
+        sucesso = self._salvar_arquivo_seguro(
+            self.arquivo_jogos, [jogo.para_dict() for jogo in lista_jogos], preparar
+        )
+        if sucesso:
+            if self.usar_journal:
+                self._podar_journal(posicao)
+            self._salvar_snapshot_binario(lista_jogos)
+        return sucesso
+
+    def _agendar(self, chave: str, trabalho, atraso: Optional[float] = None):
+        if self._salvador is None:
+            self._salvador = SalvadorAutomatico()
+        self._salvador.agendar(chave, trabalho, atraso)
+
+    def agendar_jogos(self, lista_jogos: list):
+        copia = list(lista_jogos)
+        posicao = self._posicao_journal()
+        self._agendar("jogos", lambda: self.salvar_jogos(copia, posicao))
+
+    def agendar_tarefas(self, tarefas: list):
+        copia = copy.deepcopy(tarefas)
+        with self._trava:
+            self._tarefas_pendentes = copia
+        self._agendar("tarefas", lambda: self._salvar_tarefas_pendentes(copia))
+
+    def _salvar_tarefas_pendentes(self, tarefas: list):
+        if self.salvar_tarefas(tarefas):
+            with self._trava:
+                if self._tarefas_pendentes is tarefas:
+                    self._tarefas_pendentes = None
 
-    def salvar_jogos(self, lista_jogos: list) -> bool:
-        return self._salvar_arquivo_seguro(self.arquivo_jogos, lista_jogos)
+    def descarregar(self):
+        if self._salvador is not None:
+            self._salvador.descarregar()
+
+    def encerrar(self):
+        # Grava o que estiver pendente e termina a thread de salvamento.
+        if self._salvador is not None:
+            self._salvador.parar()
+            self._salvador = None
+
+    def filtrar_jogos(
+        self,
+        lista_jogos: list,
+        titulo: str = "",
+        genero: str = "",
+        plataforma: str = "",
+        estado: str = "",
+    ) -> list:
+        if self._indice is None or self._indice.total != len(lista_jogos):
+            self._indice = IndiceBusca.de_jogos(lista_jogos)
+        return self._indice.filtrar(
+            lista_jogos,
+            titulo=titulo,
+            genero=genero,
+            plataforma=plataforma,
+            estado=estado,
+        )
+
+    def refinar_busca(self, jogos: list, titulo: str) -> list:
+        return refinar_por_titulo(jogos, titulo)
+
+    def indice_duplicados(self, lista_jogos: list) -> IndiceDuplicados:
+        if self._duplicados is None or self._duplicados.total != len(lista_jogos):
+            self._duplicados = IndiceDuplicados.de_jogos(lista_jogos)
+        return self._duplicados
+
+    def encontrar_duplicados(self, lista_jogos: list, titulo, plataforma) -> list:
+        return self.indice_duplicados(lista_jogos).encontrar(titulo, plataforma)
+
+    def relatorio_duplicados(self, lista_jogos: list) -> list:
+        return self.indice_duplicados(lista_jogos).repetidos()
+
+    def listar_hidden_gems(self, lista_jogos: list) -> list:
+        return [j for j in lista_jogos if j.hidden_gem]
+
+    def ordenador(self, criterios) -> OrdenadorJogos:
+        # As chaves calculadas ficam guardadas enquanto a ordem for a mesma.
+        criterios = normalizar_criterios(criterios)
+        if self._ordenador is None or self._ordenador.criterios != criterios:
+            self._ordenador = OrdenadorJogos(criterios)
+        return self._ordenador
+
+    def ordenar_jogos(self, lista_jogos: list, criterios) -> list:
+        if not normalizar_criterios(criterios):
+            return list(lista_jogos)
+        if self._indice is not None:
+            self._indice.descartar_posicoes()
+        return self.ordenador(criterios).ordenar(lista_jogos)
+
+    def _chave_lista(self, criterios):
+        # Sem critérios, a lista principal segue a ordem de ordenar_por_data.
+        if criterios and normalizar_criterios(criterios):
+            return self.ordenador(criterios).chave
+        return chave_data
+
+    def inserir_ordenado(self, lista_jogos: list, jogo, criterios=None):
+        insort(lista_jogos, jogo, key=self._chave_lista(criterios))
+
+    def posicao_jogo(self, lista_jogos: list, jogo, criterios=None) -> int:
+        # Busca binária pela chave; só os empates são comparados um a um.
+        chave = self._chave_lista(criterios)
+        valor = chave(jogo)
+        inicio = bisect_left(lista_jogos, valor, key=chave)
+        fim = bisect_right(lista_jogos, valor, lo=inicio, key=chave)
+        try:
+            return lista_jogos.index(jogo, inicio, fim)
+        except ValueError:
+            # Lista fora da ordem esperada: procura nela inteira.
+            return lista_jogos.index(jogo)
+
+    def calcular_agregados(self, lista_jogos: list) -> dict:
+        if self._agregados is None:
+            self._agregados = self._calcular_agregados(lista_jogos)
+        return self._agregados
+
+    def _calcular_agregados(self, lista_jogos: list) -> dict:
+        return TabelaJogos.de_jogos(lista_jogos).agregados()
+
+    def verificar_agregados(self, lista_jogos: list) -> bool:
+        if self._agregados is None:
+            return True
+        return agregados_equivalentes(
+            self._agregados, self._calcular_agregados(lista_jogos)
+        )
 
     def carregar_tarefas(self) -> list:
+        # Tarefas ainda esperando o salvamento automático valem mais que o disco.
+        with self._trava:
+            if self._tarefas_pendentes is not None:
+                return copy.deepcopy(self._tarefas_pendentes)
         try:
             with open(self.arquivo_tarefas, "r", encoding="utf-8") as arquivo:
                 return json.load(arquivo)
@@ -72,7 +693,24 @@ class GerenciadorDados:
         return self._salvar_arquivo_seguro(self.arquivo_tarefas, tarefas)
 
     def resetar_tudo(self):
+        self.descarregar()
+        self._marcar_alteracao("resetar")
         if os.path.exists(self.arquivo_jogos):
             os.remove(self.arquivo_jogos)
         if os.path.exists(self.arquivo_tarefas):
             os.remove(self.arquivo_tarefas)
+        if os.path.exists(self.arquivo_snapshot):
+            os.remove(self.arquivo_snapshot)
+        self._descartar_journal()
+
+
+def criar_gerenciador_dados(backend: str = BACKEND_DADOS) -> GerenciadorDados:
+    if backend == "mmap":
+        from src.dados_mapeados import GerenciadorDadosMapeado
+
+        return GerenciadorDadosMapeado()
+    if backend == "sqlite":
+        from src.dados_sqlite import GerenciadorDadosSQLite
+
+        return GerenciadorDadosSQLite()
+    return GerenciadorDados()
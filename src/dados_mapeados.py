@@ -0,0 +1,282 @@
+import mmap
+import os
+from collections.abc import Sequence
+from typing import Optional
+import numpy as np
+from src.dados import GerenciadorDados, ordenar_por_data
+from src.modelo import Jogo
+from src.ordenacao import normalizar_criterios
+from src.indice_busca import extrair_termos, normalizar_consulta, titulo_corresponde
+from src.snapshot import (
+    GEM_VERDADEIRO,
+    SnapshotColunar,
+    abrir_snapshot,
+    salvar_snapshot,
+    snapshot_vazio,
+)
+from src.tabela import TabelaJogos
+from src.utils import chave_jogo
+
+
+class BibliotecaMapeada(Sequence):
+    def __init__(self, snapshot: SnapshotColunar, indices: Optional[np.ndarray] = None):
+        self.snapshot = snapshot
+        self.indices = (
+            np.arange(len(snapshot), dtype=np.int64) if indices is None else indices
+        )
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return BibliotecaMapeada(self.snapshot, self.indices[i])
+        return self.snapshot.jogo(int(self.indices[i]))
+
+    def copy(self):
+        return self
+
+    def restringir(self, indices: np.ndarray) -> "BibliotecaMapeada":
+        return BibliotecaMapeada(self.snapshot, indices)
+
+
+class GerenciadorDadosMapeado(GerenciadorDados):
+    somente_leitura = True
+
+    def __init__(self):
+        super().__init__(usar_journal=True)
+        self._mapa = None
+        self._snapshot = None
+        self._ordem_ids = None
+
+    def _mapear(self, assinatura: list) -> Optional[SnapshotColunar]:
+        try:
+            with open(self.arquivo_snapshot, "rb") as arquivo:
+                mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        snapshot = abrir_snapshot(mapa, assinatura)
+        if snapshot is None:
+            try:
+                mapa.close()
+            except BufferError:
+                pass
+            return None
+        self._mapa = mapa
+        return snapshot
+
+    def carregar_jogos(self, progresso=None) -> BibliotecaMapeada:
+        self._marcar_alteracao("carregar")
+        assinatura = self._assinatura_snapshot()
+        snapshot = self._mapear(assinatura) if assinatura else None
+
+        if snapshot is None and assinatura:
+            lista_jogos = self._carregar_json(progresso)
+            if lista_jogos:
+                self._registrar_ids(lista_jogos)
+                salvar_snapshot(
+                    self.arquivo_snapshot, ordenar_por_data(lista_jogos), assinatura
+                )
+                # Os IDs já estão na coluna do snapshot; o mapa só prenderia
+                # a biblioteca inteira na memória.
+                self._por_id = {}
+            del lista_jogos
+            snapshot = self._mapear(assinatura)
+
+        if os.path.exists(self.arquivo_journal):
+            print("Há alterações no journal que não aparecem no modo somente leitura.")
+
+        if snapshot is None:
+            snapshot = snapshot_vazio()
+        self._snapshot = snapshot
+        self._ordem_ids = None
+        return BibliotecaMapeada(snapshot)
+
+    def jogo_por_id(self, id_jogo) -> Optional[Jogo]:
+        if self._snapshot is None or type(id_jogo) is not int:
+            return None
+        ids = self._snapshot.numericas["id"]
+        if self._ordem_ids is None:
+            self._ordem_ids = np.argsort(ids, kind="stable")
+        pos = int(np.searchsorted(ids, id_jogo, sorter=self._ordem_ids))
+        if pos < len(ids) and ids[self._ordem_ids[pos]] == id_jogo:
+            return self._snapshot.jogo(int(self._ordem_ids[pos]))
+        return None
+
+    def salvar_jogos(self, lista_jogos) -> bool:
+        print("Biblioteca aberta somente para leitura; nada foi salvo.")
+        return False
+
+    def registrar_alteracao(self, operacao: str, **dados) -> bool:
+        print("Biblioteca aberta somente para leitura; alteração ignorada.")
+        return False
+
+    def agendar_jogos(self, lista_jogos):
+        pass
+
+    def _codigo(self, categorias: list, valor: str) -> int:
+        try:
+            return categorias.index(valor)
+        except ValueError:
+            return -1
+
+    def filtrar_jogos(
+        self,
+        lista_jogos: BibliotecaMapeada,
+        titulo: str = "",
+        genero: str = "",
+        plataforma: str = "",
+        estado: str = "",
+    ) -> BibliotecaMapeada:
+        snapshot = self._snapshot
+        indices = lista_jogos.indices
+        for coluna, categorias, valor in (
+            ("genero", snapshot.generos, genero),
+            ("plataforma", snapshot.plataformas, plataforma),
+            ("estado", snapshot.estados, estado),
+        ):
+            if valor:
+                codigos = snapshot.numericas[coluna][indices]
+                indices = indices[codigos == self._codigo(categorias, valor)]
+
+        resultado = lista_jogos.restringir(indices)
+        trecho = normalizar_consulta(titulo)
+        if trecho:
+            encontrados = self.refinar_busca(resultado, titulo)
+            if not len(encontrados):
+                # Mesmo critério do IndiceBusca: sem termo com esse prefixo,
+                # procura o trecho dentro do título.
+                titulos = self._snapshot.textos["titulo"]
+                mantidos = [
+                    i
+                    for i in indices.tolist()
+                    if trecho in normalizar_consulta(titulos[i])
+                ]
+                encontrados = lista_jogos.restringir(
+                    np.asarray(mantidos, dtype=np.int64)
+                )
+            resultado = encontrados
+        return resultado
+
+    def refinar_busca(self, jogos: BibliotecaMapeada, titulo: str) -> BibliotecaMapeada:
+        consulta = extrair_termos(titulo)
+        if not consulta:
+            # Como em refinar_por_titulo: sem termos, nada é mantido.
+            return jogos.restringir(np.empty(0, dtype=np.int64))
+        titulos = self._snapshot.textos["titulo"]
+        mantidos = [
+            i
+            for i in jogos.indices.tolist()
+            if titulo_corresponde(extrair_termos(titulos[i]), consulta)
+        ]
+        return jogos.restringir(np.asarray(mantidos, dtype=np.int64))
+
+    def _chaves_duplicados(self, indices: np.ndarray):
+        # Chaves montadas direto das colunas, sem criar um Jogo por linha.
+        snapshot = self._snapshot
+        titulos = snapshot.textos["titulo"]
+        plataformas = snapshot.plataformas
+        numericas = snapshot.numericas
+        for i, bruto, codigo in zip(
+            indices.tolist(),
+            numericas["bruto"][indices].tolist(),
+            numericas["plataforma"][indices].tolist(),
+        ):
+            if bruto:
+                jogo = snapshot.jogo(i)
+                yield i, chave_jogo(jogo.titulo, jogo.plataforma)
+            else:
+                yield i, chave_jogo(titulos[i], plataformas[codigo])
+
+    def encontrar_duplicados(
+        self, lista_jogos: BibliotecaMapeada, titulo, plataforma
+    ) -> list:
+        chave = chave_jogo(titulo, plataforma)
+        return [
+            self._snapshot.jogo(i)
+            for i, atual in self._chaves_duplicados(lista_jogos.indices)
+            if atual == chave
+        ]
+
+    def relatorio_duplicados(self, lista_jogos: BibliotecaMapeada) -> list:
+        grupos = {}
+        for i, chave in self._chaves_duplicados(lista_jogos.indices):
+            grupos.setdefault(chave, []).append(i)
+        return [
+            list(lista_jogos.restringir(np.asarray(grupo, dtype=np.int64)))
+            for grupo in grupos.values()
+            if len(grupo) > 1
+        ]
+
+    @staticmethod
+    def _postos(valores: list) -> np.ndarray:
+        posicoes = {valor: i for i, valor in enumerate(sorted(set(valores)))}
+        return np.fromiter(
+            (posicoes[valor] for valor in valores), np.int64, len(valores)
+        )
+
+    def _coluna_ordenacao(self, indices: np.ndarray, campo: str) -> np.ndarray:
+        snapshot = self._snapshot
+        numericas = snapshot.numericas
+        if campo == "nota":
+            return np.nan_to_num(numericas["nota_valor"][indices], nan=0.0)
+        if campo == "data":
+            return numericas["data_ordinal"][indices].astype(np.int64)
+        if campo == "tempo":
+            return numericas["minutos"][indices].astype(np.int64)
+        if campo == "titulo":
+            titulos = snapshot.textos["titulo"]
+            return self._postos([titulos[i].lower() for i in indices.tolist()])
+        categorias = {
+            "genero": snapshot.generos,
+            "plataforma": snapshot.plataformas,
+            "estado": snapshot.estados,
+        }[campo]
+        postos = self._postos([c.lower() for c in categorias])
+        return postos[numericas[campo][indices]]
+
+    def ordenar_jogos(
+        self, lista_jogos: BibliotecaMapeada, criterios
+    ) -> BibliotecaMapeada:
+        if not isinstance(lista_jogos, BibliotecaMapeada):
+            # Listas comuns (ex.: relatório de repetidos) usam o ordenador genérico.
+            return super().ordenar_jogos(lista_jogos, criterios)
+        criterios = normalizar_criterios(criterios)
+        if not criterios:
+            return lista_jogos
+        indices = lista_jogos.indices
+        colunas = []
+        for campo, decrescente in reversed(criterios):
+            coluna = self._coluna_ordenacao(indices, campo)
+            colunas.append(-coluna if decrescente else coluna)
+        return lista_jogos.restringir(indices[np.lexsort(colunas)])
+
+    def listar_hidden_gems(self, lista_jogos: BibliotecaMapeada) -> list:
+        gems = (
+            self._snapshot.numericas["hidden_gem"][lista_jogos.indices]
+            == GEM_VERDADEIRO
+        )
+        return list(lista_jogos.restringir(lista_jogos.indices[gems]))
+
+    def _calcular_agregados(self, lista_jogos: BibliotecaMapeada) -> dict:
+        snapshot = self._snapshot
+        numericas = snapshot.numericas
+        nota = numericas["nota_valor"].astype(np.float32)
+        return TabelaJogos(
+            snapshot.generos,
+            snapshot.plataformas,
+            snapshot.estados,
+            numericas["genero"].astype(np.int32),
+            numericas["plataforma"].astype(np.int32),
+            numericas["estado"].astype(np.int32),
+            numericas["minutos"],
+            nota,
+            numericas["data_ordinal"],
+            numericas["ano"],
+            snapshot.textos["data"].comprimentos() > 0,
+            snapshot.textos["tempo"].comprimentos() > 0,
+        ).agregados()
+
+    def resetar_tudo(self):
+        print("Biblioteca aberta somente para leitura; nada foi apagado.")
@@ -0,0 +1,403 @@
+import json
+import os
+import sqlite3
+from typing import Optional
+from src.constantes import SAVES_DIR
+from src.dados import GerenciadorDados, serializar_jogo
+from src.agregados import ESTADOS_PENDENTES, ESTADOS_GENEROS, novos_agregados
+from src.indice_busca import extrair_termos, normalizar_consulta
+from src.modelo import Jogo
+from src.ordenacao import normalizar_criterios
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS jogos (
+    id INTEGER PRIMARY KEY,
+    titulo TEXT NOT NULL,
+    titulo_busca TEXT NOT NULL,
+    genero TEXT,
+    plataforma TEXT,
+    data_zeramento TEXT,
+    forma TEXT,
+    tempo TEXT,
+    nota REAL,
+    minutos INTEGER NOT NULL DEFAULT 0,
+    data_ordinal INTEGER,
+    ano INTEGER,
+    hidden_gem INTEGER NOT NULL DEFAULT 0,
+    dados TEXT NOT NULL
+);
+DROP INDEX IF EXISTS idx_jogos_titulo;
+CREATE INDEX IF NOT EXISTS idx_jogos_genero ON jogos (genero);
+CREATE INDEX IF NOT EXISTS idx_jogos_plataforma ON jogos (plataforma);
+CREATE INDEX IF NOT EXISTS idx_jogos_forma ON jogos (forma);
+CREATE INDEX IF NOT EXISTS idx_jogos_data ON jogos (data_ordinal);
+CREATE TABLE IF NOT EXISTS termos (
+    termo TEXT NOT NULL,
+    jogo INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_termos_termo ON termos (termo);
+CREATE INDEX IF NOT EXISTS idx_termos_jogo ON termos (jogo);
+CREATE TABLE IF NOT EXISTS tarefas (
+    id INTEGER PRIMARY KEY,
+    dados TEXT NOT NULL
+);
+"""
+
+
+def _colunas(jogo: Jogo) -> tuple:
+    titulo = str(jogo.titulo)
+    return (
+        titulo,
+        titulo.lower(),
+        jogo.genero,
+        jogo.plataforma,
+        jogo.data or "",
+        jogo.estado,
+        jogo.tempo or "",
+        jogo.nota_valor,
+        jogo.minutos,
+        jogo.data_ordinal or None,
+        jogo.ano or None,
+        1 if jogo.hidden_gem else 0,
+        json.dumps(jogo, ensure_ascii=False, default=serializar_jogo),
+    )
+
+
+SQL_INSERIR = """
+INSERT INTO jogos (
+    id, titulo, titulo_busca, genero, plataforma, data_zeramento, forma, tempo,
+    nota, minutos, data_ordinal, ano, hidden_gem, dados
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Busca por prefixo de termo, igual ao IndiceBusca: "zel" acha "The Legend of
+# Zelda". O intervalo [termo, termo + FIM_TERMO) usa o índice de termos.
+FIM_TERMO = "\U0010ffff"
+SQL_TERMO = "id IN (SELECT jogo FROM termos WHERE termo >= ? AND termo < ?)"
+# Sem termo com esse prefixo, procura o trecho dentro do título ("ario" acha
+# "Mario"). Percorre a tabela, mas só quando a busca por termo não achou nada.
+SQL_TRECHO = "instr(normalizar(titulo), ?) > 0"
+
+# Mesmas chaves de valor_ordenacao; minusculas() é o str.lower do Python,
+# que ao contrário do lower() do SQLite também trata acentos.
+COLUNAS_ORDENACAO = {
+    "titulo": "titulo_busca",
+    "genero": "minusculas(genero)",
+    "plataforma": "minusculas(plataforma)",
+    "estado": "minusculas(forma)",
+    "nota": "COALESCE(nota, 0)",
+    "data": "COALESCE(data_ordinal, 0)",
+    "tempo": "minutos",
+}
+# Ordem da lista principal, usada também para desempatar.
+ORDEM_LISTA = "data_ordinal IS NULL, data_ordinal, id"
+
+VERSAO_BANCO = 2
+
+
+class GerenciadorDadosSQLite(GerenciadorDados):
+    def __init__(self, caminho_banco: Optional[str] = None):
+        super().__init__(usar_journal=True)
+        self.arquivo_banco = caminho_banco or os.path.join(SAVES_DIR, "jogos.db")
+
+        self.conexao = sqlite3.connect(self.arquivo_banco)
+        self.conexao.execute("PRAGMA journal_mode=WAL")
+        self.conexao.execute("PRAGMA synchronous=NORMAL")
+        self.conexao.create_function(
+            "minusculas", 1, lambda valor: str(valor).lower(), deterministic=True
+        )
+        self.conexao.create_function(
+            "normalizar", 1, normalizar_consulta, deterministic=True
+        )
+        self.conexao.executescript(ESQUEMA)
+        self._posicoes = None
+        self._chave_posicoes = None
+
+        self._migrar_json()
+
+    def _migrar_json(self):
+        (versao,) = self.conexao.execute("PRAGMA user_version").fetchone()
+        if versao >= VERSAO_BANCO:
+            return
+        if versao:
+            # Bancos da versão 1 ainda não têm a tabela de termos preenchida.
+            with self.conexao:
+                for linha, titulo in self.conexao.execute(
+                    "SELECT id, titulo FROM jogos"
+                ).fetchall():
+                    self._inserir_termos(linha, titulo)
+                self.conexao.execute(f"PRAGMA user_version = {VERSAO_BANCO}")
+            return
+
+        origem = GerenciadorDados()
+        jogos = origem.carregar_jogos()
+        self.erro_carregamento = origem.erro_carregamento
+        if origem.somente_leitura:
+            # Sem cópia do jogos.json ilegível, a migração fica para depois.
+            self.somente_leitura = True
+            return
+        with self.conexao:
+            self._inserir(jogos)
+            self.conexao.executemany(
+                "INSERT INTO tarefas (dados) VALUES (?)",
+                [
+                    (json.dumps(t, ensure_ascii=False),)
+                    for t in origem.carregar_tarefas()
+                ],
+            )
+            self.conexao.execute(f"PRAGMA user_version = {VERSAO_BANCO}")
+
+    def _inserir(self, jogos: list):
+        # A chave da linha é o próprio ID do jogo.
+        for jogo in jogos:
+            cursor = self.conexao.execute(SQL_INSERIR, (jogo.id, *_colunas(jogo)))
+            jogo.id = cursor.lastrowid
+            self._inserir_termos(jogo.id, jogo.titulo)
+
+    def _inserir_termos(self, linha: int, titulo):
+        self.conexao.executemany(
+            "INSERT INTO termos (termo, jogo) VALUES (?, ?)",
+            [(termo, linha) for termo in set(extrair_termos(titulo))],
+        )
+
+    def _excluir_linha(self, linha: int):
+        self.conexao.execute("DELETE FROM termos WHERE jogo = ?", (linha,))
+        self.conexao.execute("DELETE FROM jogos WHERE id = ?", (linha,))
+
+    def carregar_jogos(self, progresso=None) -> list:
+        self._marcar_alteracao("carregar")
+
+        (total,) = self.conexao.execute("SELECT COUNT(*) FROM jogos").fetchone()
+        lista_jogos = []
+        for linha, dados in self.conexao.execute(
+            f"SELECT id, dados FROM jogos ORDER BY {ORDEM_LISTA}"
+        ):
+            jogo = Jogo.de_dict(json.loads(dados))
+            jogo.id = linha
+            lista_jogos.append(jogo)
+            if progresso and len(lista_jogos) % 1000 == 0:
+                progresso(len(lista_jogos), total)
+        self._registrar_ids(lista_jogos)
+        return lista_jogos
+
+    def salvar_jogos(self, lista_jogos: list) -> bool:
+        try:
+            with self.conexao:
+                self.conexao.execute("DELETE FROM termos")
+                self.conexao.execute("DELETE FROM jogos")
+                self._inserir(lista_jogos)
+            return True
+        except sqlite3.Error as e:
+            print(f"Erro ao salvar em {self.arquivo_banco}: {e}")
+            return False
+
+    def registrar_alteracao(self, operacao: str, **dados) -> bool:
+        self._marcar_alteracao(operacao, **dados)
+        try:
+            with self.conexao:
+                if operacao == "adicionar":
+                    self._inserir(dados.get("jogos", []))
+                elif operacao == "remover":
+                    self._excluir_linha(dados["jogo"].id)
+                elif operacao == "editar":
+                    self._excluir_linha(dados["jogo"].id)
+                    self._inserir([dados["novo"]])
+                elif operacao == "hidden_gem":
+                    novo = dados["jogo"].para_dict()
+                    novo["Hidden Gem"] = dados.get("valor", False)
+                    self.conexao.execute(
+                        "UPDATE jogos SET hidden_gem = ?, dados = ? WHERE id = ?",
+                        (
+                            1 if novo["Hidden Gem"] else 0,
+                            json.dumps(novo, ensure_ascii=False),
+                            dados["jogo"].id,
+                        ),
+                    )
+            return True
+        except sqlite3.Error as e:
+            print(f"Erro ao registrar alteração no banco: {e}")
+            return False
+
+    def agendar_jogos(self, lista_jogos: list):
+        pass
+
+    def agendar_tarefas(self, tarefas: list):
+        self.salvar_tarefas(tarefas)
+
+    def filtrar_jogos(
+        self,
+        lista_jogos: list,
+        titulo: str = "",
+        genero: str = "",
+        plataforma: str = "",
+        estado: str = "",
+    ) -> list:
+        condicoes = []
+        parametros = []
+        for coluna, valor in (
+            ("genero", genero),
+            ("plataforma", plataforma),
+            ("forma", estado),
+        ):
+            if valor:
+                condicoes.append(f"{coluna} = ?")
+                parametros.append(valor)
+        trecho = normalizar_consulta(titulo)
+        if not trecho and not condicoes:
+            return list(lista_jogos)
+
+        encontrados = []
+        termos = extrair_termos(titulo)
+        if not trecho:
+            encontrados = self._consultar(condicoes, parametros)
+        elif termos:
+            encontrados = self._consultar(
+                condicoes + [SQL_TERMO] * len(termos),
+                parametros + [v for t in termos for v in (t, t + FIM_TERMO)],
+            )
+        if trecho and not encontrados:
+            encontrados = self._consultar(
+                condicoes + [SQL_TRECHO], parametros + [trecho]
+            )
+
+        # A consulta devolve os jogos; só falta colocá-los na ordem da lista.
+        posicoes = self._posicoes_de(lista_jogos)
+        return sorted(
+            (jogo for jogo in encontrados if jogo in posicoes),
+            key=posicoes.__getitem__,
+        )
+
+    def _consultar(self, condicoes: list, parametros: list) -> list:
+        sql = "SELECT id FROM jogos WHERE " + " AND ".join(condicoes)
+        return [
+            self._por_id[linha]
+            for (linha,) in self.conexao.execute(sql, parametros)
+            if linha in self._por_id
+        ]
+
+    def _posicoes_de(self, lista_jogos: list) -> dict:
+        chave = (id(lista_jogos), len(lista_jogos), self.versao)
+        if self._chave_posicoes != chave:
+            self._posicoes = {jogo: i for i, jogo in enumerate(lista_jogos)}
+            self._chave_posicoes = chave
+        return self._posicoes
+
+    def ordenar_jogos(self, lista_jogos: list, criterios) -> list:
+        criterios = normalizar_criterios(criterios)
+        if not criterios:
+            return list(lista_jogos)
+        self._posicoes = None
+        self._chave_posicoes = None
+
+        ordem = ", ".join(
+            COLUNAS_ORDENACAO[campo] + (" DESC" if decrescente else "")
+            for campo, decrescente in criterios
+        )
+        presentes = set(lista_jogos)
+        ordenados = []
+        for (linha,) in self.conexao.execute(
+            f"SELECT id FROM jogos ORDER BY {ordem}, {ORDEM_LISTA}"
+        ):
+            jogo = self._por_id.get(linha)
+            if jogo in presentes:
+                ordenados.append(jogo)
+        if len(ordenados) != len(lista_jogos):
+            # Jogo fora do banco (gravação que falhou): ordena em memória.
+            return super().ordenar_jogos(lista_jogos, criterios)
+        return ordenados
+
+    def _calcular_agregados(self, lista_jogos: list) -> dict:
+        ag = novos_agregados()
+        sql = self.conexao.execute
+        pendentes = ", ".join("?" * len(ESTADOS_PENDENTES))
+        finalizados = f"COALESCE(forma, '') NOT IN ({pendentes})"
+
+        (ag["total_jogos"],) = sql("SELECT COUNT(*) FROM jogos").fetchone()
+
+        ag["status"] = dict(sql("SELECT forma, COUNT(*) FROM jogos GROUP BY forma"))
+        ag["generos"] = dict(
+            sql(
+                "SELECT genero, COUNT(*) FROM jogos WHERE forma IN "
+                f"({', '.join('?' * len(ESTADOS_GENEROS))}) GROUP BY genero",
+                ESTADOS_GENEROS,
+            )
+        )
+        ag["plataformas"] = dict(
+            sql(
+                f"SELECT plataforma, COUNT(*) FROM jogos WHERE {finalizados} "
+                "GROUP BY plataforma",
+                ESTADOS_PENDENTES,
+            )
+        )
+        ag["notas_plataforma"] = {
+            p: [soma, qtd]
+            for p, soma, qtd in sql(
+                "SELECT plataforma, SUM(nota), COUNT(nota) FROM jogos "
+                f"WHERE {finalizados} AND nota IS NOT NULL GROUP BY plataforma",
+                ESTADOS_PENDENTES,
+            )
+        }
+        ag["minutos_plataforma"] = dict(
+            sql(
+                "SELECT plataforma, SUM(minutos) FROM jogos "
+                f"WHERE {finalizados} AND tempo <> '' GROUP BY plataforma "
+                "HAVING SUM(minutos) <> 0",
+                ESTADOS_PENDENTES,
+            )
+        )
+        ag["histograma_notas"] = dict(
+            sql(
+                "SELECT CAST(nota AS INTEGER), COUNT(*) FROM jogos "
+                f"WHERE {finalizados} AND nota IS NOT NULL GROUP BY 1",
+                ESTADOS_PENDENTES,
+            )
+        )
+
+        for ano, genero, qtd in sql(
+            "SELECT ano, genero, COUNT(*) FROM jogos "
+            "WHERE data_zeramento <> '' AND ano IS NOT NULL GROUP BY ano, genero"
+        ):
+            ag["generos_ano"].setdefault(ano, {})[genero] = qtd
+            ag["jogos_ano"][ano] = ag["jogos_ano"].get(ano, 0) + qtd
+
+        zerados = "data_zeramento <> ''"
+        ag["zerados"], ag["minutos_zerados"] = sql(
+            f"SELECT COUNT(*), COALESCE(SUM(minutos), 0) FROM jogos WHERE {zerados}"
+        ).fetchone()
+        ag["soma_notas_zerados"], ag["qtd_notas_zerados"] = sql(
+            "SELECT COALESCE(SUM(nota), 0), COUNT(nota) FROM jogos "
+            f"WHERE {zerados} AND nota <> 0"
+        ).fetchone()
+        ag["generos_zerados"] = dict(
+            sql(f"SELECT genero, COUNT(*) FROM jogos WHERE {zerados} GROUP BY genero")
+        )
+        return ag
+
+    def carregar_tarefas(self) -> list:
+        return [
+            json.loads(dados)
+            for (dados,) in self.conexao.execute(
+                "SELECT dados FROM tarefas ORDER BY id"
+            )
+        ]
+
+    def salvar_tarefas(self, tarefas: list) -> bool:
+        try:
+            with self.conexao:
+                self.conexao.execute("DELETE FROM tarefas")
+                self.conexao.executemany(
+                    "INSERT INTO tarefas (dados) VALUES (?)",
+                    [(json.dumps(t, ensure_ascii=False),) for t in tarefas],
+                )
+            return True
+        except sqlite3.Error as e:
+            print(f"Erro ao salvar tarefas em {self.arquivo_banco}: {e}")
+            return False
+
+    def resetar_tudo(self):
+        # Só o banco é apagado; o jogos.json que serviu de origem fica.
+        self._marcar_alteracao("resetar")
+        with self.conexao:
+            self.conexao.execute("DELETE FROM termos")
+            self.conexao.execute("DELETE FROM jogos")
+            self.conexao.execute("DELETE FROM tarefas")
@@ -0,0 +1,38 @@
+from src.utils import chave_jogo
+
+
+class IndiceDuplicados:
+    def __init__(self):
+        self.grupos = {}
+        self.total = 0
+
+    @classmethod
+    def de_jogos(cls, lista_jogos: list) -> "IndiceDuplicados":
+        indice = cls()
+        for jogo in lista_jogos:
+            indice.adicionar(jogo)
+        return indice
+
+    def __contains__(self, chave: tuple) -> bool:
+        return chave in self.grupos
+
+    def adicionar(self, jogo):
+        chave = chave_jogo(jogo.titulo, jogo.plataforma)
+        self.grupos.setdefault(chave, {})[jogo] = None
+        self.total += 1
+
+    def remover(self, jogo):
+        chave = chave_jogo(jogo.titulo, jogo.plataforma)
+        grupo = self.grupos.get(chave)
+        if grupo is None or jogo not in grupo:
+            return
+        del grupo[jogo]
+        if not grupo:
+            del self.grupos[chave]
+        self.total -= 1
+
+    def encontrar(self, titulo, plataforma) -> list:
+        return list(self.grupos.get(chave_jogo(titulo, plataforma), ()))
+
+    def repetidos(self) -> list:
+        return [list(grupo) for grupo in self.grupos.values() if len(grupo) > 1]
@@ -1,7 +1,12 @@
-import matplotlib.pyplot as plt
-import numpy as np
-from datetime import datetime
-import re
+GRAFICOS = {
+    "plataformas": "Jogos por Plataforma",
+    "media_notas": "Média de Notas",
+    "tempo": "Tempo Total Jogado",
+    "anos": "Jogos por Ano",
+    "generos": "Gêneros (Pizza)",
+    "generos_ano": "Gêneros por Ano",
+    "notas": "Análise de Notas",
+}
 
 
 class GeradorGraficos:
@@ -22,11 +27,36 @@ class GeradorGraficos:
             "#34495e",
         ]
 
-    def _configurar_estilo(self, titulo, xlabel=None, ylabel=None):
-        fig = plt.gcf()
-        ax = plt.gca()
+        # Artistas do gráfico atual: enquanto as categorias forem as mesmas,
+        # os dados novos só ajustam alturas e textos em vez de redesenhar.
+        self.estrutura = None
+        self._artistas = None
+
+    def desenhar(self, ax, tipo, agregados):
+        if getattr(self, f"_desenhar_{tipo}")(ax, agregados):
+            return True
+        self._limpar(ax)
+        ax.axis("off")
+        ax.text(
+            0.5,
+            0.5,
+            "Sem dados para este gráfico.",
+            ha="center",
+            va="center",
+            color=self.text_color,
+            fontsize=14,
+            transform=ax.transAxes,
+        )
+        return False
+
+    def _limpar(self, ax, estrutura=None):
+        ax.clear()
+        ax.axis("on")
+        ax.set_aspect("auto")
+        self.estrutura = estrutura
+        self._artistas = None
 
-        fig.patch.set_facecolor(self.bg_color)
+    def _configurar_estilo(self, ax, titulo, xlabel=None, ylabel=None):
         ax.set_facecolor(self.plot_bg)
 
         ax.set_title(
@@ -45,44 +75,51 @@ class GeradorGraficos:
 
         ax.grid(True, color=self.grid_color, linestyle="--", alpha=0.3, zorder=0)
 
-        try:
-            mng = plt.get_current_fig_manager()
-            window = mng.window
-            screen_width = window.winfo_screenwidth()
-            screen_height = window.winfo_screenheight()
-            size = fig.get_size_inches()
-            dpi = fig.get_dpi()
-            width = int(size[0] * dpi)
-            height = int(size[1] * dpi)
-            x = int((screen_width / 2) - (width / 2))
-            y = int((screen_height / 2) - (height / 2))
-            window.geometry(f"{width}x{height}+{x}+{y}")
-        except:
-            pass
-
-        plt.tight_layout()
-
-    def criar_distribuicao_plataformas(self, lista_jogos):
-        validos = [
-            j
-            for j in lista_jogos
-            if j.get("Forma de Zeramento") not in ["Planejo Jogar", "Desistência"]
-        ]
-        if not validos:
+    def _legenda(self, ax):
+        return ax.legend(
+            facecolor=self.plot_bg,
+            edgecolor=self.grid_color,
+            labelcolor=self.text_color,
+        )
+
+    def _barras(self, ax, tipo, rotulos, valores, cor, formato, folga, posicoes=None):
+        estrutura = (tipo, tuple(rotulos))
+        if self.estrutura == estrutura:
+            for barra, texto, valor in zip(self._artistas, ax.texts, valores):
+                barra.set_height(valor)
+                texto.set_y(valor + folga)
+                texto.set_text(formato(valor))
+            ax.relim()
+            ax.autoscale_view()
             return False
 
-        contagem = {}
-        for j in validos:
-            p = j["Plataforma"]
-            contagem[p] = contagem.get(p, 0) + 1
+        self._limpar(ax, estrutura)
+        posicoes = list(range(len(rotulos))) if posicoes is None else posicoes
+        self._artistas = ax.bar(
+            posicoes, valores, color=cor, edgecolor=self.plot_bg, zorder=3
+        )
+        for barra, valor in zip(self._artistas, valores):
+            ax.text(
+                barra.get_x() + barra.get_width() / 2.0,
+                valor + folga,
+                formato(valor),
+                ha="center",
+                va="bottom",
+                color=self.text_color,
+                fontweight="bold",
+            )
+        ax.set_xticks(posicoes, rotulos, rotation=45)
+        return True
 
+    def _pizza(self, ax, tipo, contagem, tamanho_rotulos=None, tamanho_pct=10):
         sorted_items = sorted(contagem.items(), key=lambda x: x[1], reverse=True)
-        labels = [f"{p} ({q})" for p, q in sorted_items]
-        values = [q for p, q in sorted_items]
-
-        plt.figure(figsize=(10, 7))
+        labels = [f"{k} ({v})" for k, v in sorted_items]
+        values = [v for k, v in sorted_items]
 
-        wedges, texts, autotexts = plt.pie(
+        # Fatias mudam de ângulo com qualquer alteração, então a pizza é
+        # sempre redesenhada; só o layout é reaproveitado.
+        self._limpar(ax, (tipo, tuple(k for k, v in sorted_items)))
+        wedges, texts, autotexts = ax.pie(
             values,
             labels=labels,
             autopct="%1.1f%%",
@@ -91,83 +128,49 @@ class GeradorGraficos:
             textprops={"color": self.text_color},
             wedgeprops={"edgecolor": self.bg_color, "linewidth": 1},
         )
-
-        plt.setp(autotexts, size=10, weight="bold", color="white")
-        plt.setp(texts, size=11)
-
-        self._configurar_estilo("Jogos Zerados por Plataforma")
-        plt.axis("equal")
-        plt.show()
-        return True
-
-    def criar_media_notas_plataformas(self, lista_jogos):
-        validos = [
-            j
-            for j in lista_jogos
-            if j.get("Forma de Zeramento") not in ["Planejo Jogar", "Desistência"]
-        ]
-        if not validos:
+        for texto in autotexts:
+            texto.set(size=tamanho_pct, weight="bold", color="white")
+        if tamanho_rotulos:
+            for texto in texts:
+                texto.set_size(tamanho_rotulos)
+        ax.axis("equal")
+
+    def _desenhar_plataformas(self, ax, agregados):
+        contagem = agregados["plataformas"]
+        if not contagem:
             return False
 
-        notas_por_plat = {}
-        for j in validos:
-            p = j["Plataforma"]
-            try:
-                n = float(j["Nota"])
-                if p not in notas_por_plat:
-                    notas_por_plat[p] = []
-                notas_por_plat[p].append(n)
-            except (ValueError, TypeError):
-                continue
+        self._pizza(ax, "plataformas", contagem, tamanho_rotulos=11)
+        self._configurar_estilo(ax, "Jogos Zerados por Plataforma")
+        return True
 
+    def _desenhar_media_notas(self, ax, agregados):
+        notas_por_plat = agregados["notas_plataforma"]
         if not notas_por_plat:
             return False
 
-        medias = {p: sum(ns) / len(ns) for p, ns in notas_por_plat.items()}
+        medias = {p: soma / qtd for p, (soma, qtd) in notas_por_plat.items()}
         sorted_items = sorted(medias.items(), key=lambda x: x[1], reverse=True)
         plataformas = [x[0] for x in sorted_items]
         valores = [x[1] for x in sorted_items]
 
-        plt.figure(figsize=(11, 6))
-
-        bars = plt.bar(
-            plataformas, valores, color=self.colors[0], edgecolor=self.plot_bg, zorder=3
-        )
-
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(
-                bar.get_x() + bar.get_width() / 2.0,
-                height + 0.1,
-                f"{height:.2f}",
-                ha="center",
-                va="bottom",
-                color=self.text_color,
-                fontweight="bold",
+        if self._barras(
+            ax,
+            "media_notas",
+            plataformas,
+            valores,
+            self.colors[0],
+            lambda v: f"{v:.2f}",
+            0.1,
+        ):
+            self._configurar_estilo(
+                ax, "Média de Notas por Plataforma", ylabel="Nota Média"
             )
-
-        self._configurar_estilo("Média de Notas por Plataforma", ylabel="Nota Média")
-        plt.xticks(rotation=45)
-        plt.ylim(0, 11)
-        plt.show()
+        ax.set_ylim(0, 11)
         return True
 
-    def criar_tempo_total_plataformas(self, lista_jogos):
-        validos = [
-            j
-            for j in lista_jogos
-            if j.get("Forma de Zeramento") not in ["Planejo Jogar", "Desistência"]
-        ]
-        tempo_por_plat = {}
-
-        for j in validos:
-            p = j["Plataforma"]
-            t = j.get("Tempo Jogado", "")
-            if re.match(r"^\d+:\d{2}$", t):
-                h, m = map(int, t.split(":"))
-                tempo_total = h * 60 + m
-                tempo_por_plat[p] = tempo_por_plat.get(p, 0) + tempo_total
-
+    def _desenhar_tempo(self, ax, agregados):
+        tempo_por_plat = agregados["minutos_plataforma"]
         if not tempo_por_plat:
             return False
 
@@ -175,195 +178,124 @@ class GeradorGraficos:
         plataformas = [x[0] for x in sorted_items]
         horas = [x[1] // 60 for x in sorted_items]
 
-        plt.figure(figsize=(11, 6))
-
-        bars = plt.bar(
-            plataformas, horas, color=self.colors[1], edgecolor=self.plot_bg, zorder=3
-        )
-
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(
-                bar.get_x() + bar.get_width() / 2.0,
-                height + (max(horas) * 0.01),
-                f"{height}h",
-                ha="center",
-                va="bottom",
-                color=self.text_color,
-                fontweight="bold",
+        if self._barras(
+            ax,
+            "tempo",
+            plataformas,
+            horas,
+            self.colors[1],
+            lambda v: f"{int(v)}h",
+            max(horas) * 0.01,
+        ):
+            self._configurar_estilo(
+                ax, "Tempo Total (Horas) por Plataforma", ylabel="Horas"
             )
-
-        self._configurar_estilo("Tempo Total (Horas) por Plataforma", ylabel="Horas")
-        plt.xticks(rotation=45)
-        plt.show()
         return True
 
-    def criar_grafico_jogos_por_ano(self, lista_jogos):
-        jogos_por_ano = {}
-        for j in lista_jogos:
-            try:
-                ano = datetime.strptime(j["Data de Zeramento"], "%d/%m/%Y").year
-                jogos_por_ano[ano] = jogos_por_ano.get(ano, 0) + 1
-            except ValueError:
-                continue
-
+    def _desenhar_anos(self, ax, agregados):
+        jogos_por_ano = agregados["jogos_ano"]
         if not jogos_por_ano:
             return False
 
         anos = sorted(jogos_por_ano.keys())
         qtd = [jogos_por_ano[a] for a in anos]
 
-        plt.figure(figsize=(10, 6))
-
-        bars = plt.bar(
-            anos, qtd, color=self.colors[5], edgecolor=self.plot_bg, zorder=3
-        )
-
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(
-                bar.get_x() + bar.get_width() / 2.0,
-                height + 0.1,
-                f"{int(height)}",
-                ha="center",
-                va="bottom",
-                color=self.text_color,
-                fontweight="bold",
+        if self._barras(
+            ax,
+            "anos",
+            anos,
+            qtd,
+            self.colors[5],
+            lambda v: f"{int(v)}",
+            0.1,
+            posicoes=anos,
+        ):
+            self._configurar_estilo(
+                ax, "Jogos Zerados por Ano", xlabel="Ano", ylabel="Quantidade"
             )
-
-        self._configurar_estilo(
-            "Jogos Zerados por Ano", xlabel="Ano", ylabel="Quantidade"
-        )
-        plt.xticks(anos, rotation=45)
-        plt.show()
         return True
 
-    def criar_grafico_comparativo_generos(self, lista_jogos):
-        dados = {}
-        zerados = [j for j in lista_jogos if j.get("Data de Zeramento")]
-
-        for j in zerados:
-            try:
-                ano = datetime.strptime(j["Data de Zeramento"], "%d/%m/%Y").year
-                gen = j["Gênero"]
-                if ano not in dados:
-                    dados[ano] = {}
-                dados[ano][gen] = dados[ano].get(gen, 0) + 1
-            except ValueError:
-                continue
-
+    def _desenhar_generos_ano(self, ax, agregados):
+        dados = agregados["generos_ano"]
         if not dados:
             return False
 
         anos = sorted(dados.keys())
         generos = sorted(set(g for d in dados.values() for g in d))
-
-        plt.figure(figsize=(11, 6))
-
-        for i, g in enumerate(generos):
-            valores = [dados.get(a, {}).get(g, 0) for a in anos]
+        series = [[dados.get(a, {}).get(g, 0) for a in anos] for g in generos]
+
+        estrutura = ("generos_ano", tuple(anos), tuple(generos))
+        if self.estrutura == estrutura:
+            for linha, valores in zip(self._artistas, series):
+                linha.set_ydata(valores)
+            ax.relim()
+            ax.autoscale_view()
+            return True
+
+        self._limpar(ax, estrutura)
+        self._artistas = []
+        for i, (g, valores) in enumerate(zip(generos, series)):
             color = self.colors[i % len(self.colors)]
-            plt.plot(
+            (linha,) = ax.plot(
                 anos, valores, marker="o", label=g, color=color, linewidth=2, zorder=3
             )
+            self._artistas.append(linha)
 
-        plt.legend(
-            facecolor=self.plot_bg,
-            edgecolor=self.grid_color,
-            labelcolor=self.text_color,
-        )
+        self._legenda(ax)
         self._configurar_estilo(
-            "Comparação de Gêneros por Ano", xlabel="Ano", ylabel="Quantidade"
+            ax, "Comparação de Gêneros por Ano", xlabel="Ano", ylabel="Quantidade"
         )
-        plt.xticks(anos)
-        plt.show()
+        ax.set_xticks(anos)
         return True
 
-    def criar_analise_de_notas(self, lista_jogos):
-        validos = [
-            j
-            for j in lista_jogos
-            if j.get("Forma de Zeramento") not in ["Planejo Jogar", "Desistência"]
-        ]
-        notas = []
-        for j in validos:
-            try:
-                notas.append(int(float(j["Nota"])))
-            except (ValueError, TypeError):
-                pass
-
-        if not notas:
+    def _desenhar_notas(self, ax, agregados):
+        histograma = agregados["histograma_notas"]
+        if not histograma or not sum(histograma.values()):
             return False
 
-        contagem = {i: notas.count(i) for i in range(1, 11)}
-        media = np.mean(notas)
-
-        plt.figure(figsize=(10, 6))
-
-        plt.bar(
-            contagem.keys(),
-            contagem.values(),
+        valores = [histograma.get(i, 0) for i in range(1, 11)]
+        media = sum(n * q for n, q in histograma.items()) / sum(histograma.values())
+        rotulo = f"Média Geral: {media:.2f}"
+
+        if self.estrutura == ("notas",):
+            barras, linha, legenda = self._artistas
+            for barra, valor in zip(barras, valores):
+                barra.set_height(valor)
+            linha.set_ydata([media, media])
+            legenda.get_texts()[0].set_text(rotulo)
+            ax.relim()
+            ax.autoscale_view()
+            return True
+
+        self._limpar(ax, ("notas",))
+        barras = ax.bar(
+            range(1, 11),
+            valores,
             color=self.colors[0],
             edgecolor=self.plot_bg,
             zorder=3,
             alpha=0.8,
         )
-
-        plt.axhline(
+        linha = ax.axhline(
             y=media,
             color=self.colors[2],
             linestyle="--",
             linewidth=2,
-            label=f"Média Geral: {media:.2f}",
+            label=rotulo,
             zorder=4,
         )
-
-        plt.legend(
-            facecolor=self.plot_bg,
-            edgecolor=self.grid_color,
-            labelcolor=self.text_color,
-        )
+        self._artistas = (barras, linha, self._legenda(ax))
         self._configurar_estilo(
-            "Distribuição de Notas", xlabel="Nota", ylabel="Quantidade de Jogos"
+            ax, "Distribuição de Notas", xlabel="Nota", ylabel="Quantidade de Jogos"
         )
-        plt.xticks(range(1, 11))
-        plt.show()
+        ax.set_xticks(range(1, 11))
         return True
 
-    def criar_grafico_generos(self, lista_jogos):
-        validos = [
-            j
-            for j in lista_jogos
-            if j.get("Forma de Zeramento")
-            in ["História", "100%", "Platina", "Desistência"]
-        ]
-        if not validos:
+    def _desenhar_generos(self, ax, agregados):
+        contagem = agregados["generos"]
+        if not contagem:
             return False
 
-        contagem = {}
-        for j in validos:
-            gen = j["Gênero"]
-            contagem[gen] = contagem.get(gen, 0) + 1
-
-        sorted_items = sorted(contagem.items(), key=lambda x: x[1], reverse=True)
-        labels = [f"{k} ({v})" for k, v in sorted_items]
-        values = [v for k, v in sorted_items]
-
-        plt.figure(figsize=(10, 8))
-
-        wedges, texts, autotexts = plt.pie(
-            values,
-            labels=labels,
-            autopct="%1.1f%%",
-            startangle=140,
-            colors=self.colors[: len(values)],
-            textprops={"color": self.text_color},
-            wedgeprops={"edgecolor": self.bg_color, "linewidth": 1},
-        )
-
-        plt.setp(autotexts, size=9, weight="bold", color="white")
-
-        self._configurar_estilo("Distribuição de Gêneros")
-        plt.axis("equal")
-        plt.show()
+        self._pizza(ax, "generos", contagem, tamanho_pct=9)
+        self._configurar_estilo(ax, "Distribuição de Gêneros")
         return True
@@ -1,81 +1,112 @@
+import multiprocessing
 import os
+import shutil
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 import openpyxl
-import pandas as pd
 from openpyxl.styles import NamedStyle, Alignment, PatternFill, Font
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils import get_column_letter
 from reportlab.lib.pagesizes import letter, landscape
 from reportlab.lib import colors
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Spacer, Paragraph
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.pdfbase import pdfmetrics
 
 from src.constantes import FONT_PATH
 
+try:
+    from pypdf import PdfWriter
+except ImportError:
+    PdfWriter = None
 
-class Exportador:
-    @staticmethod
-    def exportar_pdf(lista_jogos, caminho_arquivo):
-        if not lista_jogos:
-            return False
+LINHAS_POR_TABELA = 40
+MINIMO_EXPORTACAO_PARALELA = 20000
+LINHAS_POR_PARTE = 2000
 
-        doc = SimpleDocTemplate(caminho_arquivo, pagesize=landscape(letter))
-        elements = []
-        width, height = landscape(letter)
-        margin = 0.5 * inch
-        effective_width = width - 2 * margin
+CABECALHO_PDF = [
+    "Título",
+    "Gênero",
+    "Plataforma",
+    "Data",
+    "Estado",
+    "Descrição",
+    "Tempo",
+    "Nota",
+]
 
-        data = [
-            [
-                "Título",
-                "Gênero",
-                "Plataforma",
-                "Data",
-                "Estado",
-                "Descrição",
-                "Tempo",
-                "Nota",
-            ]
-        ]
 
-        for jogo in lista_jogos:
-            nota = (
-                ""
-                if jogo["Forma de Zeramento"] in ["Planejo Jogar", "Desistência"]
-                else str(jogo["Nota"])
-            )
-            data.append(
-                [
-                    str(jogo["Título"]),
-                    str(jogo["Gênero"]),
-                    str(jogo["Plataforma"]),
-                    str(jogo["Data de Zeramento"]),
-                    str(jogo["Forma de Zeramento"]),
-                    str(jogo["Descrição de Zeramento"]),
-                    str(jogo["Tempo Jogado"]),
-                    nota,
-                ]
-            )
+class ExportacaoCancelada(Exception):
+    pass
 
-        if os.path.exists(FONT_PATH):
-            pdfmetrics.registerFont(TTFont("Mplus1p", FONT_PATH))
-            font_name = "Mplus1p"
-        else:
-            font_name = "Helvetica"
 
-        styles = getSampleStyleSheet()
-        cell_style = ParagraphStyle(
-            name="TableCell", alignment=1, leading=12, fontName=font_name
-        )
+class _DocumentoExportacao(SimpleDocTemplate):
+    def __init__(self, caminho_arquivo, progresso=None, cancelado=None, **kwargs):
+        super().__init__(caminho_arquivo, **kwargs)
+        self.progresso = progresso
+        self.cancelado = cancelado
+        self.total = 0
+        self.diagramadas = 0
+
+    def afterFlowable(self, flowable):
+        if isinstance(flowable, Table):
+            # Partes de uma tabela dividida entre páginas repetem o cabeçalho.
+            self.diagramadas += flowable._nrows - 1
+            if self.progresso:
+                self.progresso(min(self.diagramadas, self.total), self.total)
+        if self.cancelado and self.cancelado():
+            raise ExportacaoCancelada()
+
+
+def _linha_pdf(jogo) -> list:
+    nota = (
+        ""
+        if jogo["Forma de Zeramento"] in ["Planejo Jogar", "Desistência"]
+        else str(jogo["Nota"])
+    )
+    return [
+        str(jogo["Título"]),
+        str(jogo["Gênero"]),
+        str(jogo["Plataforma"]),
+        str(jogo["Data de Zeramento"]),
+        str(jogo["Forma de Zeramento"]),
+        str(jogo["Descrição de Zeramento"]),
+        str(jogo["Tempo Jogado"]),
+        nota,
+    ]
+
+
+def _fonte_pdf() -> str:
+    if os.path.exists(FONT_PATH):
+        pdfmetrics.registerFont(TTFont("Mplus1p", FONT_PATH))
+        return "Mplus1p"
+    return "Helvetica"
 
-        table_data = []
-        for row in data:
-            table_row = [Paragraph(cell, cell_style) for cell in row]
-            table_data.append(table_row)
 
-        col_widths = [effective_width / 8] * 8
-        table = Table(table_data, colWidths=col_widths)
+def _tabelas_pdf(linhas: list, font_name: str) -> list:
+    width, height = landscape(letter)
+    margin = 0.5 * inch
+    effective_width = width - 2 * margin
+
+    cell_style = ParagraphStyle(
+        name="TableCell", alignment=1, leading=12, fontName=font_name
+    )
+    cabecalho = [Paragraph(cell, cell_style) for cell in CABECALHO_PDF]
+    col_widths = [effective_width / 8] * 8
+
+    # Tabelas curtas com cabeçalho repetido: o ReportLab diagrama cada uma
+    # de forma independente em vez de re-dividir uma tabela gigante.
+    elements = []
+    for inicio in range(0, len(linhas), LINHAS_POR_TABELA):
+        bloco = linhas[inicio : inicio + LINHAS_POR_TABELA]
+
+        table_data = [cabecalho]
+        for row in bloco:
+            table_data.append([Paragraph(cell, cell_style) for cell in row])
+
+        table = Table(table_data, colWidths=col_widths, repeatRows=1)
 
         style = TableStyle(
             [
@@ -88,8 +119,8 @@ class Exportador:
             ]
         )
 
-        for i in range(1, len(data)):
-            estado = data[i][4]
+        for i, row in enumerate(bloco, 1):
+            estado = row[4]
             if estado == "Planejo Jogar":
                 style.add("BACKGROUND", (0, i), (-1, i), colors.beige)
             elif estado == "Desistência":
@@ -97,19 +128,133 @@ class Exportador:
 
         table.setStyle(style)
         elements.append(table)
+    return elements
+
+
+# Sinal de cancelamento compartilhado com os processos que diagramam as partes.
+_cancelamento = None
+
+
+def _iniciar_processo(evento):
+    global _cancelamento
+    _cancelamento = evento
+
+
+def _renderizar_parte(linhas: list, caminho_arquivo: str) -> int:
+    cancelado = _cancelamento.is_set if _cancelamento is not None else None
+    doc = _DocumentoExportacao(
+        caminho_arquivo, cancelado=cancelado, pagesize=landscape(letter)
+    )
+    try:
+        doc.build(_tabelas_pdf(linhas, _fonte_pdf()))
+    except ExportacaoCancelada:
+        return 0
+    return len(linhas)
+
+
+def _exportar_pdf_paralelo(linhas, caminho_arquivo, progresso, cancelado) -> bool:
+    processos = os.cpu_count() or 1
+    # Cada parte começa numa página nova, então cada divisão pode deixar uma
+    # página incompleta a mais que a exportação serial (nenhuma linha se
+    # perde). Partes grandes mantêm isso em uma página a cada ~50.
+    tamanho_parte = max(
+        LINHAS_POR_PARTE,
+        -(-len(linhas) // (processos * 4) // LINHAS_POR_TABELA) * LINHAS_POR_TABELA,
+    )
+    pasta = tempfile.mkdtemp(prefix="exportacao_")
+    partes = []
+    contexto = multiprocessing.get_context("spawn")
+    evento = contexto.Event()
+    executor = ProcessPoolExecutor(
+        max_workers=processos,
+        mp_context=contexto,
+        initializer=_iniciar_processo,
+        initargs=(evento,),
+    )
+    try:
+        pendentes = set()
+        for n, inicio in enumerate(range(0, len(linhas), tamanho_parte)):
+            parte = os.path.join(pasta, f"parte_{n:05d}.pdf")
+            partes.append(parte)
+            pendentes.add(
+                executor.submit(
+                    _renderizar_parte, linhas[inicio : inicio + tamanho_parte], parte
+                )
+            )
+
+        prontas = 0
+        while pendentes:
+            # Espera curta para o cancelamento não depender do fim de uma parte.
+            concluidas, pendentes = wait(
+                pendentes, timeout=0.2, return_when=FIRST_COMPLETED
+            )
+            for futuro in concluidas:
+                prontas += futuro.result()
+            if cancelado and cancelado():
+                evento.set()
+                for futuro in pendentes:
+                    futuro.cancel()
+                return False
+            if concluidas and progresso:
+                progresso(prontas, len(linhas))
+
+        writer = PdfWriter()
+        for parte in partes:
+            writer.append(parte)
+        with open(caminho_arquivo, "wb") as arquivo:
+            writer.write(arquivo)
+        return True
+    except Exception as e:
+        print(f"Erro PDF: {e}")
+        return False
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        shutil.rmtree(pasta, ignore_errors=True)
+
+
+class Exportador:
+    @staticmethod
+    def exportar_pdf(lista_jogos, caminho_arquivo, progresso=None, cancelado=None):
+        if not lista_jogos:
+            return False
+
+        linhas = [_linha_pdf(jogo) for jogo in lista_jogos]
+
+        if (
+            PdfWriter is not None
+            and len(linhas) >= MINIMO_EXPORTACAO_PARALELA
+            and (os.cpu_count() or 1) > 1
+        ):
+            return _exportar_pdf_paralelo(linhas, caminho_arquivo, progresso, cancelado)
+
+        doc = _DocumentoExportacao(
+            caminho_arquivo,
+            progresso=progresso,
+            cancelado=cancelado,
+            pagesize=landscape(letter),
+        )
+        doc.total = len(linhas)
+        elements = _tabelas_pdf(linhas, _fonte_pdf())
+        if cancelado and cancelado():
+            return False
 
         try:
             doc.build(elements)
             return True
+        except ExportacaoCancelada:
+            if os.path.exists(caminho_arquivo):
+                os.remove(caminho_arquivo)
+            return False
         except Exception as e:
             print(f"Erro PDF: {e}")
             return False
 
     @staticmethod
-    def exportar_excel(lista_jogos, caminho_arquivo):
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Lista de Jogos"
+    def exportar_excel(lista_jogos, caminho_arquivo, progresso=None, cancelado=None):
+        # Planilha em modo somente escrita: as linhas vão direto para o disco e
+        # cada célula só aponta para um dos estilos nomeados.
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Lista de Jogos")
 
         headers = [
             "Título",
@@ -122,65 +267,84 @@ class Exportador:
             "Nota",
         ]
 
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(
-            start_color="333333", end_color="333333", fill_type="solid"
-        )
+        centro = Alignment(horizontal="center")
+        estilos = {
+            "cabecalho": NamedStyle(
+                name="cabecalho",
+                font=Font(bold=True, color="FFFFFF"),
+                fill=PatternFill(
+                    start_color="333333", end_color="333333", fill_type="solid"
+                ),
+                alignment=centro,
+            ),
+            "jogo": NamedStyle(name="jogo", alignment=centro),
+            "Planejo Jogar": NamedStyle(
+                name="jogo_planejo",
+                fill=PatternFill(
+                    start_color="FFF2CC", end_color="FFF2CC", fill_type="solid"
+                ),
+                alignment=centro,
+            ),
+            "Desistência": NamedStyle(
+                name="jogo_desistencia",
+                fill=PatternFill(
+                    start_color="F4CCCC", end_color="F4CCCC", fill_type="solid"
+                ),
+                alignment=centro,
+            ),
+        }
+        for estilo in estilos.values():
+            wb.add_named_style(estilo)
 
-        for col, title in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=title)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center")
+        for col in range(1, len(headers) + 1):
+            ws.column_dimensions[get_column_letter(col)].width = 20
 
-        fill_planejo = PatternFill(
-            start_color="FFF2CC", end_color="FFF2CC", fill_type="solid"
-        )
-        fill_desistencia = PatternFill(
-            start_color="F4CCCC", end_color="F4CCCC", fill_type="solid"
-        )
+        # A planilha serializa cada linha no append, então um conjunto de
+        # células por estilo pode ser reaproveitado em todas as linhas.
+        modelos = {}
+        for estilo in estilos.values():
+            modelos[estilo.name] = []
+            for _ in headers:
+                cell = WriteOnlyCell(ws)
+                cell.style = estilo.name
+                modelos[estilo.name].append(cell)
+
+        def linha(valores, estilo):
+            celulas = modelos[estilo]
+            for cell, valor in zip(celulas, valores):
+                cell.value = valor
+            return celulas
 
+        ws.append(linha(headers, "cabecalho"))
+
+        total = len(lista_jogos)
         for row_idx, jogo in enumerate(lista_jogos, 2):
+            if row_idx % 500 == 0:
+                if cancelado and cancelado():
+                    return False
+                if progresso:
+                    progresso(row_idx - 1, total)
+            forma = jogo["Forma de Zeramento"]
+            pendente = forma in ["Planejo Jogar", "Desistência"]
             valores = [
                 jogo["Título"],
                 jogo["Gênero"],
                 jogo["Plataforma"],
                 jogo["Data de Zeramento"],
-                jogo["Forma de Zeramento"],
+                forma,
                 jogo["Descrição de Zeramento"],
                 jogo.get("Tempo Jogado", ""),
-                jogo["Nota"],
+                "" if pendente else jogo["Nota"],
             ]
+            ws.append(linha(valores, estilos[forma].name if pendente else "jogo"))
 
-            if jogo["Forma de Zeramento"] in ["Planejo Jogar", "Desistência"]:
-                valores[7] = ""
-
-            for col_idx, valor in enumerate(valores, 1):
-                cell = ws.cell(row=row_idx, column=col_idx, value=valor)
-                cell.alignment = Alignment(horizontal="center")
-
-                if jogo["Forma de Zeramento"] == "Planejo Jogar":
-                    cell.fill = fill_planejo
-                elif jogo["Forma de Zeramento"] == "Desistência":
-                    cell.fill = fill_desistencia
-
-        for col in ws.columns:
-            column = get_column_letter(col[0].column)
-            ws.column_dimensions[column].width = 20
-
+        if cancelado and cancelado():
+            return False
         try:
             wb.save(caminho_arquivo)
+            if progresso:
+                progresso(total, total)
             return True
         except Exception as e:
             print(f"Erro Excel: {e}")
             return False
-
-    @staticmethod
-    def importar_excel(caminho_arquivo):
-        try:
-            df = pd.read_excel(caminho_arquivo)
-            df = df.fillna("")
-            return df.to_dict(orient="records")
-        except Exception as e:
-            print(f"Erro Importação: {e}")
-            return []
@@ -0,0 +1,95 @@
+import json
+import os
+from typing import Optional
+from PIL import Image
+from PIL.PngImagePlugin import PngInfo
+from src.constantes import BACKGROUND_PATH, FUNDO_CACHE_PATH, WALLPAPER_PATH
+
+
+def _redimensionar(imagem: Image.Image, dims: tuple) -> Image.Image:
+    # JPEGs são decodificados já reduzidos (1/2, 1/4, 1/8) e o resto passa por
+    # uma redução inteira antes do LANCZOS, que então trabalha numa imagem pequena.
+    imagem.draft("RGB", dims)
+    if imagem.mode not in ("RGB", "RGBA"):
+        imagem = imagem.convert("RGBA")
+    fator = min(imagem.width // dims[0], imagem.height // dims[1])
+    if fator >= 2:
+        imagem = imagem.reduce(fator)
+    return imagem.resize(dims, Image.LANCZOS)
+
+
+def abrir_previa(caminho: str, largura_max: int, altura_max: int) -> Image.Image:
+    with Image.open(caminho) as imagem:
+        fator = min(largura_max / imagem.width, altura_max / imagem.height)
+        dims = (max(1, int(imagem.width * fator)), max(1, int(imagem.height * fator)))
+        return _redimensionar(imagem, dims)
+
+
+def gerar_wallpaper(
+    caminho: str, previa: Optional[Image.Image] = None, tamanho: tuple = (600, 400)
+):
+    if (
+        previa is not None
+        and previa.width >= tamanho[0]
+        and previa.height >= tamanho[1]
+    ):
+        final = previa.resize(tamanho, Image.LANCZOS)
+    else:
+        with Image.open(caminho) as imagem:
+            final = _redimensionar(imagem, tamanho)
+
+    os.makedirs(os.path.dirname(WALLPAPER_PATH), exist_ok=True)
+    temporario = f"{WALLPAPER_PATH}.tmp"
+    final.save(temporario, "PNG")
+    os.replace(temporario, WALLPAPER_PATH)
+
+
+def assinatura_fundo(tamanho: tuple) -> Optional[str]:
+    partes = [list(tamanho)]
+    for caminho in (WALLPAPER_PATH, BACKGROUND_PATH):
+        try:
+            info = os.stat(caminho)
+        except FileNotFoundError:
+            return None
+        partes.append([os.path.basename(caminho), info.st_size, info.st_mtime_ns])
+    return json.dumps(partes)
+
+
+def carregar_fundo_em_cache(tamanho: tuple) -> Optional[Image.Image]:
+    assinatura = assinatura_fundo(tamanho)
+    if assinatura is None:
+        return None
+    try:
+        with Image.open(FUNDO_CACHE_PATH) as imagem:
+            if imagem.info.get("assinatura") != assinatura:
+                return None
+            imagem.load()
+            return imagem.copy()
+    except (OSError, ValueError):
+        return None
+
+
+def compor_fundo(tamanho: tuple) -> Image.Image:
+    assinatura = assinatura_fundo(tamanho)
+
+    wall = Image.open(WALLPAPER_PATH).convert("RGBA")
+    bg = Image.open(BACKGROUND_PATH).convert("RGBA")
+
+    wall = wall.resize(tamanho, Image.LANCZOS)
+    bg = bg.resize(tamanho, Image.LANCZOS)
+
+    final = Image.alpha_composite(wall, bg)
+
+    if assinatura is not None:
+        metadados = PngInfo()
+        metadados.add_text("assinatura", assinatura)
+        temporario = f"{FUNDO_CACHE_PATH}.tmp"
+        try:
+            os.makedirs(os.path.dirname(FUNDO_CACHE_PATH), exist_ok=True)
+            final.save(temporario, "PNG", pnginfo=metadados, compress_level=1)
+            os.replace(temporario, FUNDO_CACHE_PATH)
+        except OSError as e:
+            print(f"Erro ao salvar o fundo em cache: {e}")
+            if os.path.exists(temporario):
+                os.remove(temporario)
+    return final
@@ -4,9 +4,11 @@ import webbrowser
 import urllib.parse
 import re
 import pyperclip
-from PIL import Image, ImageTk
+from PIL import ImageTk
 import os
+import queue
 import sys
+import threading
 from datetime import datetime
 
 from src.constantes import (
@@ -17,19 +19,29 @@ from src.constantes import (
     GENEROS,
     PLATAFORMAS,
 )
-from src.utils import centralizar_janela, validar_campos, calcular_total_minutos
-from src.dados import GerenciadorDados
-from src.estatisticas import GeradorGraficos
-from src.exportacao import Exportador
-from src.gui.componentes import estilizar_botao, CalendarioPicker
+from src.utils import (
+    centralizar_janela,
+    validar_campos,
+    calcular_total_minutos,
+    normalizar_texto,
+)
+from src.dados import criar_gerenciador_dados, ordenar_por_data
+from src.estatisticas import GRAFICOS, GeradorGraficos
+from src.fundo import carregar_fundo_em_cache, compor_fundo
+from src.modelo import Jogo
+from src.ordenacao import normalizar_criterios
+from src.gui.componentes import estilizar_botao, CalendarioPicker, ListaVirtual
 from src.gui.janelas import (
     JanelaChecklist,
     JanelaResumo,
+    JanelaGraficos,
     JanelaWallpaper,
     JanelaSeletorGenero,
     JanelaSeletorPlataforma,
     JanelaDetalhes,
     JanelaEditorDescricao,
+    JanelaProgresso,
+    JanelaOrdenacao,
 )
 
 # Definição da Escala estilo MyAnimeList
@@ -57,11 +69,18 @@ class App:
         self.root.geometry(f"{self.LARGURA}x{self.ALTURA}")
         self.root.resizable(False, False)
 
-        self.dados = GerenciadorDados()
-        self.estatisticas = GeradorGraficos()
+        self.dados = criar_gerenciador_dados()
+        self._estatisticas = None
+        self._janela_graficos = None
 
-        self.lista_jogos = self.dados.carregar_jogos()
+        self.lista_jogos = self._carregar_com_progresso()
         self.jogos_visualizados = self.lista_jogos.copy()
+        if self.dados.erro_carregamento:
+            messagebox.showerror("Erro", self.dados.erro_carregamento)
+        if self.dados.somente_leitura:
+            self.root.title("Registro ULTIMATE de Jogos (somente leitura)")
+        if self.dados.ids_migrados:
+            self.dados.agendar_jogos(self.lista_jogos)
 
         self._inicializar_variaveis()
         self._carregar_assets()
@@ -71,6 +90,20 @@ class App:
         self.atualizar_lista_visual()
         self.root.protocol("WM_DELETE_WINDOW", self.ao_fechar)
 
+    def _carregar_com_progresso(self):
+        barra = ttk.Progressbar(self.root, length=300, maximum=100)
+        barra.place(relx=0.5, rely=0.5, anchor="center")
+
+        def progresso(lidos, total):
+            if total:
+                barra["value"] = 100 * lidos / total
+                self.root.update_idletasks()
+
+        try:
+            return self.dados.carregar_jogos(progresso)
+        finally:
+            barra.destroy()
+
     def _inicializar_variaveis(self):
         self.var_titulo = tk.StringVar()
         self.var_genero = tk.StringVar()
@@ -84,7 +117,13 @@ class App:
         self.var_minutos = tk.StringVar(value="00")
 
         self.var_nota = tk.StringVar()
+        self.id_em_edicao = None
+        self.ordenacao = None
+        self._geracao_fundo = 0
         self.var_busca = tk.StringVar()
+        self.var_busca.trace_add("write", self._agendar_busca)
+        self._busca_agendada = None
+        self._resultado_busca = None
 
     def _carregar_assets(self):
         try:
@@ -96,27 +135,49 @@ class App:
 
     def atualizar_fundo(self):
         if os.path.exists(WALLPAPER_PATH) and os.path.exists(BACKGROUND_PATH):
-            try:
-                largura_alvo = self.LARGURA
-                altura_alvo = self.ALTURA
-
-                wall = Image.open(WALLPAPER_PATH).convert("RGBA")
-                bg = Image.open(BACKGROUND_PATH).convert("RGBA")
+            tamanho = (self.LARGURA, self.ALTURA)
+            self._geracao_fundo += 1
+
+            imagem = carregar_fundo_em_cache(tamanho)
+            if imagem is not None:
+                self._aplicar_fundo(imagem)
+                return
+
+            # Sem cache válido: a composição roda fora da thread do Tk.
+            fila = queue.Queue()
+            threading.Thread(
+                target=self._compor_fundo, args=(tamanho, fila), daemon=True
+            ).start()
+            self._aguardar_fundo(fila, self._geracao_fundo)
+
+    def _compor_fundo(self, tamanho, fila):
+        try:
+            fila.put(compor_fundo(tamanho))
+        except Exception as e:
+            print(f"Erro ao compor o fundo: {e}")
+            fila.put(None)
 
-                wall = wall.resize((largura_alvo, altura_alvo), Image.LANCZOS)
-                bg = bg.resize((largura_alvo, altura_alvo), Image.LANCZOS)
+    def _aguardar_fundo(self, fila, geracao):
+        try:
+            imagem = fila.get_nowait()
+        except queue.Empty:
+            self.root.after(30, self._aguardar_fundo, fila, geracao)
+            return
+        if imagem is not None and geracao == self._geracao_fundo:
+            self._aplicar_fundo(imagem)
 
-                final = Image.alpha_composite(wall, bg)
-                self.bg_tk = ImageTk.PhotoImage(final)
+    def _aplicar_fundo(self, imagem):
+        try:
+            self.bg_tk = ImageTk.PhotoImage(imagem)
 
-                if hasattr(self, "lbl_fundo"):
-                    self.lbl_fundo.destroy()
+            if hasattr(self, "lbl_fundo"):
+                self.lbl_fundo.destroy()
 
-                self.lbl_fundo = tk.Label(self.root, image=self.bg_tk)
-                self.lbl_fundo.place(x=0, y=0, relwidth=1, relheight=1)
-                self.lbl_fundo.lower()
-            except Exception:
-                pass
+            self.lbl_fundo = tk.Label(self.root, image=self.bg_tk)
+            self.lbl_fundo.place(x=0, y=0, relwidth=1, relheight=1)
+            self.lbl_fundo.lower()
+        except Exception:
+            pass
 
     def _criar_menu(self):
         menu_bar = Menu(self.root)
@@ -130,7 +191,7 @@ class App:
         file_menu.add_command(
             label="Exportar Excel", command=lambda: self._exportar("excel")
         )
-        file_menu.add_command(label="Importar Excel", command=self._importar_excel)
+        file_menu.add_command(label="Importar Excel/CSV", command=self._importar_excel)
         file_menu.add_separator()
         file_menu.add_command(
             label="Alterar Wallpaper",
@@ -145,48 +206,55 @@ class App:
         filter_menu.add_command(
             label="Busca Avançada", command=self._abrir_janela_filtro
         )
-        filter_menu.add_command(label="Limpar Filtros", command=self._limpar_filtros)
+        filter_menu.add_command(label="Limpar Filtros", command=self._limpar_busca)
+        filter_menu.add_command(
+            label="Jogos Repetidos", command=self._mostrar_duplicados
+        )
 
         info_menu = Menu(menu_bar, tearoff=0)
         menu_bar.add_cascade(label="Informações", menu=info_menu)
-        info_menu.add_command(
-            label="Jogos por Plataforma",
-            command=lambda: self.estatisticas.criar_distribuicao_plataformas(
-                self.lista_jogos
-            ),
-        )
-        info_menu.add_command(
-            label="Média de Notas",
-            command=lambda: self.estatisticas.criar_media_notas_plataformas(
-                self.lista_jogos
-            ),
-        )
-        info_menu.add_command(
-            label="Tempo Total Jogado",
-            command=lambda: self.estatisticas.criar_tempo_total_plataformas(
-                self.lista_jogos
-            ),
-        )
-        info_menu.add_command(
-            label="Jogos por Ano",
-            command=lambda: self.estatisticas.criar_grafico_jogos_por_ano(
-                self.lista_jogos
-            ),
-        )
-        info_menu.add_command(
-            label="Gêneros (Pizza)",
-            command=lambda: self.estatisticas.criar_grafico_generos(self.lista_jogos),
-        )
-        info_menu.add_command(
-            label="Análise de Notas",
-            command=lambda: self.estatisticas.criar_analise_de_notas(self.lista_jogos),
-        )
+        for tipo, rotulo in GRAFICOS.items():
+            info_menu.add_command(
+                label=rotulo, command=lambda t=tipo: self._abrir_grafico(t)
+            )
 
         menu_bar.add_command(
             label="Tarefas", command=lambda: JanelaChecklist(self.root, self.dados)
         )
         menu_bar.add_command(
-            label="Resumo", command=lambda: JanelaResumo(self.root, self.lista_jogos)
+            label="Resumo",
+            command=lambda: JanelaResumo(
+                self.root,
+                self._agregados(),
+                self._hidden_gems(),
+                self.dados.jogo_por_id,
+            ),
+        )
+
+    def _agregados(self):
+        return self.dados.calcular_agregados(self.lista_jogos)
+
+    def _graficos(self):
+        # matplotlib só é importado pelo painel de gráficos, quando ele abre.
+        if self._estatisticas is None:
+            self._estatisticas = GeradorGraficos()
+        return self._estatisticas
+
+    def _abrir_grafico(self, tipo):
+        if self._janela_graficos is not None and self._janela_graficos.aberta():
+            self._janela_graficos.mostrar(tipo)
+        else:
+            self._janela_graficos = JanelaGraficos(
+                self.root, self._graficos(), self._agregados(), tipo
+            )
+
+    def _atualizar_graficos(self):
+        if self._janela_graficos is not None and self._janela_graficos.aberta():
+            self._janela_graficos.atualizar(self._agregados())
+
+    def _hidden_gems(self):
+        return self.dados.memorizar(
+            "hidden_gems", lambda: self.dados.listar_hidden_gems(self.lista_jogos)
         )
 
     def _criar_widgets(self):
@@ -353,21 +421,32 @@ class App:
         )
         self.cb_nota.grid(row=7, column=1, sticky="w", padx=10)
 
-        btn_add = tk.Button(
+        self.btn_add = tk.Button(
             self.root, text="Adicionar Jogo", command=self.adicionar_jogo
         )
-        estilizar_botao(btn_add, "gray", largura=15, altura=1)
-        btn_add.place(x=90, y=280)
+        estilizar_botao(self.btn_add, "gray", largura=15, altura=1)
+        self.btn_add.place(x=90, y=280)
+
+        # Só aparece durante a edição de um jogo.
+        self.btn_cancelar = tk.Button(
+            self.root, text="Cancelar Edição", command=self._limpar_campos
+        )
+        estilizar_botao(self.btn_cancelar, "#C0392B", largura=15, altura=1)
 
         frame_lista = tk.Frame(self.root)
         frame_lista.grid(row=0, column=4, rowspan=9, padx=12, pady=5, sticky="n")
 
-        self.listbox = tk.Listbox(frame_lista, width=40, height=15)
-        self.listbox.pack(side="left")
+        frame_busca = tk.Frame(frame_lista)
+        frame_busca.pack(fill="x", pady=(0, 4))
+        tk.Label(frame_busca, text="🔍").pack(side="left")
+        tk.Entry(frame_busca, textvariable=self.var_busca).pack(
+            side="left", fill="x", expand=True
+        )
 
-        sb = tk.Scrollbar(frame_lista, command=self.listbox.yview)
-        sb.pack(side="right", fill="y")
-        self.listbox.config(yscrollcommand=sb.set)
+        self.listbox = ListaVirtual(
+            frame_lista, self._formatar_linha, largura=40, altura=14
+        )
+        self.listbox.pack()
 
         self.listbox.bind("<Double-Button-1>", self.mostrar_info_jogo)
         self.listbox.bind("<Button-3>", self._abrir_menu_contexto)
@@ -430,7 +509,16 @@ class App:
     def _filtrar_generos(self, event):
         pass
 
+    def _somente_leitura(self):
+        if self.dados.somente_leitura:
+            messagebox.showinfo(
+                "Somente leitura", "Esta biblioteca foi aberta somente para leitura."
+            )
+        return self.dados.somente_leitura
+
     def adicionar_jogo(self):
+        if self._somente_leitura():
+            return
         tempo_str = ""
         if self.var_forma.get() not in ["Planejo Jogar", "Desistência"]:
             h = self.var_horas.get()
@@ -460,44 +548,113 @@ class App:
             messagebox.showerror("Erro", erro)
             return
 
-        novo_jogo = {
-            "Título": self.var_titulo.get(),
-            "Gênero": self.var_genero.get(),
-            "Plataforma": self.var_plataforma.get(),
-            "Data de Zeramento": (
-                self.var_data.get()
-                if self.var_forma.get() not in ["Planejo Jogar", "Desistência"]
-                else ""
-            ),
-            "Forma de Zeramento": self.var_forma.get(),
-            "Descrição de Zeramento": self.var_desc.get(),
-            "Tempo Jogado": tempo_str,
-            "Nota": (
-                nota_salvar
-                if self.var_forma.get() not in ["Planejo Jogar", "Desistência"]
-                else ""
-            ),
-        }
+        original = (
+            self.dados.jogo_por_id(self.id_em_edicao)
+            if self.id_em_edicao is not None
+            else None
+        )
+        repetidos = self.dados.encontrar_duplicados(
+            self.lista_jogos, self.var_titulo.get(), self.var_plataforma.get()
+        )
+        if [j for j in repetidos if j is not original] and not messagebox.askyesno(
+            "Jogo repetido",
+            f"'{self.var_titulo.get()}' já está registrado para "
+            f"{self.var_plataforma.get()}. Adicionar mesmo assim?",
+        ):
+            return
 
-        self.lista_jogos.append(novo_jogo)
+        novo_jogo = Jogo.de_dict(
+            {
+                "Título": self.var_titulo.get(),
+                "Gênero": self.var_genero.get(),
+                "Plataforma": self.var_plataforma.get(),
+                "Data de Zeramento": (
+                    self.var_data.get()
+                    if self.var_forma.get() not in ["Planejo Jogar", "Desistência"]
+                    else ""
+                ),
+                "Forma de Zeramento": self.var_forma.get(),
+                "Descrição de Zeramento": self.var_desc.get(),
+                "Tempo Jogado": tempo_str,
+                "Nota": (
+                    nota_salvar
+                    if self.var_forma.get() not in ["Planejo Jogar", "Desistência"]
+                    else ""
+                ),
+            }
+        )
+        if original is not None:
+            novo_jogo.hidden_gem = original.hidden_gem
+            self._substituir_jogo(original, novo_jogo)
+            mensagem = "Jogo atualizado!"
+        else:
+            self._inserir_jogos([novo_jogo])
+            mensagem = "Jogo adicionado!"
         self._limpar_filtros()
         self._limpar_campos()
-        messagebox.showinfo("Sucesso", "Jogo adicionado!")
-
-    def atualizar_lista_visual(self):
-        self.listbox.delete(0, tk.END)
-        for idx, jogo in enumerate(self.jogos_visualizados, 1):
-            icone = "✅"
-            estado = jogo.get("Forma de Zeramento")
-            if estado == "Planejo Jogar":
-                icone = "📅"
-            elif estado == "Desistência":
-                icone = "❌"
-            elif estado == "Platina":
-                icone = "🏆"
-
-            destaque = "💎 " if jogo.get("Hidden Gem") else ""
-            self.listbox.insert(tk.END, f"{idx}. {icone} {destaque}{jogo['Título']}")
+        messagebox.showinfo("Sucesso", mensagem)
+
+    def _inserir_jogos(self, jogos):
+        # Sem ordenação escolhida, a lista fica na ordem de data do arquivo.
+        if len(jogos) == 1:
+            self.dados.inserir_ordenado(self.lista_jogos, jogos[0], self.ordenacao)
+        else:
+            self.lista_jogos.extend(jogos)
+            if self.ordenacao:
+                self.lista_jogos = self.dados.ordenar_jogos(
+                    self.lista_jogos, self.ordenacao
+                )
+            else:
+                self.lista_jogos = ordenar_por_data(self.lista_jogos)
+        self.dados.registrar_alteracao("adicionar", jogos=jogos)
+        self._agendar_salvamento()
+        self._atualizar_graficos()
+
+    def _substituir_jogo(self, original, novo):
+        # Uma única alteração no journal: o original só some quando o jogo
+        # editado entra no lugar dele, com o mesmo ID.
+        posicao = self.dados.posicao_jogo(self.lista_jogos, original, self.ordenacao)
+        self.dados.registrar_alteracao("editar", jogo=original, novo=novo)
+        del self.lista_jogos[posicao]
+        self.dados.inserir_ordenado(self.lista_jogos, novo, self.ordenacao)
+        self._agendar_salvamento()
+        self._atualizar_graficos()
+
+    def _remover_jogo(self, jogo):
+        if jogo.id == self.id_em_edicao:
+            self._limpar_campos()
+        posicao = self.dados.posicao_jogo(self.lista_jogos, jogo, self.ordenacao)
+        self.dados.registrar_alteracao("remover", jogo=jogo)
+        del self.lista_jogos[posicao]
+        self._agendar_salvamento()
+        self._atualizar_graficos()
+
+    def _definir_hidden_gem(self, jogo, valor):
+        self.dados.registrar_alteracao("hidden_gem", jogo=jogo, valor=valor)
+        jogo["Hidden Gem"] = valor
+        self._agendar_salvamento()
+
+    def _agendar_salvamento(self):
+        # Cada alteração já vai para o journal; o jogos.json só é reescrito
+        # quando o journal passa do limite ou ao fechar.
+        if self.dados.precisa_compactar():
+            self.dados.agendar_jogos(self.lista_jogos)
+
+    def atualizar_lista_visual(self, topo=False):
+        self.listbox.definir_itens(self.jogos_visualizados, topo)
+
+    def _formatar_linha(self, indice, jogo):
+        icone = "✅"
+        estado = jogo.get("Forma de Zeramento")
+        if estado == "Planejo Jogar":
+            icone = "📅"
+        elif estado == "Desistência":
+            icone = "❌"
+        elif estado == "Platina":
+            icone = "🏆"
+
+        destaque = "💎 " if jogo.get("Hidden Gem") else ""
+        return f"{indice + 1}. {icone} {destaque}{jogo['Título']}"
 
     def mostrar_info_jogo(self, event):
         sel = self.listbox.curselection()
@@ -536,6 +693,13 @@ class App:
             menu_org.add_command(
                 label="Data (Recente)", command=lambda: self._ordenar("data")
             )
+            menu_org.add_separator()
+            menu_org.add_command(
+                label="Personalizar...",
+                command=lambda: JanelaOrdenacao(
+                    self.root, self.ordenacao or (), self._ordenar
+                ),
+            )
             m.add_cascade(label="Organizar", menu=menu_org)
             m.add_separator()
             m.add_command(label=texto_gem, command=self._toggle_hidden_gem)
@@ -551,29 +715,23 @@ class App:
 
     def _toggle_hidden_gem(self):
         sel = self.listbox.curselection()
-        if not sel:
+        if not sel or self._somente_leitura():
             return
         jogo = self.jogos_visualizados[sel[0]]
-        jogo["Hidden Gem"] = not jogo.get("Hidden Gem", False)
-        self.atualizar_lista_visual()
+        self._definir_hidden_gem(jogo, not jogo.get("Hidden Gem", False))
+        self.listbox.atualizar_item(sel[0])
 
-    def _ordenar(self, criterio):
-        if criterio == "titulo":
-            self.lista_jogos.sort(key=lambda x: x["Título"].lower())
-        elif criterio == "nota":
-            self.lista_jogos.sort(
-                key=lambda x: float(x["Nota"]) if x["Nota"] else 0, reverse=True
-            )
-        elif criterio == "data":
-            self.lista_jogos.sort(
-                key=lambda x: (
-                    datetime.strptime(x["Data de Zeramento"], "%d/%m/%Y")
-                    if x.get("Data de Zeramento")
-                    else datetime.min
-                ),
-                reverse=True,
-            )
-        self._limpar_filtros()
+    def _ordenar(self, criterios):
+        criterios = normalizar_criterios(criterios)
+        if not criterios:
+            return
+        self.ordenacao = criterios
+        self.lista_jogos = self.dados.ordenar_jogos(self.lista_jogos, criterios)
+        self._resultado_busca = None
+        self.jogos_visualizados = self.dados.ordenar_jogos(
+            self.jogos_visualizados, criterios
+        )
+        self.atualizar_lista_visual(topo=True)
 
     def _copiar_nome(self):
         sel = self.listbox.curselection()
@@ -589,19 +747,19 @@ class App:
 
     def _excluir_jogo_selecionado(self):
         sel = self.listbox.curselection()
-        if not sel:
+        if not sel or self._somente_leitura():
             return
         jogo = self.jogos_visualizados[sel[0]]
         if messagebox.askyesno("Excluir", f"Apagar '{jogo['Título']}'?"):
-            self.lista_jogos.remove(jogo)
+            self._remover_jogo(jogo)
             self._limpar_filtros()
 
     def _editar_jogo_selecionado(self):
         sel = self.listbox.curselection()
-        if not sel:
+        if not sel or self._somente_leitura():
             return
         jogo = self.jogos_visualizados[sel[0]]
-        if jogo in self.lista_jogos:
+        if self.dados.jogo_por_id(jogo.id) is jogo:
             if messagebox.askyesno(
                 "Editar", "Editar este jogo? (Volta para o formulário)"
             ):
@@ -653,8 +811,16 @@ class App:
                 self.var_nota.set(valor_combo)
 
                 self._atualizar_campos_estado()
-                self.lista_jogos.remove(jogo)
-                self._limpar_filtros()
+                self._definir_edicao(jogo.id)
+
+    def _definir_edicao(self, id_jogo):
+        self.id_em_edicao = id_jogo
+        if id_jogo is None:
+            self.btn_add.config(text="Adicionar Jogo")
+            self.btn_cancelar.place_forget()
+        else:
+            self.btn_add.config(text="Salvar Alterações")
+            self.btn_cancelar.place(x=90, y=315)
 
     def _abrir_janela_filtro(self):
         top = tk.Toplevel(self.root)
@@ -683,28 +849,16 @@ class App:
         cb_est.pack(fill="x", pady=(0, 15))
 
         def aplicar():
-            f_titulo = ent_titulo.get().lower()
-            f_genero = cb_gen.get()
-            f_plat = cb_plat.get()
-            f_estado = cb_est.get()
-
-            resultado = []
-            for j in self.lista_jogos:
-                match = True
-                if f_titulo and f_titulo not in j["Título"].lower():
-                    match = False
-                if f_genero and f_genero != j["Gênero"]:
-                    match = False
-                if f_plat and f_plat != j["Plataforma"]:
-                    match = False
-                if f_estado and f_estado != j["Forma de Zeramento"]:
-                    match = False
-
-                if match:
-                    resultado.append(j)
-
-            self.jogos_visualizados = resultado
-            self.atualizar_lista_visual()
+            self.var_busca.set("")
+            self._cancelar_busca()
+            self.jogos_visualizados = self.dados.filtrar_jogos(
+                self.lista_jogos,
+                titulo=ent_titulo.get(),
+                genero=cb_gen.get(),
+                plataforma=cb_plat.get(),
+                estado=cb_est.get(),
+            )
+            self.atualizar_lista_visual(topo=True)
             top.destroy()
 
         btn_aplicar = tk.Button(
@@ -718,9 +872,71 @@ class App:
         )
         btn_aplicar.pack(fill="x", pady=5)
 
-    def _limpar_filtros(self):
+    def _limpar_filtros(self, topo=False):
+        self._resultado_busca = None
+        if self.var_busca.get().strip():
+            self._executar_busca(topo)
+            return
         self.jogos_visualizados = self.lista_jogos.copy()
-        self.atualizar_lista_visual()
+        self.atualizar_lista_visual(topo)
+
+    def _mostrar_duplicados(self):
+        grupos = self.dados.relatorio_duplicados(self.lista_jogos)
+        if not grupos:
+            messagebox.showinfo("Jogos Repetidos", "Nenhum jogo repetido.")
+            return
+
+        self.var_busca.set("")
+        self._cancelar_busca()
+        self.jogos_visualizados = [jogo for grupo in grupos for jogo in grupo]
+        self.atualizar_lista_visual(topo=True)
+        messagebox.showinfo(
+            "Jogos Repetidos",
+            f"{len(self.jogos_visualizados)} registros repetidos em "
+            f"{len(grupos)} jogos.",
+        )
+
+    def _limpar_busca(self):
+        self.var_busca.set("")
+        self._cancelar_busca()
+        self._limpar_filtros(topo=True)
+
+    def _cancelar_busca(self):
+        if self._busca_agendada is not None:
+            self.root.after_cancel(self._busca_agendada)
+            self._busca_agendada = None
+
+    def _agendar_busca(self, *args):
+        self._cancelar_busca()
+        self._busca_agendada = self.root.after(150, self._executar_busca)
+
+    def _executar_busca(self, topo=True):
+        self._busca_agendada = None
+        texto = self.var_busca.get().strip()
+        consulta = normalizar_texto(texto)
+        if not consulta:
+            self._resultado_busca = None
+            self.jogos_visualizados = self.lista_jogos.copy()
+            self.atualizar_lista_visual(topo)
+            return
+
+        anterior = self._resultado_busca
+        if (
+            anterior is not None
+            and anterior[1] == self.dados.versao
+            and consulta.startswith(anterior[0])
+        ):
+            encontrados = self.dados.refinar_busca(anterior[2], texto)
+        else:
+            encontrados = None
+        if not encontrados:
+            # O refinamento só compara prefixos; sem resultado, a busca
+            # completa ainda procura o trecho dentro dos títulos.
+            encontrados = self.dados.filtrar_jogos(self.lista_jogos, titulo=texto)
+
+        self._resultado_busca = (consulta, self.dados.versao, encontrados)
+        self.jogos_visualizados = encontrados
+        self.atualizar_lista_visual(topo)
 
     def _atualizar_campos_estado(self, event=None):
         if self.var_forma.get() in ["Planejo Jogar", "Desistência"]:
@@ -751,6 +967,7 @@ class App:
             self.var_data.set(novo)
 
     def _limpar_campos(self):
+        self._definir_edicao(None)
         self.var_titulo.set("")
 
         self.entry_gen.config(state="normal")
@@ -771,31 +988,92 @@ class App:
 
     def _exportar(self, tipo):
         c = filedialog.asksaveasfilename(defaultextension=f".{tipo}")
-        if c:
-            if tipo == "pdf":
-                Exportador.exportar_pdf(self.lista_jogos, c)
+        if not c:
+            return
+
+        from src.exportacao import Exportador
+
+        exportar = (
+            Exportador.exportar_pdf if tipo == "pdf" else Exportador.exportar_excel
+        )
+        jogos = self.lista_jogos.copy()
+
+        def concluir(sucesso, cancelado):
+            if cancelado:
+                messagebox.showinfo("Exportação", "Exportação cancelada.")
+            elif sucesso:
+                messagebox.showinfo("Sucesso", "Exportado!")
             else:
-                Exportador.exportar_excel(self.lista_jogos, c)
-            messagebox.showinfo("Sucesso", "Exportado!")
+                messagebox.showerror("Erro", "Não foi possível exportar.")
+
+        JanelaProgresso(
+            self.root,
+            "Exportando...",
+            lambda progresso, cancelado: exportar(jogos, c, progresso, cancelado),
+            concluir,
+        )
 
     def _importar_excel(self):
-        c = filedialog.askopenfilename()
-        if c:
-            n = Exportador.importar_excel(c)
-            if n:
-                self.lista_jogos.extend(n)
+        if self._somente_leitura():
+            return
+        c = filedialog.askopenfilename(
+            filetypes=[("Planilhas", "*.xlsx *.csv"), ("Todos os arquivos", "*.*")]
+        )
+        if not c:
+            return
+
+        from src.importacao import importar_arquivo
+
+        existentes = self.dados.indice_duplicados(self.lista_jogos)
+
+        def concluir(resultado, cancelado):
+            if cancelado:
+                messagebox.showinfo("Importação", "Importação cancelada.")
+                return
+            if not resultado:
+                messagebox.showerror("Erro", "Não foi possível ler o arquivo.")
+                return
+
+            if resultado.jogos:
+                self._inserir_jogos(resultado.jogos)
                 self._limpar_filtros()
-                messagebox.showinfo("Sucesso", "Importado!")
+
+            resumo = (
+                f"{len(resultado.jogos)} jogos importados.\n"
+                f"{resultado.duplicados} já estavam registrados e foram ignorados.\n"
+                f"{len(resultado.erros)} linhas com erro."
+            )
+            if resultado.erros:
+                resumo += "\n\n" + "\n".join(
+                    f"Linha {linha}: {erro}" for linha, erro in resultado.erros[:10]
+                )
+                if len(resultado.erros) > 10:
+                    resumo += f"\n... e mais {len(resultado.erros) - 10}."
+            messagebox.showinfo("Importação", resumo)
+
+        JanelaProgresso(
+            self.root,
+            "Importando...",
+            lambda progresso, cancelado: importar_arquivo(
+                c, existentes, progresso, cancelado
+            ),
+            concluir,
+        )
 
     def _resetar_dados(self):
+        if self._somente_leitura():
+            return
         if messagebox.askyesno("Cuidado", "Apagar TUDO?"):
             self.dados.resetar_tudo()
             self.lista_jogos = []
+            self._limpar_campos()
             self._limpar_filtros()
+            self._atualizar_graficos()
 
     def ao_fechar(self):
-        if messagebox.askyesno("Sair", "Salvar antes de sair?"):
-            self.dados.salvar_jogos(self.lista_jogos)
+        if self.dados.entradas_journal or not self.dados.usar_journal:
+            self.dados.agendar_jogos(self.lista_jogos)
+        self.dados.encerrar()
 
         self.root.quit()
         self.root.destroy()
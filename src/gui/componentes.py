@@ -142,3 +142,119 @@ class CalendarioPicker(tk.Toplevel):
         data_formatada = f"{dia:02d}/{self.mes_atual:02d}/{self.ano_atual}"
         self.callback(data_formatada)
         self.destroy()
+
+
+class ListaVirtual(tk.Frame):
+    def __init__(self, parent, formatar, largura=40, altura=15):
+        super().__init__(parent)
+        self.formatar = formatar
+        self.altura = altura
+        self.itens = []
+        self.inicio = 0
+        self.selecionado = None
+
+        self.listbox = tk.Listbox(
+            self, width=largura, height=altura, exportselection=False
+        )
+        self.listbox.pack(side="left")
+
+        self.scrollbar = tk.Scrollbar(self, command=self._rolar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.listbox.bind("<<ListboxSelect>>", self._ao_selecionar)
+        self.listbox.bind("<MouseWheel>", self._ao_roda)
+        self.listbox.bind("<Button-4>", lambda e: self._mover(-3))
+        self.listbox.bind("<Button-5>", lambda e: self._mover(3))
+        self.listbox.bind("<Up>", lambda e: self._mover_selecao(-1))
+        self.listbox.bind("<Down>", lambda e: self._mover_selecao(1))
+        self.listbox.bind("<Prior>", lambda e: self._mover(-self.altura))
+        self.listbox.bind("<Next>", lambda e: self._mover(self.altura))
+
+    def definir_itens(self, itens, topo=False):
+        self.itens = itens
+        self.selecionado = None
+        if topo:
+            self.inicio = 0
+        self._desenhar()
+
+    def atualizar_item(self, indice):
+        local = indice - self.inicio
+        if 0 <= local < self.altura and indice < len(self.itens):
+            self.listbox.delete(local)
+            self.listbox.insert(local, self.formatar(indice, self.itens[indice]))
+            if indice == self.selecionado:
+                self.listbox.selection_set(local)
+
+    def _desenhar(self):
+        total = len(self.itens)
+        self.inicio = max(0, min(self.inicio, total - self.altura))
+        fim = min(total, self.inicio + self.altura)
+
+        self.listbox.delete(0, tk.END)
+        for indice in range(self.inicio, fim):
+            self.listbox.insert(tk.END, self.formatar(indice, self.itens[indice]))
+
+        if self.selecionado is not None and self.inicio <= self.selecionado < fim:
+            self.listbox.selection_set(self.selecionado - self.inicio)
+
+        if total:
+            self.scrollbar.set(self.inicio / total, fim / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _mover(self, linhas):
+        self.inicio += linhas
+        self._desenhar()
+        return "break"
+
+    def _mover_selecao(self, passo):
+        if not self.itens:
+            return "break"
+        atual = self.inicio if self.selecionado is None else self.selecionado
+        self.selecionado = max(0, min(len(self.itens) - 1, atual + passo))
+        if self.selecionado < self.inicio:
+            self.inicio = self.selecionado
+        elif self.selecionado >= self.inicio + self.altura:
+            self.inicio = self.selecionado - self.altura + 1
+        self._desenhar()
+        self.listbox.event_generate("<<ListboxSelect>>")
+        return "break"
+
+    def _ao_roda(self, event):
+        return self._mover(-3 if event.delta > 0 else 3)
+
+    def _rolar(self, acao, valor, unidade=None):
+        if acao == "moveto":
+            self.inicio = int(float(valor) * len(self.itens))
+            self._desenhar()
+        elif acao == "scroll":
+            passo = self.altura if unidade == "pages" else 1
+            self._mover(int(valor) * passo)
+
+    def _ao_selecionar(self, event):
+        sel = self.listbox.curselection()
+        if sel:
+            self.selecionado = self.inicio + sel[0]
+
+    def bind(self, sequencia, funcao, add=None):
+        return self.listbox.bind(sequencia, funcao, add)
+
+    def curselection(self):
+        if self.selecionado is None or self.selecionado >= len(self.itens):
+            return ()
+        return (self.selecionado,)
+
+    def nearest(self, y):
+        return self.inicio + self.listbox.nearest(y)
+
+    def selection_clear(self, *args):
+        self.selecionado = None
+        self.listbox.selection_clear(0, tk.END)
+
+    def selection_set(self, indice):
+        self.selection_clear()
+        if 0 <= indice < len(self.itens):
+            self.selecionado = indice
+            local = indice - self.inicio
+            if 0 <= local < self.altura:
+                self.listbox.selection_set(local)
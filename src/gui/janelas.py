@@ -1,19 +1,19 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, Menu
 from tkinter import font as tkFont
-from PIL import Image, ImageTk
-import os
+from PIL import ImageTk
 import re
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
 import webbrowser
 import urllib.parse
 import pyperclip
+import queue
+import threading
 
-from src.utils import centralizar_janela, calcular_total_minutos
-from src.constantes import WALLPAPER_PATH, GENEROS, PLATAFORMAS
+from src.utils import centralizar_janela
+from src.constantes import GENEROS, PLATAFORMAS
 from src.gui.componentes import estilizar_botao
+from src.ordenacao import CAMPOS_ORDENACAO
+from src.fundo import abrir_previa, gerar_wallpaper
 
 
 class ScrollableFrame(tk.Frame):
@@ -750,19 +750,19 @@ class JanelaChecklist:
         nome = self.entry_nova.get().strip()
         if nome:
             self.tarefas.append({"nome": nome, "missoes": []})
-            self.dados.salvar_tarefas(self.tarefas)
+            self.dados.agendar_tarefas(self.tarefas)
             self.atualizar_lista()
             self.entry_nova.delete(0, tk.END)
 
     def excluir_tarefa(self, index):
         if messagebox.askyesno("Confirmar", "Excluir esta tarefa?"):
             self.tarefas.pop(index)
-            self.dados.salvar_tarefas(self.tarefas)
+            self.dados.agendar_tarefas(self.tarefas)
             self.atualizar_lista()
 
     def abrir_detalhes(self, index):
         def ao_fechar():
-            self.dados.salvar_tarefas(self.tarefas)
+            self.dados.agendar_tarefas(self.tarefas)
             self.atualizar_lista()
 
         JanelaMissoes(self.top, self.tarefas[index], ao_fechar)
@@ -929,7 +929,7 @@ class JanelaMissoes:
 
 
 class JanelaResumo:
-    def __init__(self, root, lista_jogos):
+    def __init__(self, root, agregados, hidden_gems, jogo_por_id):
         self.top = tk.Toplevel(root)
         self.top.title("Dashboard de Resumo")
         self.top.geometry("900x650")
@@ -942,27 +942,24 @@ class JanelaResumo:
         self.accent_color = "#4a90e2"
         self.top.configure(bg=self.bg_color)
 
-        self.jogos = lista_jogos
-        self.zerados = [j for j in self.jogos if j.get("Data de Zeramento")]
+        self.agregados = agregados
+        self.hidden_gems_list = hidden_gems
+        self.jogo_por_id = jogo_por_id
 
         self._calcular_dados()
         self._criar_interface()
 
     def _calcular_dados(self):
-        self.total_zerados = len(self.zerados)
-        self.total_jogos = len(self.jogos)
-        minutos_totais = sum(
-            calcular_total_minutos(j.get("Tempo Jogado", "0:00")) for j in self.zerados
-        )
-        self.horas_totais = minutos_totais // 60
+        ag = self.agregados
+        self.total_zerados = ag["zerados"]
+        self.total_jogos = ag["total_jogos"]
+        self.horas_totais = ag["minutos_zerados"] // 60
         self.dias_jogados = self.horas_totais / 24
 
-        notas = [float(j["Nota"]) for j in self.zerados if j.get("Nota")]
-        self.media_notas = sum(notas) / len(notas) if notas else 0.0
-        generos = [j["Gênero"] for j in self.zerados]
-        self.top_genero = max(set(generos), key=generos.count) if generos else "N/A"
-
-        self.hidden_gems_list = [j for j in self.jogos if j.get("Hidden Gem")]
+        qtd_notas = ag["qtd_notas_zerados"]
+        self.media_notas = ag["soma_notas_zerados"] / qtd_notas if qtd_notas else 0.0
+        generos = ag["generos_zerados"]
+        self.top_genero = max(generos, key=generos.get) if generos else "N/A"
 
     def _criar_interface(self):
         lbl_titulo = tk.Label(
@@ -1038,10 +1035,12 @@ class JanelaResumo:
         ).pack(pady=(0, 10))
 
     def _criar_grafico_pizza(self, parent):
-        status_counts = {}
-        for j in self.jogos:
-            s = j["Forma de Zeramento"]
-            status_counts[s] = status_counts.get(s, 0) + 1
+        # matplotlib só é carregado quando o resumo é aberto.
+        from matplotlib.artist import setp
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        status_counts = self.agregados["status"]
 
         labels = list(status_counts.keys())
         sizes = list(status_counts.values())
@@ -1060,8 +1059,8 @@ class JanelaResumo:
             startangle=90,
             colors=colors[: len(labels)],
         )
-        plt.setp(texts, color="white")
-        plt.setp(autotexts, size=8, weight="bold", color="white")
+        setp(texts, color="white")
+        setp(autotexts, size=8, weight="bold", color="white")
 
         canvas = FigureCanvasTkAgg(fig, master=parent)
         canvas.draw()
@@ -1141,18 +1140,24 @@ class JanelaResumo:
         self.tree.delete(*self.tree.get_children())
         for jogo in lista:
             self.tree.insert(
-                "", "end", values=(jogo["Título"], jogo["Gênero"], jogo["Plataforma"])
+                "",
+                "end",
+                iid=str(jogo.id),
+                values=(jogo["Título"], jogo["Gênero"], jogo["Plataforma"]),
             )
 
+    def _jogo_da_linha(self, item_id):
+        try:
+            return self.jogo_por_id(int(item_id))
+        except ValueError:
+            return None
+
     def _on_double_click(self, event):
         item_id = self.tree.identify_row(event.y)
         if not item_id:
             return
 
-        values = self.tree.item(item_id, "values")
-        titulo = values[0]
-        jogo = next((j for j in self.hidden_gems_list if j["Título"] == titulo), None)
-
+        jogo = self._jogo_da_linha(item_id)
         if jogo:
             JanelaDetalhes(self.top, jogo)
 
@@ -1162,13 +1167,10 @@ class JanelaResumo:
             return
 
         self.tree.selection_set(item_id)
-        values = self.tree.item(item_id, "values")
-        titulo = values[0]
-
-        jogo = next((j for j in self.hidden_gems_list if j["Título"] == titulo), None)
-
+        jogo = self._jogo_da_linha(item_id)
         if not jogo:
             return
+        titulo = jogo["Título"]
 
         m = Menu(self.top, tearoff=0)
         m.add_command(
@@ -1202,29 +1204,264 @@ class JanelaWallpaper:
         self.top.geometry("900x700")
         centralizar_janela(self.top, 900, 700)
 
-        self.img_orig = Image.open(self.caminho_imagem)
-        fator = min(800 / self.img_orig.width, 550 / self.img_orig.height)
-        novos_dims = (
-            int(self.img_orig.width * fator),
-            int(self.img_orig.height * fator),
+        self.img_show = None
+        self.lbl_carregando = tk.Label(self.top, text="Carregando imagem...")
+        self.lbl_carregando.pack(pady=20)
+
+        self._em_segundo_plano(
+            lambda: abrir_previa(self.caminho_imagem, 800, 550), self._mostrar_previa
         )
-        self.img_show = self.img_orig.resize(novos_dims, Image.LANCZOS)
+
+    def _em_segundo_plano(self, tarefa, ao_concluir):
+        fila = queue.Queue()
+
+        def executar():
+            try:
+                fila.put((tarefa(), None))
+            except Exception as e:
+                fila.put((None, e))
+
+        threading.Thread(target=executar, daemon=True).start()
+        self._aguardar(fila, ao_concluir)
+
+    def _aguardar(self, fila, ao_concluir):
+        if not self.top.winfo_exists():
+            return
+        try:
+            resultado, erro = fila.get_nowait()
+        except queue.Empty:
+            self.top.after(30, self._aguardar, fila, ao_concluir)
+            return
+        if erro is not None:
+            messagebox.showerror("Erro", f"Não foi possível abrir a imagem: {erro}")
+            self.top.destroy()
+            return
+        ao_concluir(resultado)
+
+    def _mostrar_previa(self, previa):
+        self.lbl_carregando.destroy()
+        self.img_show = previa
         self.img_tk = ImageTk.PhotoImage(self.img_show)
 
-        self.canvas = tk.Canvas(self.top, width=novos_dims[0], height=novos_dims[1])
+        self.canvas = tk.Canvas(self.top, width=previa.width, height=previa.height)
         self.canvas.pack(pady=10)
         self.canvas.create_image(0, 0, anchor="nw", image=self.img_tk)
 
-        btn = tk.Button(
+        self.btn_salvar = tk.Button(
             self.top, text="Salvar (Recorte Automático 600x400)", command=self._salvar
         )
-        estilizar_botao(btn, "#27AE60", largura=30)
-        btn.pack(pady=10)
+        estilizar_botao(self.btn_salvar, "#27AE60", largura=30)
+        self.btn_salvar.pack(pady=10)
 
     def _salvar(self):
-        target = self.img_orig.resize((600, 400), Image.LANCZOS)
-        os.makedirs(os.path.dirname(WALLPAPER_PATH), exist_ok=True)
-        target.save(WALLPAPER_PATH, "PNG")
+        self.btn_salvar.config(state="disabled", text="Salvando...")
+        self._em_segundo_plano(
+            lambda: gerar_wallpaper(self.caminho_imagem, self.img_show),
+            self._concluir_salvamento,
+        )
+
+    def _concluir_salvamento(self, _):
         messagebox.showinfo("Sucesso", "Wallpaper atualizado!")
         self.callback()
         self.top.destroy()
+
+
+class JanelaProgresso:
+    def __init__(self, root, titulo, tarefa, ao_concluir):
+        self.top = tk.Toplevel(root)
+        self.top.title(titulo)
+        centralizar_janela(self.top, 360, 130)
+        self.top.resizable(False, False)
+        self.top.transient(root)
+        self.top.configure(bg="#1e1e1e", padx=15, pady=15)
+
+        self.ao_concluir = ao_concluir
+        self.fila = queue.Queue()
+        self.cancelamento = threading.Event()
+
+        self.lbl_status = tk.Label(
+            self.top, text="Preparando...", bg="#1e1e1e", fg="white"
+        )
+        self.lbl_status.pack(anchor="w")
+
+        self.barra = ttk.Progressbar(self.top, length=330, maximum=100)
+        self.barra.pack(fill="x", pady=10)
+
+        self.btn_cancelar = tk.Button(
+            self.top,
+            text="Cancelar",
+            command=self.cancelar,
+            bg="#c0392b",
+            fg="white",
+            relief="flat",
+        )
+        self.btn_cancelar.pack()
+
+        self.top.protocol("WM_DELETE_WINDOW", self.cancelar)
+        self.top.grab_set()
+
+        threading.Thread(target=self._executar, args=(tarefa,), daemon=True).start()
+        self._acompanhar()
+
+    def _executar(self, tarefa):
+        try:
+            resultado = tarefa(self._progresso, self.cancelamento.is_set)
+        except Exception as e:
+            print(f"Erro na tarefa em segundo plano: {e}")
+            resultado = False
+        self.fila.put(("fim", resultado))
+
+    def _progresso(self, feitos, total):
+        self.fila.put(("progresso", feitos, total))
+
+    def _acompanhar(self):
+        fim = None
+        try:
+            while True:
+                mensagem = self.fila.get_nowait()
+                if mensagem[0] == "fim":
+                    fim = mensagem
+                else:
+                    _, feitos, total = mensagem
+                    if total:
+                        self.barra["value"] = 100 * feitos / total
+                    if not self.cancelamento.is_set():
+                        self.lbl_status.config(text=f"{feitos} de {total} jogos")
+        except queue.Empty:
+            pass
+
+        if fim is not None:
+            self.top.grab_release()
+            self.top.destroy()
+            self.ao_concluir(fim[1], self.cancelamento.is_set())
+            return
+        self.top.after(100, self._acompanhar)
+
+    def cancelar(self):
+        self.cancelamento.set()
+        self.lbl_status.config(text="Cancelando...")
+        self.btn_cancelar.config(state="disabled")
+
+
+class JanelaOrdenacao:
+    NIVEIS = 3
+
+    def __init__(self, root, criterios, ao_aplicar):
+        self.top = tk.Toplevel(root)
+        self.top.title("Organizar Lista")
+        centralizar_janela(self.top, 360, 220)
+        self.top.resizable(False, False)
+        self.top.transient(root)
+        self.top.configure(padx=15, pady=15)
+
+        self.ao_aplicar = ao_aplicar
+        self.campos = {rotulo: campo for campo, rotulo in CAMPOS_ORDENACAO.items()}
+        self.niveis = []
+
+        for nivel in range(self.NIVEIS):
+            campo, decrescente = (
+                criterios[nivel] if nivel < len(criterios) else ("", False)
+            )
+            var_campo = tk.StringVar(value=CAMPOS_ORDENACAO.get(campo, ""))
+            var_decrescente = tk.BooleanVar(value=decrescente)
+
+            tk.Label(
+                self.top, text="Ordenar por:" if nivel == 0 else "Depois por:"
+            ).grid(row=nivel, column=0, sticky="w", pady=5)
+            ttk.Combobox(
+                self.top,
+                textvariable=var_campo,
+                values=[""] + list(self.campos),
+                state="readonly",
+                width=20,
+            ).grid(row=nivel, column=1, padx=5)
+            tk.Checkbutton(self.top, text="Decrescente", variable=var_decrescente).grid(
+                row=nivel, column=2, sticky="w"
+            )
+            self.niveis.append((var_campo, var_decrescente))
+
+        tk.Button(
+            self.top,
+            text="Organizar",
+            command=self.aplicar,
+            bg="#4a90e2",
+            fg="white",
+            font=("Arial", 10, "bold"),
+            relief="flat",
+        ).grid(row=self.NIVEIS, column=0, columnspan=3, sticky="ew", pady=(15, 0))
+
+    def aplicar(self):
+        criterios = [
+            (self.campos[var_campo.get()], var_decrescente.get())
+            for var_campo, var_decrescente in self.niveis
+            if var_campo.get()
+        ]
+        self.top.destroy()
+        if criterios:
+            self.ao_aplicar(criterios)
+
+
+class JanelaGraficos:
+    def __init__(self, root, gerador, agregados, tipo):
+        # matplotlib só é carregado quando o painel é aberto.
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        from src.estatisticas import GRAFICOS
+
+        self.gerador = gerador
+        self.agregados = agregados
+        self.tipo = None
+
+        self.top = tk.Toplevel(root)
+        self.top.title("Gráficos")
+        self.top.geometry("1100x720")
+        self.top.configure(bg=gerador.bg_color)
+        centralizar_janela(self.top, 1100, 720)
+        self.top.protocol("WM_DELETE_WINDOW", self.fechar)
+
+        frame_botoes = tk.Frame(self.top, bg=gerador.bg_color)
+        frame_botoes.pack(fill="x", padx=10, pady=10)
+        for chave, rotulo in GRAFICOS.items():
+            btn = tk.Button(
+                frame_botoes,
+                text=rotulo,
+                command=lambda c=chave: self.mostrar(c),
+            )
+            estilizar_botao(btn, "#4a90e2", largura=14, altura=1)
+            btn.pack(side="left", padx=3)
+
+        # Uma única figura para todos os gráficos: trocar de gráfico só
+        # redesenha os eixos, sem abrir janelas novas do pyplot.
+        self.figura = Figure(figsize=(11, 6), dpi=100)
+        self.figura.patch.set_facecolor(gerador.bg_color)
+        self.ax = self.figura.add_subplot(111)
+
+        self.canvas = FigureCanvasTkAgg(self.figura, master=self.top)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+
+        self.mostrar(tipo)
+
+    def aberta(self):
+        return self.top is not None and self.top.winfo_exists()
+
+    def mostrar(self, tipo):
+        self.tipo = tipo
+        self._desenhar()
+        self.top.lift()
+
+    def atualizar(self, agregados):
+        self.agregados = agregados
+        self._desenhar()
+
+    def _desenhar(self):
+        estrutura = self.gerador.estrutura
+        self.gerador.desenhar(self.ax, self.tipo, self.agregados)
+        if self.gerador.estrutura != estrutura or estrutura is None:
+            self.figura.tight_layout()
+        self.canvas.draw_idle()
+
+    def fechar(self):
+        self.gerador.estrutura = None
+        self.top.destroy()
+        self.top = None
@@ -0,0 +1,221 @@
+import csv
+import os
+import re
+from typing import Iterator, Optional
+import openpyxl
+import pandas as pd
+from src.agregados import ESTADOS_PENDENTES
+from src.constantes import GENEROS
+from src.modelo import Jogo
+from src.utils import MENSAGENS_VALIDACAO, chave_jogo
+
+TAMANHO_LOTE = 10000
+
+# Cabeçalhos aceitos, incluindo os da exportação para Excel.
+COLUNAS_IMPORTACAO = {
+    "Título": "Título",
+    "Gênero": "Gênero",
+    "Plataforma": "Plataforma",
+    "Data": "Data de Zeramento",
+    "Data de Zeramento": "Data de Zeramento",
+    "Estado": "Forma de Zeramento",
+    "Forma de Zeramento": "Forma de Zeramento",
+    "Descrição": "Descrição de Zeramento",
+    "Descrição de Zeramento": "Descrição de Zeramento",
+    "Tempo": "Tempo Jogado",
+    "Tempo Jogado": "Tempo Jogado",
+    "Nota": "Nota",
+}
+COLUNAS_TEXTO = list(dict.fromkeys(COLUNAS_IMPORTACAO.values()))
+# Outras colunas da planilha (ID, fórmulas, anotações) não viram campos do jogo.
+COLUNAS_JOGO = COLUNAS_TEXTO + ["Hidden Gem"]
+
+VERDADEIROS = ["true", "verdadeiro", "sim", "1"]
+
+REGEX_TEMPO = re.compile(r"^(\d+)(?:h(?:(\d{1,2})m?)?|:(\d{1,2}))?$")
+
+
+class ResultadoImportacao:
+    def __init__(self):
+        self.jogos = []
+        self.erros = []
+        self.duplicados = 0
+        self.linhas = 0
+
+
+def _contar_linhas(caminho: str) -> int:
+    total = 0
+    with open(caminho, "rb") as arquivo:
+        while bloco := arquivo.read(1 << 20):
+            total += bloco.count(b"\n")
+    return max(total - 1, 0)
+
+
+def _separador_csv(caminho: str) -> str:
+    with open(caminho, encoding="utf-8-sig", errors="replace") as arquivo:
+        amostra = arquivo.read(1 << 14)
+    try:
+        return csv.Sniffer().sniff(amostra, delimiters=",;\t").delimiter
+    except csv.Error:
+        return ","
+
+
+def ler_lotes(caminho: str) -> Iterator[tuple]:
+    # O índice de cada lote é o número da linha no arquivo (1 é o cabeçalho).
+    if os.path.splitext(caminho)[1].lower() == ".csv":
+        total = _contar_linhas(caminho)
+        # O leitor fica aberto entre os lotes; o "with" fecha o arquivo mesmo
+        # quando a importação é cancelada no meio.
+        with pd.read_csv(
+            caminho,
+            dtype=str,
+            keep_default_na=False,
+            chunksize=TAMANHO_LOTE,
+            encoding="utf-8-sig",
+            sep=_separador_csv(caminho),
+        ) as leitor:
+            for lote in leitor:
+                lote.index += 2
+                preenchidas = lote.apply(lambda coluna: coluna.str.strip() != "")
+                lote = lote[preenchidas.any(axis=1)]
+                if len(lote):
+                    yield lote, total
+        return
+
+    wb = openpyxl.load_workbook(caminho, read_only=True, data_only=True)
+    try:
+        ws = wb.active
+        total = max((ws.max_row or 1) - 1, 0)
+        linhas = ws.iter_rows(values_only=True)
+        cabecalho = [str(c).strip() if c is not None else "" for c in next(linhas, ())]
+        lote = []
+        numeros = []
+        for numero, linha in enumerate(linhas, start=2):
+            # Planilhas costumam ter linhas vazias (ou só formatadas) no meio
+            # e no fim; elas não são registros nem erros.
+            if all(c is None or str(c).strip() == "" for c in linha):
+                continue
+            lote.append(linha)
+            numeros.append(numero)
+            if len(lote) == TAMANHO_LOTE:
+                yield pd.DataFrame(
+                    lote, columns=cabecalho, index=numeros, dtype=object
+                ), total
+                lote = []
+                numeros = []
+        if lote:
+            yield pd.DataFrame(
+                lote, columns=cabecalho, index=numeros, dtype=object
+            ), total
+    finally:
+        wb.close()
+
+
+def _texto(serie: pd.Series) -> pd.Series:
+    return serie.fillna("").astype(str).str.strip()
+
+
+def _normalizar_data(serie: pd.Series) -> pd.Series:
+    brasileiro = pd.to_datetime(serie, format="%d/%m/%Y", errors="coerce")
+    iso = pd.to_datetime(serie.str[:10], format="%Y-%m-%d", errors="coerce")
+    datas = brasileiro.fillna(iso)
+    return datas.dt.strftime("%d/%m/%Y").where(datas.notna(), serie)
+
+
+def _normalizar_tempo(serie: pd.Series) -> pd.Series:
+    partes = serie.str.lower().str.replace(" ", "").str.extract(REGEX_TEMPO)
+    validos = partes[0].notna()
+    horas = partes[0].fillna("0").astype(int)
+    minutos = partes[1].fillna(partes[2]).fillna("0").astype(int)
+    formatado = horas.astype(str) + "h " + minutos.astype(str).str.zfill(2) + "m"
+    return formatado.where(validos, serie)
+
+
+def _normalizar_nota(serie: pd.Series) -> tuple:
+    numeros = pd.to_numeric(serie, errors="coerce")
+    inteiros = numeros.notna() & (numeros % 1 == 0)
+    texto = serie.where(numeros.isna(), numeros.astype(str))
+    texto = texto.where(~inteiros, numeros.fillna(0).astype(int).astype(str))
+    return texto, numeros
+
+
+def normalizar_lote(lote: pd.DataFrame) -> pd.DataFrame:
+    lote = lote.rename(columns=COLUNAS_IMPORTACAO)
+    lote = lote.loc[:, lote.columns.isin(COLUNAS_JOGO) & ~lote.columns.duplicated()]
+    for coluna in lote.columns:
+        if coluna == "Hidden Gem":
+            lote[coluna] = _texto(lote[coluna]).str.lower().isin(VERDADEIROS)
+        else:
+            lote[coluna] = _texto(lote[coluna])
+    for coluna in COLUNAS_TEXTO:
+        if coluna not in lote:
+            lote[coluna] = ""
+
+    pendentes = lote["Forma de Zeramento"].isin(ESTADOS_PENDENTES)
+    lote["Data de Zeramento"] = _normalizar_data(lote["Data de Zeramento"]).where(
+        ~pendentes, ""
+    )
+    lote["Tempo Jogado"] = _normalizar_tempo(lote["Tempo Jogado"]).where(~pendentes, "")
+    nota, numeros = _normalizar_nota(lote["Nota"])
+    lote["Nota"] = nota.where(~pendentes, "")
+    lote["_nota_valor"] = numeros.where(~pendentes)
+    return lote
+
+
+def validar_lote(lote: pd.DataFrame) -> pd.Series:
+    # Mesmas regras e mensagens de validar_campos, aplicadas ao lote inteiro.
+    erros = pd.Series("", index=lote.index, dtype=object)
+
+    def marcar(falhou, mensagem):
+        erros[falhou & (erros == "")] = MENSAGENS_VALIDACAO[mensagem]
+
+    concluido = ~lote["Forma de Zeramento"].isin(ESTADOS_PENDENTES)
+    marcar(lote["Título"] == "", "titulo")
+    marcar(lote["Gênero"] == "", "genero")
+    marcar(~lote["Gênero"].isin(GENEROS), "genero_invalido")
+    marcar(lote["Plataforma"] == "", "plataforma")
+    marcar(lote["Forma de Zeramento"] == "", "estado")
+    formato = lote["Data de Zeramento"].str.fullmatch(r"\d{2}/\d{2}/\d{4}")
+    marcar(concluido & ~formato, "data_formato")
+    datas = pd.to_datetime(
+        lote["Data de Zeramento"], format="%d/%m/%Y", errors="coerce"
+    )
+    marcar(concluido & datas.isna(), "data_invalida")
+    tempo = lote["Tempo Jogado"].str.replace(" ", "").str.lower()
+    marcar(concluido & ~tempo.str.fullmatch(r"\d+h\d{2}m"), "tempo")
+    nota = lote["_nota_valor"]
+    marcar(nota.notna() & ((nota < 1) | (nota > 10)), "nota")
+    return erros
+
+
+def importar_arquivo(
+    caminho: str, existentes, progresso=None, cancelado=None
+) -> Optional[ResultadoImportacao]:
+    resultado = ResultadoImportacao()
+    vistas = set()
+
+    for lote, total in ler_lotes(caminho):
+        if cancelado and cancelado():
+            return None
+        numeros = lote.index.tolist()
+        resultado.linhas += len(lote)
+        lote = normalizar_lote(lote.reset_index(drop=True))
+        erros = validar_lote(lote)
+
+        registros = lote.drop(columns="_nota_valor").to_dict(orient="records")
+        for i, (registro, erro) in enumerate(zip(registros, erros.tolist())):
+            if erro:
+                resultado.erros.append((numeros[i], erro))
+                continue
+            chave = chave_jogo(registro["Título"], registro["Plataforma"])
+            if chave in existentes or chave in vistas:
+                resultado.duplicados += 1
+                continue
+            vistas.add(chave)
+            resultado.jogos.append(
+                Jogo.de_dict({k: v for k, v in registro.items() if v != ""})
+            )
+
+        if progresso:
+            progresso(min(numeros[-1] - 1, total), total)
+    return resultado
@@ -0,0 +1,156 @@
+import re
+from bisect import bisect_left
+from typing import Optional
+from src.utils import normalizar_texto
+
+REGEX_TERMO = re.compile(r"\w+")
+CAMPOS_INDEXADOS = ("genero", "plataforma", "estado")
+
+
+def extrair_termos(texto) -> list:
+    return REGEX_TERMO.findall(normalizar_texto(texto))
+
+
+def normalizar_consulta(texto) -> str:
+    return " ".join(normalizar_texto(texto).split())
+
+
+def titulo_corresponde(termos: list, consulta: list) -> bool:
+    return all(any(t.startswith(q) for t in termos) for q in consulta)
+
+
+def refinar_por_titulo(jogos: list, titulo: str) -> list:
+    # Refinar só compara prefixos de termos. Sem termos (consulta só de
+    # pontuação) não há o que comparar: nada é mantido e quem chamou refaz a
+    # busca completa, que procura o trecho dentro do título.
+    consulta = extrair_termos(titulo)
+    if not consulta:
+        return []
+    return [j for j in jogos if titulo_corresponde(extrair_termos(j.titulo), consulta)]
+
+
+class IndiceBusca:
+    def __init__(self):
+        self.campos = {campo: {} for campo in CAMPOS_INDEXADOS}
+        self.termos = {}
+        self.titulos = {}
+        self.total = 0
+        self.modificacoes = 0
+        self._termos_ordenados = None
+        self._posicoes = None
+        self._chave_posicoes = None
+
+    @classmethod
+    def de_jogos(cls, lista_jogos: list) -> "IndiceBusca":
+        indice = cls()
+        for jogo in lista_jogos:
+            indice.adicionar(jogo)
+        return indice
+
+    def adicionar(self, jogo):
+        for campo, baldes in self.campos.items():
+            baldes.setdefault(getattr(jogo, campo), set()).add(jogo)
+        titulo = self.titulos[jogo] = normalizar_consulta(jogo.titulo)
+        for termo in set(REGEX_TERMO.findall(titulo)):
+            postagens = self.termos.get(termo)
+            if postagens is None:
+                postagens = self.termos[termo] = set()
+                self._termos_ordenados = None
+            postagens.add(jogo)
+        self.total += 1
+        self.modificacoes += 1
+
+    def remover(self, jogo):
+        for campo, baldes in self.campos.items():
+            balde = baldes.get(getattr(jogo, campo))
+            if balde is not None:
+                balde.discard(jogo)
+                if not balde:
+                    del baldes[getattr(jogo, campo)]
+        titulo = self.titulos.pop(jogo, None)
+        if titulo is None:
+            titulo = normalizar_consulta(jogo.titulo)
+        for termo in set(REGEX_TERMO.findall(titulo)):
+            postagens = self.termos.get(termo)
+            if postagens is not None:
+                postagens.discard(jogo)
+                if not postagens:
+                    del self.termos[termo]
+                    self._termos_ordenados = None
+        self.total -= 1
+        self.modificacoes += 1
+
+    def _por_prefixo(self, prefixo: str) -> set:
+        if self._termos_ordenados is None:
+            self._termos_ordenados = sorted(self.termos)
+        ordenados = self._termos_ordenados
+
+        encontrados = set()
+        i = bisect_left(ordenados, prefixo)
+        while i < len(ordenados) and ordenados[i].startswith(prefixo):
+            encontrados |= self.termos[ordenados[i]]
+            i += 1
+        return encontrados
+
+    def _por_trecho(self, trecho: str) -> set:
+        return {jogo for jogo, titulo in self.titulos.items() if trecho in titulo}
+
+    @staticmethod
+    def _intersecao(candidatos: list) -> set:
+        candidatos = sorted(candidatos, key=len)
+        resultado = candidatos[0]
+        for outro in candidatos[1:]:
+            if not resultado:
+                break
+            resultado = resultado & outro
+        return resultado
+
+    def buscar(
+        self,
+        titulo: str = "",
+        genero: str = "",
+        plataforma: str = "",
+        estado: str = "",
+    ) -> Optional[set]:
+        filtros = []
+        for campo, valor in zip(CAMPOS_INDEXADOS, (genero, plataforma, estado)):
+            if valor:
+                filtros.append(self.campos[campo].get(valor, set()))
+
+        trecho = normalizar_consulta(titulo)
+        if not trecho:
+            return self._intersecao(filtros) if filtros else None
+        termos = REGEX_TERMO.findall(trecho)
+        resultado = set()
+        if termos:
+            resultado = self._intersecao(
+                filtros + [self._por_prefixo(t) for t in termos]
+            )
+        if not resultado:
+            # Nenhum termo começa assim ("ario"): procura o trecho dentro do
+            # título ("Mario"). Consultas só de pontuação também vêm para cá.
+            resultado = self._intersecao(filtros + [self._por_trecho(trecho)])
+        return resultado
+
+    def descartar_posicoes(self):
+        self._posicoes = None
+        self._chave_posicoes = None
+
+    def _posicoes_de(self, lista_jogos: list) -> dict:
+        chave = (id(lista_jogos), len(lista_jogos), self.modificacoes)
+        if self._chave_posicoes != chave:
+            self._posicoes = {jogo: i for i, jogo in enumerate(lista_jogos)}
+            self._chave_posicoes = chave
+        return self._posicoes
+
+    def filtrar(self, lista_jogos: list, **filtros) -> list:
+        resultado = self.buscar(**filtros)
+        if resultado is None:
+            return list(lista_jogos)
+        if len(resultado) * 2 > len(lista_jogos):
+            return [jogo for jogo in lista_jogos if jogo in resultado]
+
+        posicoes = self._posicoes_de(lista_jogos)
+        return sorted(
+            (jogo for jogo in resultado if jogo in posicoes), key=posicoes.__getitem__
+        )
@@ -0,0 +1,202 @@
+import math
+import re
+from datetime import date
+from typing import Optional
+from src.utils import calcular_total_minutos
+
+CAMPOS = {
+    "ID": "id",
+    "Título": "titulo",
+    "Gênero": "genero",
+    "Plataforma": "plataforma",
+    "Data de Zeramento": "data",
+    "Forma de Zeramento": "estado",
+    "Descrição de Zeramento": "descricao",
+    "Tempo Jogado": "tempo",
+    "Nota": "nota",
+    "Hidden Gem": "hidden_gem",
+}
+
+REGEX_DATA = re.compile(r"^\d{2}/\d{2}/\d{4}$")
+
+
+def converter_data(data) -> tuple:
+    if not isinstance(data, str) or not REGEX_DATA.match(data):
+        return 0, 0
+    try:
+        convertida = date(int(data[6:10]), int(data[3:5]), int(data[0:2]))
+    except ValueError:
+        return 0, 0
+    return convertida.toordinal(), convertida.year
+
+
+def converter_nota(nota) -> Optional[float]:
+    try:
+        valor = float(nota)
+    except (ValueError, TypeError):
+        return None
+    return valor if math.isfinite(valor) else None
+
+
+class Jogo:
+    __slots__ = (
+        "id",
+        "titulo",
+        "genero",
+        "plataforma",
+        "data",
+        "estado",
+        "descricao",
+        "tempo",
+        "nota",
+        "hidden_gem",
+        "extras",
+        "data_ordinal",
+        "ano",
+        "minutos",
+        "nota_valor",
+    )
+
+    def __init__(
+        self,
+        titulo="",
+        genero="",
+        plataforma="",
+        data="",
+        estado="",
+        descricao="",
+        tempo="",
+        nota="",
+        hidden_gem=None,
+        extras=None,
+        id=None,
+    ):
+        self.id = id
+        self.titulo = titulo
+        self.genero = genero
+        self.plataforma = plataforma
+        self.estado = estado
+        self.descricao = descricao
+        self.hidden_gem = hidden_gem
+        self.extras = extras or {}
+        self._definir_data(data)
+        self._definir_tempo(tempo)
+        self._definir_nota(nota)
+
+    def _definir_data(self, data):
+        self.data = data
+        self.data_ordinal, self.ano = converter_data(data)
+
+    def _definir_tempo(self, tempo):
+        self.tempo = tempo
+        self.minutos = calcular_total_minutos(tempo) if isinstance(tempo, str) else 0
+
+    def _definir_nota(self, nota):
+        self.nota = nota
+        self.nota_valor = converter_nota(nota)
+
+    @classmethod
+    def de_dict(cls, dados: dict) -> "Jogo":
+        if isinstance(dados, Jogo):
+            return dados
+        valores = {}
+        extras = {}
+        for chave, valor in dados.items():
+            atributo = CAMPOS.get(chave)
+            if atributo:
+                valores[atributo] = valor
+            else:
+                extras[chave] = valor
+        return cls(extras=extras, **valores)
+
+    @classmethod
+    def de_campos(
+        cls,
+        titulo,
+        genero,
+        plataforma,
+        data,
+        estado,
+        descricao,
+        tempo,
+        nota,
+        hidden_gem,
+        extras,
+        data_ordinal,
+        ano,
+        minutos,
+        nota_valor,
+        id=None,
+    ) -> "Jogo":
+        jogo = cls.__new__(cls)
+        jogo.id = id
+        jogo.titulo = titulo
+        jogo.genero = genero
+        jogo.plataforma = plataforma
+        jogo.data = data
+        jogo.estado = estado
+        jogo.descricao = descricao
+        jogo.tempo = tempo
+        jogo.nota = nota
+        jogo.hidden_gem = hidden_gem
+        jogo.extras = extras
+        jogo.data_ordinal = data_ordinal
+        jogo.ano = ano
+        jogo.minutos = minutos
+        jogo.nota_valor = nota_valor
+        return jogo
+
+    def para_dict(self) -> dict:
+        dados = {
+            "Título": self.titulo,
+            "Gênero": self.genero,
+            "Plataforma": self.plataforma,
+            "Data de Zeramento": self.data,
+            "Forma de Zeramento": self.estado,
+            "Descrição de Zeramento": self.descricao,
+            "Tempo Jogado": self.tempo,
+            "Nota": self.nota,
+        }
+        if self.hidden_gem is not None:
+            dados["Hidden Gem"] = self.hidden_gem
+        if self.id is not None:
+            dados["ID"] = self.id
+        dados.update(self.extras)
+        return dados
+
+    def __getitem__(self, chave):
+        atributo = CAMPOS.get(chave)
+        if atributo is None:
+            return self.extras[chave]
+        if atributo in ("hidden_gem", "id") and getattr(self, atributo) is None:
+            raise KeyError(chave)
+        return getattr(self, atributo)
+
+    def __setitem__(self, chave, valor):
+        atributo = CAMPOS.get(chave)
+        if atributo == "data":
+            self._definir_data(valor)
+        elif atributo == "tempo":
+            self._definir_tempo(valor)
+        elif atributo == "nota":
+            self._definir_nota(valor)
+        elif atributo:
+            setattr(self, atributo, valor)
+        else:
+            self.extras[chave] = valor
+
+    def __contains__(self, chave):
+        try:
+            self[chave]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, chave, padrao=None):
+        try:
+            return self[chave]
+        except KeyError:
+            return padrao
+
+    def __repr__(self):
+        return f"Jogo({self.titulo!r}, {self.plataforma!r})"
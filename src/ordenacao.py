@@ -0,0 +1,91 @@
+from bisect import insort
+
+CAMPOS_ORDENACAO = {
+    "titulo": "Título",
+    "genero": "Gênero",
+    "plataforma": "Plataforma",
+    "estado": "Forma de Zeramento",
+    "nota": "Nota",
+    "data": "Data de Zeramento",
+    "tempo": "Tempo Jogado",
+}
+CAMPOS_NUMERICOS = ("nota", "data", "tempo")
+
+ORDENS_PADRAO = {
+    "titulo": (("titulo", False),),
+    "nota": (("nota", True),),
+    "data": (("data", True),),
+}
+
+
+def normalizar_criterios(criterios) -> tuple:
+    if isinstance(criterios, str):
+        return ORDENS_PADRAO.get(criterios, ())
+    return tuple(
+        (campo, bool(decrescente))
+        for campo, decrescente in criterios
+        if campo in CAMPOS_ORDENACAO
+    )
+
+
+def valor_ordenacao(jogo, campo: str):
+    if campo == "nota":
+        return jogo.nota_valor or 0
+    if campo == "data":
+        return jogo.data_ordinal
+    if campo == "tempo":
+        return jogo.minutos
+    return str(getattr(jogo, campo)).lower()
+
+
+class _Decrescente:
+    __slots__ = ("valor",)
+
+    def __init__(self, valor):
+        self.valor = valor
+
+    def __lt__(self, outro):
+        return outro.valor < self.valor
+
+    def __eq__(self, outro):
+        return self.valor == outro.valor
+
+
+class OrdenadorJogos:
+    def __init__(self, criterios):
+        self.criterios = normalizar_criterios(criterios)
+        self._valores = {}
+
+    def valores(self, jogo) -> tuple:
+        valores = self._valores.get(jogo)
+        if valores is None:
+            valores = self._valores[jogo] = tuple(
+                valor_ordenacao(jogo, campo) for campo, _ in self.criterios
+            )
+        return valores
+
+    def chave(self, jogo) -> tuple:
+        return tuple(
+            (
+                (-valor if campo in CAMPOS_NUMERICOS else _Decrescente(valor))
+                if decrescente
+                else valor
+            )
+            for valor, (campo, decrescente) in zip(self.valores(jogo), self.criterios)
+        )
+
+    def ordenar(self, jogos) -> list:
+        # Uma passada estável por critério, do último para o primeiro, sobre
+        # colunas de valores já calculados.
+        linhas = [self.valores(jogo) for jogo in jogos]
+        ordem = list(range(len(linhas)))
+        for i in reversed(range(len(self.criterios))):
+            coluna = [valores[i] for valores in linhas]
+            ordem.sort(key=coluna.__getitem__, reverse=self.criterios[i][1])
+        return [jogos[i] for i in ordem]
+
+    def inserir(self, lista_jogos: list, jogo):
+        insort(lista_jogos, jogo, key=self.chave)
+
+    def esquecer(self, jogo):
+        self._valores.pop(jogo, None)
@@ -0,0 +1,156 @@
+import argparse
+import glob
+import multiprocessing
+import os
+import sys
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional
+
+from src.dados import iterar_lista_json
+from src.estatisticas import GRAFICOS, GeradorGraficos
+from src.modelo import Jogo
+from src.tabela import TabelaJogos
+
+FORMATOS = ("png", "svg")
+
+# Cada processo monta a figura uma vez e a reaproveita em todos os arquivos.
+_renderizador = None
+
+
+def _iniciar_processo():
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    global _renderizador
+    # Com dezenas de gêneros a legenda não cabe; o gráfico sai mesmo assim.
+    warnings.filterwarnings("ignore", message="Tight layout not applied")
+    gerador = GeradorGraficos()
+    figura = Figure(figsize=(11, 6), dpi=100)
+    figura.patch.set_facecolor(gerador.bg_color)
+    FigureCanvasAgg(figura)
+    _renderizador = (gerador, figura, figura.add_subplot(111))
+
+
+def carregar_agregados(caminho: str) -> dict:
+    jogos = []
+    with open(caminho, "rb") as arquivo:
+        for item in iterar_lista_json(arquivo):
+            if isinstance(item, dict):
+                jogos.append(Jogo.de_dict(item))
+    return TabelaJogos.de_jogos(jogos).agregados()
+
+
+def renderizar_arquivo(caminho: str, pasta: str, formato: str, dpi: int) -> int:
+    if _renderizador is None:
+        _iniciar_processo()
+    gerador, figura, ax = _renderizador
+
+    agregados = carregar_agregados(caminho)
+    os.makedirs(pasta, exist_ok=True)
+    gerados = 0
+    for tipo in GRAFICOS:
+        estrutura = gerador.estrutura
+        if not gerador.desenhar(ax, tipo, agregados):
+            continue
+        if gerador.estrutura != estrutura:
+            figura.tight_layout()
+        figura.savefig(os.path.join(pasta, f"{tipo}.{formato}"), dpi=dpi)
+        gerados += 1
+    return gerados
+
+
+def listar_entradas(caminhos: list) -> list:
+    arquivos = []
+    for caminho in caminhos:
+        if os.path.isdir(caminho):
+            arquivos.extend(
+                sorted(glob.glob(os.path.join(caminho, "**", "*.json"), recursive=True))
+            )
+        else:
+            arquivos.append(caminho)
+    return list(dict.fromkeys(os.path.abspath(a) for a in arquivos))
+
+
+def nomes_saida(arquivos: list) -> dict:
+    # Vários usuários costumam ter o mesmo "jogos.json"; nesses casos o nome
+    # da pasta de saída leva o caminho relativo à pasta comum.
+    nomes = [os.path.splitext(os.path.basename(a))[0] for a in arquivos]
+    if len(set(nomes)) == len(nomes):
+        return dict(zip(arquivos, nomes))
+
+    base = os.path.commonpath([os.path.dirname(a) for a in arquivos])
+    return {
+        a: os.path.splitext(os.path.relpath(a, base))[0].replace(os.sep, "_")
+        for a in arquivos
+    }
+
+
+def renderizar_lote(
+    arquivos: list,
+    saida: str,
+    formato: str = "png",
+    dpi: int = 100,
+    processos: Optional[int] = None,
+) -> tuple:
+    nomes = nomes_saida(arquivos)
+    processos = max(1, min(processos or os.cpu_count() or 1, len(arquivos)))
+    gerados = 0
+    falhas = 0
+
+    with ProcessPoolExecutor(
+        max_workers=processos,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_iniciar_processo,
+    ) as executor:
+        futuros = {
+            executor.submit(
+                renderizar_arquivo,
+                arquivo,
+                os.path.join(saida, nomes[arquivo]),
+                formato,
+                dpi,
+            ): arquivo
+            for arquivo in arquivos
+        }
+        for futuro in as_completed(futuros):
+            try:
+                gerados += futuro.result()
+            except Exception as e:
+                falhas += 1
+                print(f"Erro ao renderizar {futuros[futuro]}: {e}")
+    return gerados, falhas
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Gera os gráficos de Informações para vários jogos.json, sem display."
+    )
+    parser.add_argument("entradas", nargs="+", help="arquivos .json ou pastas")
+    parser.add_argument("-o", "--saida", default="graficos")
+    parser.add_argument("-f", "--formato", choices=FORMATOS, default="png")
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument(
+        "-j", "--processos", type=int, default=None, help="padrão: um por núcleo"
+    )
+    args = parser.parse_args()
+
+    arquivos = listar_entradas(args.entradas)
+    if not arquivos:
+        print("Nenhum arquivo .json encontrado.")
+        return 1
+
+    inicio = time.perf_counter()
+    gerados, falhas = renderizar_lote(
+        arquivos, args.saida, args.formato, args.dpi, args.processos
+    )
+    print(
+        f"{gerados} gráficos de {len(arquivos) - falhas}/{len(arquivos)} arquivos "
+        f"em {time.perf_counter() - inicio:.1f} s ({args.saida})"
+    )
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+import threading
+import time
+from typing import Optional
+
+
+class SalvadorAutomatico:
+    def __init__(self, atraso: float = 2.0):
+        self.atraso = atraso
+        self._pendentes = {}
+        self._ocupado = False
+        self._ativo = True
+        self._condicao = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._executar, name="salvamento", daemon=True
+        )
+        self._thread.start()
+
+    def agendar(self, chave: str, trabalho, atraso: Optional[float] = None):
+        # Reagendar a mesma chave adia o prazo dela (debounce por chave).
+        if atraso is None:
+            atraso = self.atraso
+        with self._condicao:
+            self._pendentes[chave] = (time.monotonic() + atraso, trabalho)
+            self._condicao.notify_all()
+
+    def _executar(self):
+        while True:
+            with self._condicao:
+                while True:
+                    agora = time.monotonic()
+                    prontos = [
+                        chave
+                        for chave, (prazo, _) in self._pendentes.items()
+                        if prazo <= agora or not self._ativo
+                    ]
+                    if prontos:
+                        break
+                    if not self._ativo:
+                        return
+                    if self._pendentes:
+                        proximo = min(p for p, _ in self._pendentes.values())
+                        self._condicao.wait(proximo - agora)
+                    else:
+                        self._condicao.wait()
+                trabalhos = [self._pendentes.pop(chave)[1] for chave in prontos]
+                self._ocupado = True
+
+            for trabalho in trabalhos:
+                try:
+                    trabalho()
+                except Exception as e:
+                    print(f"Erro no salvamento automático: {e}")
+
+            with self._condicao:
+                self._ocupado = False
+                self._condicao.notify_all()
+
+    def descarregar(self):
+        with self._condicao:
+            for chave, (_, trabalho) in self._pendentes.items():
+                self._pendentes[chave] = (0.0, trabalho)
+            self._condicao.notify_all()
+            while self._pendentes or self._ocupado:
+                self._condicao.wait()
+
+    def parar(self):
+        with self._condicao:
+            self._ativo = False
+            self._condicao.notify_all()
+        self._thread.join()
@@ -0,0 +1,356 @@
+import gc
+import json
+import os
+import struct
+from typing import Optional
+import numpy as np
+from src.modelo import Jogo
+
+MAGICO = b"RUJB"
+VERSAO_FORMATO = 3
+CABECALHO = struct.Struct("<4sIIqq")
+ALINHAMENTO = 8
+
+NOTA_TEXTO = 0
+NOTA_INTEIRO = 1
+NOTA_REAL = 2
+
+GEM_AUSENTE = 0
+GEM_FALSO = 1
+GEM_VERDADEIRO = 2
+
+CONVERSORES_NOTA = (str, int, float)
+HIDDEN_GEMS = (None, False, True)
+
+SEM_ID = -1
+
+COLUNAS_NUMERICAS = (
+    ("id", np.int64),
+    ("genero", np.uint32),
+    ("plataforma", np.uint32),
+    ("estado", np.uint32),
+    ("data_ordinal", np.int32),
+    ("ano", np.int32),
+    ("minutos", np.int32),
+    ("nota_valor", np.float64),
+    ("tipo_nota", np.uint8),
+    ("hidden_gem", np.uint8),
+    ("bruto", np.uint8),
+)
+COLUNAS_TEXTO = ("titulo", "descricao", "data", "tempo", "nota", "extras")
+
+
+def _registro_simples(jogo: Jogo) -> bool:
+    return (
+        all(
+            isinstance(v, str)
+            for v in (
+                jogo.titulo,
+                jogo.genero,
+                jogo.plataforma,
+                jogo.estado,
+                jogo.descricao,
+                jogo.data,
+                jogo.tempo,
+            )
+        )
+        and type(jogo.nota) in (str, int, float)
+        and type(jogo.hidden_gem) in (type(None), bool)
+        and (jogo.id is None or type(jogo.id) is int and 0 <= jogo.id < 2**63)
+    )
+
+
+class _Escritor:
+    def __init__(self, arquivo):
+        self.arquivo = arquivo
+        self.posicao = 0
+
+    def escrever(self, dados: bytes):
+        self.arquivo.write(dados)
+        self.posicao += len(dados)
+        resto = -self.posicao % ALINHAMENTO
+        if resto:
+            self.arquivo.write(b"\0" * resto)
+            self.posicao += resto
+
+    def textos(self, valores: list):
+        codificados = [v.encode("utf-8", "surrogatepass") for v in valores]
+        offsets = np.zeros(len(valores) + 1, dtype=np.uint64)
+        np.cumsum([len(v) for v in codificados], out=offsets[1:])
+        self.escrever(struct.pack("<Q", len(valores)))
+        self.escrever(offsets.tobytes())
+        self.escrever(b"".join(codificados))
+
+
+class ColunaTexto:
+    def __init__(self, offsets: np.ndarray, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        inicio, fim = int(self.offsets[i]), int(self.offsets[i + 1])
+        return str(self.blob[inicio:fim], "utf-8", "surrogatepass")
+
+    def comprimentos(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def tolist(self) -> list:
+        blob = bytes(self.blob)
+        offsets = self.offsets.tolist()
+        return [
+            blob[offsets[i] : offsets[i + 1]].decode("utf-8", "surrogatepass")
+            for i in range(len(offsets) - 1)
+        ]
+
+
+class _Leitor:
+    def __init__(self, memoria):
+        self.memoria = memoryview(memoria)
+        self.posicao = 0
+
+    def _avancar(self, tamanho: int):
+        self.posicao += tamanho + (-tamanho % ALINHAMENTO)
+
+    def estrutura(self, formato: struct.Struct) -> tuple:
+        valores = formato.unpack_from(self.memoria, self.posicao)
+        self._avancar(formato.size)
+        return valores
+
+    def coluna(self, tipo, quantidade: int) -> np.ndarray:
+        coluna = np.frombuffer(self.memoria, tipo, quantidade, self.posicao)
+        self._avancar(coluna.nbytes)
+        return coluna
+
+    def textos(self) -> ColunaTexto:
+        (quantidade,) = self.estrutura(struct.Struct("<Q"))
+        offsets = self.coluna(np.uint64, quantidade + 1)
+        tamanho = int(offsets[-1])
+        if self.posicao + tamanho > len(self.memoria):
+            raise ValueError("coluna de texto truncada")
+        blob = self.memoria[self.posicao : self.posicao + tamanho]
+        self._avancar(tamanho)
+        return ColunaTexto(offsets, blob)
+
+
+class SnapshotColunar:
+    def __init__(self, quantidade: int, tabelas: list, numericas: dict, textos: dict):
+        self.quantidade = quantidade
+        self.generos, self.plataformas, self.estados = tabelas
+        self.numericas = numericas
+        self.textos = textos
+
+    def __len__(self):
+        return self.quantidade
+
+    def jogo(self, i: int) -> Jogo:
+        col = self.numericas
+        texto = self.textos
+        extras = texto["extras"][i]
+        if col["bruto"][i]:
+            return Jogo.de_dict(json.loads(extras))
+        nota_valor = float(col["nota_valor"][i])
+        id_jogo = int(col["id"][i])
+        return Jogo.de_campos(
+            texto["titulo"][i],
+            self.generos[col["genero"][i]],
+            self.plataformas[col["plataforma"][i]],
+            texto["data"][i],
+            self.estados[col["estado"][i]],
+            texto["descricao"][i],
+            texto["tempo"][i],
+            CONVERSORES_NOTA[col["tipo_nota"][i]](texto["nota"][i]),
+            HIDDEN_GEMS[col["hidden_gem"][i]],
+            json.loads(extras) if extras else {},
+            int(col["data_ordinal"][i]),
+            int(col["ano"][i]),
+            int(col["minutos"][i]),
+            None if nota_valor != nota_valor else nota_valor,
+            None if id_jogo == SEM_ID else id_jogo,
+        )
+
+    def jogos(self) -> list:
+        numericas = {nome: coluna.tolist() for nome, coluna in self.numericas.items()}
+        textos = {nome: coluna.tolist() for nome, coluna in self.textos.items()}
+
+        colunas = zip(
+            textos["titulo"],
+            [self.generos[c] for c in numericas["genero"]],
+            [self.plataformas[c] for c in numericas["plataforma"]],
+            textos["data"],
+            [self.estados[c] for c in numericas["estado"]],
+            textos["descricao"],
+            textos["tempo"],
+            map(
+                lambda t, v: CONVERSORES_NOTA[t](v),
+                numericas["tipo_nota"],
+                textos["nota"],
+            ),
+            [HIDDEN_GEMS[c] for c in numericas["hidden_gem"]],
+            textos["extras"],
+            numericas["data_ordinal"],
+            numericas["ano"],
+            numericas["minutos"],
+            numericas["nota_valor"],
+            numericas["bruto"],
+            numericas["id"],
+        )
+
+        de_campos = Jogo.de_campos
+        lista_jogos = []
+        # Nada aqui forma ciclos; pausar o GC evita varreduras a cada mil objetos.
+        coletor_ativo = gc.isenabled()
+        gc.disable()
+        try:
+            for (
+                *campos,
+                extras,
+                ordinal,
+                ano,
+                minutos,
+                nota_valor,
+                bruto,
+                id_jogo,
+            ) in colunas:
+                if bruto:
+                    lista_jogos.append(Jogo.de_dict(json.loads(extras)))
+                    continue
+                lista_jogos.append(
+                    de_campos(
+                        *campos,
+                        json.loads(extras) if extras else {},
+                        ordinal,
+                        ano,
+                        minutos,
+                        None if nota_valor != nota_valor else nota_valor,
+                        None if id_jogo == SEM_ID else id_jogo,
+                    )
+                )
+        finally:
+            if coletor_ativo:
+                gc.enable()
+        return lista_jogos
+
+
+def salvar_snapshot(caminho: str, lista_jogos: list, assinatura: list) -> bool:
+    tabelas = {"genero": {}, "plataforma": {}, "estado": {}}
+    numericas = {nome: [] for nome, _ in COLUNAS_NUMERICAS}
+    textos = {nome: [] for nome in COLUNAS_TEXTO}
+
+    def texto(valor) -> str:
+        return valor if isinstance(valor, str) else ""
+
+    for jogo in lista_jogos:
+        simples = _registro_simples(jogo)
+        numericas["id"].append(jogo.id if simples and jogo.id is not None else SEM_ID)
+        for campo, tabela in tabelas.items():
+            valor = texto(getattr(jogo, campo))
+            numericas[campo].append(tabela.setdefault(valor, len(tabela)))
+        numericas["data_ordinal"].append(jogo.data_ordinal)
+        numericas["ano"].append(jogo.ano)
+        numericas["minutos"].append(jogo.minutos)
+        numericas["nota_valor"].append(
+            float("nan") if jogo.nota_valor is None else jogo.nota_valor
+        )
+        numericas["bruto"].append(0 if simples else 1)
+
+        textos["titulo"].append(texto(jogo.titulo))
+        textos["descricao"].append(texto(jogo.descricao))
+        textos["data"].append(texto(jogo.data))
+        textos["tempo"].append(texto(jogo.tempo))
+
+        # Registros com tipos fora do comum vão inteiros como JSON; as colunas
+        # acima servem só para listar e agregar no modo mapeado.
+        if not simples:
+            numericas["tipo_nota"].append(NOTA_TEXTO)
+            numericas["hidden_gem"].append(GEM_AUSENTE)
+            textos["nota"].append("")
+            textos["extras"].append(json.dumps(jogo.para_dict(), ensure_ascii=False))
+            continue
+
+        if type(jogo.nota) is int:
+            numericas["tipo_nota"].append(NOTA_INTEIRO)
+        elif type(jogo.nota) is float:
+            numericas["tipo_nota"].append(NOTA_REAL)
+        else:
+            numericas["tipo_nota"].append(NOTA_TEXTO)
+        numericas["hidden_gem"].append(
+            GEM_AUSENTE
+            if jogo.hidden_gem is None
+            else GEM_VERDADEIRO if jogo.hidden_gem else GEM_FALSO
+        )
+        textos["nota"].append(
+            repr(jogo.nota) if type(jogo.nota) is float else str(jogo.nota)
+        )
+        textos["extras"].append(
+            json.dumps(jogo.extras, ensure_ascii=False) if jogo.extras else ""
+        )
+
+    temporario = f"{caminho}.tmp"
+    try:
+        with open(temporario, "wb") as arquivo:
+            escritor = _Escritor(arquivo)
+            escritor.escrever(
+                CABECALHO.pack(MAGICO, VERSAO_FORMATO, len(lista_jogos), *assinatura)
+            )
+            for tabela in tabelas.values():
+                escritor.textos(list(tabela))
+            for nome, tipo in COLUNAS_NUMERICAS:
+                escritor.escrever(np.asarray(numericas[nome], dtype=tipo).tobytes())
+            for nome in COLUNAS_TEXTO:
+                escritor.textos(textos[nome])
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+        os.replace(temporario, caminho)
+        return True
+    except (OSError, ValueError, OverflowError) as e:
+        print(f"Erro ao salvar snapshot binário em {caminho}: {e}")
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        return False
+
+
+def abrir_snapshot(memoria, assinatura: list) -> Optional[SnapshotColunar]:
+    try:
+        leitor = _Leitor(memoria)
+        magico, versao, quantidade, tamanho, mtime = leitor.estrutura(CABECALHO)
+        if (
+            magico != MAGICO
+            or versao != VERSAO_FORMATO
+            or [tamanho, mtime] != assinatura
+        ):
+            return None
+
+        tabelas = [leitor.textos().tolist() for _ in range(3)]
+        numericas = {
+            nome: leitor.coluna(tipo, quantidade) for nome, tipo in COLUNAS_NUMERICAS
+        }
+        textos = {nome: leitor.textos() for nome in COLUNAS_TEXTO}
+    except (struct.error, ValueError, UnicodeDecodeError) as e:
+        print(f"Snapshot binário inválido: {e}")
+        return None
+    return SnapshotColunar(quantidade, tabelas, numericas, textos)
+
+
+def snapshot_vazio() -> SnapshotColunar:
+    return SnapshotColunar(
+        0,
+        [[], [], []],
+        {nome: np.zeros(0, tipo) for nome, tipo in COLUNAS_NUMERICAS},
+        {nome: ColunaTexto(np.zeros(1, np.uint64), b"") for nome in COLUNAS_TEXTO},
+    )
+
+
+def carregar_snapshot(caminho: str, assinatura: list) -> Optional[list]:
+    try:
+        with open(caminho, "rb") as arquivo:
+            memoria = arquivo.read()
+    except FileNotFoundError:
+        return None
+
+    snapshot = abrir_snapshot(memoria, assinatura)
+    if snapshot is None:
+        return None
+    return snapshot.jogos()
@@ -0,0 +1,170 @@
+import numpy as np
+from src.agregados import ESTADOS_PENDENTES, ESTADOS_GENEROS, novos_agregados
+
+
+def _codificar(valores: list) -> tuple:
+    categorias = {}
+    codigos = np.fromiter(
+        (categorias.setdefault(v, len(categorias)) for v in valores),
+        dtype=np.int32,
+        count=len(valores),
+    )
+    return list(categorias), codigos
+
+
+def _para_dict(categorias: list, contagem: np.ndarray, tipo=int) -> dict:
+    return {categorias[i]: tipo(contagem[i]) for i in np.flatnonzero(contagem)}
+
+
+class TabelaJogos:
+    def __init__(
+        self,
+        generos: list,
+        plataformas: list,
+        estados: list,
+        genero: np.ndarray,
+        plataforma: np.ndarray,
+        estado: np.ndarray,
+        minutos: np.ndarray,
+        nota: np.ndarray,
+        data_ordinal: np.ndarray,
+        ano: np.ndarray,
+        tem_data: np.ndarray,
+        tem_tempo: np.ndarray,
+    ):
+        self.generos = generos
+        self.plataformas = plataformas
+        self.estados = estados
+        self.genero = genero
+        self.plataforma = plataforma
+        self.estado = estado
+        self.minutos = minutos
+        self.nota = nota
+        self.data_ordinal = data_ordinal
+        self.ano = ano
+        self.tem_data = tem_data
+        self.tem_tempo = tem_tempo
+
+    @classmethod
+    def de_jogos(cls, lista_jogos: list) -> "TabelaJogos":
+        n = len(lista_jogos)
+        generos, genero = _codificar([j.genero for j in lista_jogos])
+        plataformas, plataforma = _codificar([j.plataforma for j in lista_jogos])
+        estados, estado = _codificar([j.estado for j in lista_jogos])
+
+        nan = float("nan")
+        return cls(
+            generos,
+            plataformas,
+            estados,
+            genero,
+            plataforma,
+            estado,
+            np.fromiter((j.minutos for j in lista_jogos), np.int32, n),
+            np.fromiter(
+                (nan if j.nota_valor is None else j.nota_valor for j in lista_jogos),
+                np.float32,
+                n,
+            ),
+            np.fromiter((j.data_ordinal for j in lista_jogos), np.int32, n),
+            np.fromiter((j.ano for j in lista_jogos), np.int32, n),
+            np.fromiter((bool(j.data) for j in lista_jogos), np.bool_, n),
+            np.fromiter((bool(j.tempo) for j in lista_jogos), np.bool_, n),
+        )
+
+    def __len__(self):
+        return len(self.genero)
+
+    def _codigos_estados(self, nomes: list) -> list:
+        return [i for i, e in enumerate(self.estados) if e in nomes]
+
+    def agregados(self) -> dict:
+        ag = novos_agregados()
+        ag["total_jogos"] = len(self)
+        if not len(self):
+            return ag
+
+        n_generos = len(self.generos)
+        n_plataformas = len(self.plataformas)
+        n_estados = len(self.estados)
+        pendentes = self._codigos_estados(ESTADOS_PENDENTES)
+        finalizados = [i for i in range(n_estados) if i not in pendentes]
+
+        # Uma única contagem por (estado, plataforma) e (estado, gênero) serve a
+        # todos os gráficos; os filtros por estado viram somas de linhas.
+        chave_plat = self.estado * n_plataformas + self.plataforma
+        chave_gen = self.estado * n_generos + self.genero
+        tamanho_plat = n_estados * n_plataformas
+
+        def por_estado_plataforma(pesos=None):
+            return np.bincount(chave_plat, pesos, tamanho_plat).reshape(
+                n_estados, n_plataformas
+            )
+
+        contagem = por_estado_plataforma()
+        ag["status"] = _para_dict(self.estados, contagem.sum(axis=1))
+        ag["plataformas"] = _para_dict(
+            self.plataformas, contagem[finalizados].sum(axis=0)
+        )
+
+        por_genero = np.bincount(chave_gen, minlength=n_estados * n_generos).reshape(
+            n_estados, n_generos
+        )
+        ag["generos"] = _para_dict(
+            self.generos,
+            por_genero[self._codigos_estados(ESTADOS_GENEROS)].sum(axis=0),
+        )
+
+        tem_nota = ~np.isnan(self.nota)
+        notas = np.where(tem_nota, self.nota, 0).astype(np.float64)
+        soma = por_estado_plataforma(notas)[finalizados].sum(axis=0)
+        qtd = por_estado_plataforma(tem_nota)[finalizados].sum(axis=0)
+        ag["notas_plataforma"] = {
+            self.plataformas[i]: [float(soma[i]), int(qtd[i])]
+            for i in np.flatnonzero(qtd)
+        }
+
+        linhas_fin = np.zeros(n_estados, dtype=np.bool_)
+        linhas_fin[finalizados] = True
+        notas_fin = notas[tem_nota & linhas_fin[self.estado]]
+        if len(notas_fin):
+            inteiras = np.trunc(notas_fin).astype(np.int64)
+            menor = int(inteiras.min())
+            histograma = np.bincount(inteiras - menor)
+            ag["histograma_notas"] = {
+                menor + int(i): int(histograma[i]) for i in np.flatnonzero(histograma)
+            }
+
+        minutos = por_estado_plataforma(self.minutos * self.tem_tempo)
+        ag["minutos_plataforma"] = _para_dict(
+            self.plataformas, minutos[finalizados].sum(axis=0)
+        )
+
+        zerados = self.tem_data
+        ag["zerados"] = int(np.count_nonzero(zerados))
+        ag["minutos_zerados"] = int(self.minutos[zerados].sum(dtype=np.int64))
+        nota_zerado = zerados & (notas != 0)
+        ag["soma_notas_zerados"] = float(np.dot(notas, nota_zerado))
+        ag["qtd_notas_zerados"] = int(np.count_nonzero(nota_zerado))
+        ag["generos_zerados"] = _para_dict(
+            self.generos, np.bincount(self.genero, zerados, n_generos)
+        )
+
+        com_ano = zerados & (self.ano > 0)
+        if com_ano.any():
+            ano_min = int(self.ano[com_ano].min())
+            n_anos = int(self.ano.max()) - ano_min + 1
+            deslocamento = np.maximum(self.ano - ano_min, 0)
+            matriz = np.bincount(
+                deslocamento * n_generos + self.genero,
+                com_ano,
+                n_anos * n_generos,
+            ).reshape(n_anos, n_generos)
+
+            por_ano = matriz.sum(axis=1)
+            for i in np.flatnonzero(por_ano):
+                ano = ano_min + int(i)
+                ag["jogos_ano"][ano] = int(por_ano[i])
+                ag["generos_ano"][ano] = _para_dict(self.generos, matriz[i])
+
+        return ag
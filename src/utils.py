@@ -1,5 +1,6 @@
 import re
 import tkinter as tk
+import unicodedata
 from datetime import datetime
 from typing import Optional, Union
 from src.constantes import GENEROS
@@ -16,6 +17,20 @@ def centralizar_janela(
     janela.geometry(f"{largura}x{altura}+{x}+{y}")
 
 
+# Usadas também na validação em lote da importação.
+MENSAGENS_VALIDACAO = {
+    "titulo": "O campo 'Título' é obrigatório! Não deixe seu jogo sem nome.",
+    "genero": "O campo 'Gênero' é obrigatório! Escolha o tipo do seu jogo.",
+    "genero_invalido": "Gênero inválido! Por favor, utilize a lupa para selecionar um gênero da lista oficial.",
+    "plataforma": "O campo 'Plataforma' é obrigatório! Onde você jogou?",
+    "estado": "O campo 'Forma de Zeramento' é obrigatório!",
+    "data_formato": "A data de zeramento deve estar no formato DIA/MÊS/ANO.",
+    "data_invalida": "A data de zeramento não é válida!",
+    "tempo": "O tempo jogado está com formato inválido (ex: 10h 30m).",
+    "nota": "A nota deve estar entre 1 e 10!",
+}
+
+
 def validar_campos(
     titulo: str,
     genero: str,
@@ -26,32 +41,32 @@ def validar_campos(
     estado: str,
 ) -> Optional[str]:
     if not titulo.strip():
-        return "O campo 'Título' é obrigatório! Não deixe seu jogo sem nome."
+        return MENSAGENS_VALIDACAO["titulo"]
     if not genero.strip():
-        return "O campo 'Gênero' é obrigatório! Escolha o tipo do seu jogo."
+        return MENSAGENS_VALIDACAO["genero"]
     if genero not in GENEROS:
-        return "Gênero inválido! Por favor, utilize a lupa para selecionar um gênero da lista oficial."
+        return MENSAGENS_VALIDACAO["genero_invalido"]
     if not plataforma.strip():
-        return "O campo 'Plataforma' é obrigatório! Onde você jogou?"
+        return MENSAGENS_VALIDACAO["plataforma"]
     if not estado.strip():
-        return "O campo 'Forma de Zeramento' é obrigatório!"
+        return MENSAGENS_VALIDACAO["estado"]
     if estado not in ["Planejo Jogar", "Desistência"]:
         if not re.match(r"^\d{2}/\d{2}/\d{4}$", data_zeramento):
-            return "A data de zeramento deve estar no formato DIA/MÊS/ANO."
+            return MENSAGENS_VALIDACAO["data_formato"]
         try:
             datetime.strptime(data_zeramento, "%d/%m/%Y")
         except ValueError:
-            return "A data de zeramento não é válida!"
+            return MENSAGENS_VALIDACAO["data_invalida"]
 
         tempo_limpo = tempo_jogado.replace(" ", "").lower()
         if not re.match(r"^(\d+h\d{2}m)$", tempo_limpo):
-            return "O tempo jogado está com formato inválido (ex: 10h 30m)."
+            return MENSAGENS_VALIDACAO["tempo"]
 
     if nota:
         try:
             n = float(nota)
             if not (1 <= n <= 10):
-                return "A nota deve estar entre 1 e 10!"
+                return MENSAGENS_VALIDACAO["nota"]
         except ValueError:
             pass
 
@@ -86,3 +101,18 @@ def calcular_total_minutos(tempo_jogado: str) -> int:
         return horas * 60 + minutos
     except ValueError:
         return 0
+
+
+def normalizar_texto(texto) -> str:
+    texto = str(texto)
+    if texto.isascii():
+        return texto.lower()
+    decomposto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in decomposto if not unicodedata.combining(c)).casefold()
+
+
+def chave_jogo(titulo, plataforma) -> tuple:
+    return (
+        " ".join(normalizar_texto(titulo).split()),
+        " ".join(normalizar_texto(plataforma).split()),
+    )
@@ -0,0 +1,114 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from src.agregados import agregados_equivalentes
+from src.dados import GerenciadorDados
+from src.dados_sqlite import GerenciadorDadosSQLite
+from src.modelo import Jogo
+
+
+def jogo(titulo, genero, plataforma, data, estado, tempo="", nota="") -> Jogo:
+    return Jogo.de_dict(
+        {
+            "Título": titulo,
+            "Gênero": genero,
+            "Plataforma": plataforma,
+            "Data de Zeramento": data,
+            "Forma de Zeramento": estado,
+            "Tempo Jogado": tempo,
+            "Nota": nota,
+        }
+    )
+
+
+def biblioteca() -> list:
+    return [
+        jogo("Zelda", "Aventura", "Switch", "12/05/2023", "História", "40h 00m", "9"),
+        jogo("Persona 5", "JRPG", "PS4", "03/01/2020", "Platina", "110h 30m", "10"),
+        jogo("Hades", "Action RPG", "PC", "20/09/2021", "100%", "60h 15m", "9"),
+        jogo("Elden Ring", "Action RPG", "PC", "", "Planejo Jogar"),
+        jogo("Anthem", "Action RPG", "PC", "", "Desistência"),
+        jogo("Celeste", "Aventura", "Switch", "01/02/2020", "História", "12h 00m"),
+    ]
+
+
+class TesteAgregados(unittest.TestCase):
+    def test_adicionar_remover_e_editar(self):
+        dados = GerenciadorDados(usar_journal=False)
+        lista = biblioteca()
+        dados.calcular_agregados(lista)
+
+        novo = jogo(
+            "Okami", "Aventura", "PS2", "07/07/2007", "História", "35h 00m", "8"
+        )
+        dados.registrar_alteracao("adicionar", jogos=[novo])
+        lista.append(novo)
+        self.assertTrue(dados.verificar_agregados(lista))
+
+        dados.registrar_alteracao("remover", jogo=lista[1])
+        del lista[1]
+        self.assertTrue(dados.verificar_agregados(lista))
+
+        # Edição que troca plataforma, estado, ano e nota de uma vez.
+        editado = jogo("Hades", "Action RPG", "Switch", "", "Desistência")
+        dados.registrar_alteracao("editar", jogo=lista[1], novo=editado)
+        lista[1] = editado
+        self.assertTrue(dados.verificar_agregados(lista))
+
+        self.assertEqual(dados.calcular_agregados(lista)["total_jogos"], 6)
+
+    def test_removendo_tudo_volta_ao_vazio(self):
+        dados = GerenciadorDados(usar_journal=False)
+        lista = biblioteca()
+        dados.calcular_agregados(lista)
+        for atual in list(lista):
+            dados.registrar_alteracao("remover", jogo=atual)
+            lista.remove(atual)
+        self.assertTrue(
+            agregados_equivalentes(
+                dados.calcular_agregados(lista),
+                GerenciadorDados(usar_journal=False).calcular_agregados([]),
+            )
+        )
+
+    def test_hidden_gem_nao_muda_os_agregados(self):
+        dados = GerenciadorDados(usar_journal=False)
+        lista = biblioteca()
+        antes = dict(dados.calcular_agregados(lista))
+        dados.registrar_alteracao("hidden_gem", jogo=lista[0], valor=True)
+        lista[0]["Hidden Gem"] = True
+        self.assertTrue(agregados_equivalentes(antes, dados.calcular_agregados(lista)))
+
+
+class TesteAgregadosSQLite(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.pasta, ignore_errors=True)
+        correcao = mock.patch("src.dados.SAVES_DIR", self.pasta)
+        correcao.start()
+        self.addCleanup(correcao.stop)
+
+    def test_sql_igual_ao_incremental(self):
+        banco = GerenciadorDadosSQLite(os.path.join(self.pasta, "jogos.db"))
+        self.addCleanup(banco.conexao.close)
+        banco.registrar_alteracao("adicionar", jogos=biblioteca())
+        lista = banco.carregar_jogos()
+        banco.calcular_agregados(lista)
+
+        banco.registrar_alteracao("remover", jogo=lista[0])
+        del lista[0]
+        editado = jogo(
+            "Celeste", "Aventura", "PC", "05/05/2024", "100%", "20h 00m", "10"
+        )
+        banco.registrar_alteracao("editar", jogo=lista[-1], novo=editado)
+        lista[-1] = editado
+
+        self.assertTrue(banco.verificar_agregados(lista))
+        self.assertTrue(
+            agregados_equivalentes(
+                banco.calcular_agregados(lista),
+                GerenciadorDados(usar_journal=False).calcular_agregados(lista),
+            )
+        )
@@ -0,0 +1,107 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from src.dados import GerenciadorDados, iterar_lista_json
+
+REGISTROS = [
+    {"Título": "Zelda", "Data de Zeramento": "12/05/2023", "Nota": "9"},
+    {"Título": "Ação é ótimo 🎮", "Data de Zeramento": "", "Nota": 7},
+    {"Título": "Hades", "Data de Zeramento": "20/09/2021", "Extra": [1, {"a": 2}]},
+]
+
+
+class TesteLeituraJson(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.pasta, ignore_errors=True)
+
+    def arquivo(self, conteudo: bytes):
+        caminho = os.path.join(self.pasta, "jogos.json")
+        with open(caminho, "wb") as arquivo:
+            arquivo.write(conteudo)
+        arquivo = open(caminho, "rb")
+        self.addCleanup(arquivo.close)
+        return arquivo
+
+    def test_registros_cortados_entre_blocos(self):
+        texto = json.dumps(REGISTROS, ensure_ascii=False, indent=4).encode("utf-8")
+        # Blocos de 7 bytes cortam registros e caracteres de vários bytes.
+        with mock.patch("src.dados.TAMANHO_BLOCO", 7):
+            lidos = list(iterar_lista_json(self.arquivo(b"\xef\xbb\xbf" + texto)))
+        self.assertEqual(lidos, REGISTROS)
+
+    def test_progresso_chega_ao_total(self):
+        texto = json.dumps(REGISTROS).encode("utf-8")
+        avisos = []
+        with mock.patch("src.dados.TAMANHO_BLOCO", 16):
+            list(
+                iterar_lista_json(
+                    self.arquivo(texto), lambda lidos, total: avisos.append(lidos)
+                )
+            )
+        self.assertEqual(avisos, sorted(avisos))
+        self.assertEqual(avisos[-1], len(texto))
+
+    def test_lista_vazia(self):
+        self.assertEqual(list(iterar_lista_json(self.arquivo(b" [ ] "))), [])
+
+    def test_arquivo_invalido(self):
+        for conteudo in (b"", b'{"a": 1}', b'[{"a": 1}, {"b"', b'[{"a": 1}'):
+            with self.assertRaises(json.JSONDecodeError, msg=conteudo):
+                list(iterar_lista_json(self.arquivo(conteudo)))
+
+
+class TesteCarregarJson(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.pasta, ignore_errors=True)
+        correcao = mock.patch("src.dados.SAVES_DIR", self.pasta)
+        correcao.start()
+        self.addCleanup(correcao.stop)
+
+    def test_ordem_por_data_com_sem_data_no_fim(self):
+        dados = GerenciadorDados()
+        with open(dados.arquivo_jogos, "w", encoding="utf-8") as arquivo:
+            json.dump(REGISTROS + ["lixo"], arquivo)
+        lista = dados._carregar_json()
+        self.assertEqual(
+            [j.titulo for j in lista], ["Hades", "Zelda", "Ação é ótimo 🎮"]
+        )
+        self.assertEqual(lista[0].extras, {"Extra": [1, {"a": 2}]})
+
+    def corromper(self, dados) -> bytes:
+        conteudo = json.dumps(REGISTROS, ensure_ascii=False).encode("utf-8")[:-20]
+        with open(dados.arquivo_jogos, "wb") as arquivo:
+            arquivo.write(conteudo)
+        with open(dados.arquivo_journal, "w", encoding="utf-8") as arquivo:
+            arquivo.write('{"base": null}\n')
+        return conteudo
+
+    def test_arquivo_corrompido_e_guardado_antes_de_salvar(self):
+        dados = GerenciadorDados()
+        conteudo = self.corromper(dados)
+
+        self.assertEqual(dados.carregar_jogos(), [])
+        self.assertIn("jogos.json.corrompido", dados.erro_carregamento)
+        self.assertFalse(os.path.exists(dados.arquivo_journal))
+        self.assertTrue(os.path.exists(dados.arquivo_journal + ".corrompido"))
+
+        self.assertTrue(dados.salvar_jogos([]))
+        with open(dados.arquivo_jogos + ".corrompido", "rb") as arquivo:
+            self.assertEqual(arquivo.read(), conteudo)
+
+    def test_sem_copia_nada_e_gravado(self):
+        dados = GerenciadorDados()
+        conteudo = self.corromper(dados)
+
+        with mock.patch("src.dados.shutil.copy2", side_effect=OSError("cheio")):
+            self.assertEqual(dados.carregar_jogos(), [])
+        self.assertTrue(dados.somente_leitura)
+        self.assertTrue(dados.erro_carregamento)
+
+        self.assertFalse(dados.salvar_jogos([]))
+        with open(dados.arquivo_jogos, "rb") as arquivo:
+            self.assertEqual(arquivo.read(), conteudo)
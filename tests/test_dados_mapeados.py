@@ -0,0 +1,120 @@
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from src.agregados import agregados_equivalentes
+from src.dados import GerenciadorDados
+from src.dados_mapeados import BibliotecaMapeada, GerenciadorDadosMapeado
+from src.modelo import Jogo
+
+
+def jogo(id, titulo, genero, plataforma, data, estado, nota="") -> Jogo:
+    return Jogo.de_dict(
+        {
+            "ID": id,
+            "Título": titulo,
+            "Gênero": genero,
+            "Plataforma": plataforma,
+            "Data de Zeramento": data,
+            "Forma de Zeramento": estado,
+            "Tempo Jogado": "10h 00m" if data else "",
+            "Nota": nota,
+        }
+    )
+
+
+def ids(jogos) -> list:
+    return [j.id for j in jogos]
+
+
+class TesteDadosMapeados(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.pasta, ignore_errors=True)
+        correcao = mock.patch("src.dados.SAVES_DIR", self.pasta)
+        correcao.start()
+        self.addCleanup(correcao.stop)
+
+        GerenciadorDados().salvar_jogos(
+            [
+                jogo(
+                    1,
+                    "The Legend of Zelda",
+                    "Aventura",
+                    "Switch",
+                    "12/05/2023",
+                    "História",
+                    "9",
+                ),
+                jogo(
+                    2,
+                    "Super Mário Odyssey",
+                    "Aventura",
+                    "Switch",
+                    "01/01/2018",
+                    "100%",
+                    "10",
+                ),
+                jogo(3, "Dark Souls", "Action RPG", "PC", "20/09/2021", "Platina", "8"),
+                jogo(4, "Dark Souls II", "Action RPG", "PS3", "", "Desistência"),
+                jogo(5, "Ação Total", "Aventura", "PC", "", "Planejo Jogar"),
+            ]
+        )
+        self.json = GerenciadorDados()
+        self.lista = self.json.carregar_jogos()
+        self.mapeado = GerenciadorDadosMapeado()
+        self.biblioteca = self.mapeado.carregar_jogos()
+
+    def test_mesmos_jogos_do_json(self):
+        self.assertIsInstance(self.biblioteca, BibliotecaMapeada)
+        self.assertEqual(
+            [j.para_dict() for j in self.biblioteca],
+            [j.para_dict() for j in self.lista],
+        )
+
+    def test_filtrar(self):
+        for filtros, esperado in (
+            ({"titulo": "dark"}, [3, 4]),
+            ({"titulo": "dark so ii"}, [4]),
+            ({"titulo": "acao"}, [5]),
+            ({"genero": "Aventura", "plataforma": "PC"}, [5]),
+            ({"estado": "Platina", "titulo": "sou"}, [3]),
+            ({"plataforma": "Inexistente"}, []),
+            # Sem termo com o prefixo, vale o trecho dentro do título.
+            ({"titulo": "ario"}, [2]),
+            ({"titulo": "ark  SOU"}, [3, 4]),
+            ({"plataforma": "PS3", "titulo": "ouls"}, [4]),
+            ({"titulo": "!!"}, []),
+            ({"titulo": "  "}, [1, 2, 3, 4, 5]),
+        ):
+            resultado = self.mapeado.filtrar_jogos(self.biblioteca, **filtros)
+            self.assertIsInstance(resultado, BibliotecaMapeada)
+            self.assertEqual(sorted(ids(resultado)), esperado, filtros)
+            self.assertEqual(
+                ids(resultado), ids(self.json.filtrar_jogos(self.lista, **filtros))
+            )
+
+    def test_refinar(self):
+        dark = self.mapeado.filtrar_jogos(self.biblioteca, titulo="d")
+        self.assertEqual(
+            sorted(ids(self.mapeado.refinar_busca(dark, "dark so"))), [3, 4]
+        )
+        self.assertEqual(ids(self.mapeado.refinar_busca(dark, "d.")), [3, 4])
+        self.assertEqual(ids(self.mapeado.refinar_busca(dark, "...")), [])
+        self.assertEqual(self.json.refinar_busca(self.lista, "..."), [])
+
+    def test_agregados_iguais_ao_json(self):
+        self.assertTrue(
+            agregados_equivalentes(
+                self.mapeado.calcular_agregados(self.biblioteca),
+                self.json.calcular_agregados(self.lista),
+            )
+        )
+
+    def test_somente_leitura(self):
+        self.assertTrue(self.mapeado.somente_leitura)
+        self.assertFalse(self.mapeado.salvar_jogos(self.biblioteca))
+        self.assertFalse(
+            self.mapeado.registrar_alteracao("remover", jogo=self.biblioteca[0])
+        )
+        self.assertEqual(len(self.mapeado.carregar_jogos()), 5)
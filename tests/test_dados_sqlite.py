@@ -0,0 +1,88 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from src.dados import GerenciadorDados
+from src.dados_sqlite import GerenciadorDadosSQLite
+from src.modelo import Jogo
+
+
+def jogo(titulo, genero, plataforma, data, estado, tempo, nota, id) -> Jogo:
+    return Jogo.de_dict(
+        {
+            "ID": id,
+            "Título": titulo,
+            "Gênero": genero,
+            "Plataforma": plataforma,
+            "Data de Zeramento": data,
+            "Forma de Zeramento": estado,
+            "Tempo Jogado": tempo,
+            "Nota": nota,
+        }
+    )
+
+
+class TesteDadosSQLite(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.pasta, ignore_errors=True)
+        correcao = mock.patch("src.dados.SAVES_DIR", self.pasta)
+        correcao.start()
+        self.addCleanup(correcao.stop)
+
+        GerenciadorDados().salvar_jogos(
+            [
+                jogo("Ícaro", "Ação", "PC", "10/02/2021", "Zerado", "10h 30m", "9", 1),
+                jogo("hades", "ação", "pc", "01/12/2019", "Zerado", "2h 05m", "7", 2),
+                jogo("Zelda", "RPG", "Switch", "", "Planejo Jogar", "", "", 3),
+                jogo("Celeste", "Plataforma", "PC", "10/02/2021", "100%", "", "9", 4),
+                jogo("Éden", "RPG", "PS5", "", "Jogando", "10h 30m", "7.5", 5),
+            ]
+        )
+        self.dados = GerenciadorDadosSQLite(os.path.join(self.pasta, "jogos.db"))
+        self.addCleanup(self.dados.conexao.close)
+        self.lista = self.dados.carregar_jogos()
+
+    def test_ordem_igual_a_do_ordenador(self):
+        referencia = GerenciadorDados()
+        for criterios in (
+            "titulo",
+            "nota",
+            "data",
+            [("genero", False), ("tempo", True)],
+            [("plataforma", True), ("estado", False)],
+        ):
+            self.assertEqual(
+                [j.id for j in self.dados.ordenar_jogos(self.lista, criterios)],
+                [j.id for j in referencia.ordenar_jogos(self.lista, criterios)],
+                criterios,
+            )
+
+    def test_ordena_so_os_jogos_da_lista(self):
+        parte = [self.dados.jogo_por_id(i) for i in (3, 4, 2)]
+        self.assertEqual(
+            [j.id for j in self.dados.ordenar_jogos(parte, "titulo")], [4, 2, 3]
+        )
+
+    def test_filtrar_igual_ao_indice(self):
+        referencia = GerenciadorDados()
+        for filtros in (
+            {"titulo": "hades"},
+            {"titulo": "ades"},
+            {"titulo": "ICARO"},
+            {"genero": "RPG", "titulo": "de"},
+            {"titulo": "?"},
+            {"genero": "RPG"},
+        ):
+            self.assertEqual(
+                [j.id for j in self.dados.filtrar_jogos(self.lista, **filtros)],
+                [j.id for j in referencia.filtrar_jogos(self.lista, **filtros)],
+                filtros,
+            )
+
+    def test_resetar_mantem_o_json(self):
+        self.dados.resetar_tudo()
+        self.assertEqual(self.dados.carregar_jogos(), [])
+        self.assertTrue(os.path.exists(os.path.join(self.pasta, "jogos.json")))
+        self.assertEqual(len(GerenciadorDados().carregar_jogos()), 5)
@@ -0,0 +1,85 @@
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from src.dados import GerenciadorDados
+from src.dados_mapeados import GerenciadorDadosMapeado
+from src.duplicados import IndiceDuplicados
+from src.modelo import Jogo
+
+
+def jogo(titulo, plataforma, id=None) -> Jogo:
+    return Jogo.de_dict({"ID": id, "Título": titulo, "Plataforma": plataforma})
+
+
+class TesteIndiceDuplicados(unittest.TestCase):
+    def test_chave_ignora_caixa_acentos_e_espacos(self):
+        primeiro = jogo("Pokémon  Red", "Game Boy")
+        segundo = jogo(" pokemon red", "game boy ")
+        outro = jogo("Pokémon Red", "Switch")
+        indice = IndiceDuplicados.de_jogos([primeiro, segundo, outro])
+
+        self.assertEqual(
+            indice.encontrar("POKEMON RED", "Game Boy"), [primeiro, segundo]
+        )
+        self.assertEqual(indice.repetidos(), [[primeiro, segundo]])
+
+        indice.remover(segundo)
+        self.assertEqual(indice.repetidos(), [])
+        indice.remover(segundo)
+        self.assertEqual(indice.total, 2)
+
+    def test_acompanha_as_alteracoes_do_gerenciador(self):
+        dados = GerenciadorDados(usar_journal=False)
+        lista = [jogo("Hades", "PC"), jogo("Celeste", "PC")]
+        self.assertEqual(dados.relatorio_duplicados(lista), [])
+
+        repetido = jogo("hades", "PC")
+        dados.registrar_alteracao("adicionar", jogos=[repetido])
+        lista.append(repetido)
+        self.assertEqual(dados.relatorio_duplicados(lista), [[lista[0], repetido]])
+
+        editado = jogo("Hades II", "PC")
+        dados.registrar_alteracao("editar", jogo=repetido, novo=editado)
+        lista[-1] = editado
+        self.assertEqual(dados.relatorio_duplicados(lista), [])
+        self.assertEqual(dados.encontrar_duplicados(lista, "HADES ii", "pc"), [editado])
+
+
+class TesteDuplicadosMapeados(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.pasta, ignore_errors=True)
+        correcao = mock.patch("src.dados.SAVES_DIR", self.pasta)
+        correcao.start()
+        self.addCleanup(correcao.stop)
+
+    def test_relatorio_igual_ao_json(self):
+        GerenciadorDados().salvar_jogos(
+            [
+                jogo("Dark Souls", "PC", 1),
+                jogo("Zelda", "Switch", 2),
+                jogo("dark souls", "PC", 3),
+                jogo("Dark Souls", "PS3", 4),
+                # Título numérico vai inteiro como JSON no snapshot.
+                jogo(1942, "NES", 5),
+                jogo("1942", "nes", 6),
+            ]
+        )
+        dados = GerenciadorDados()
+        lista = dados.carregar_jogos()
+        mapeado = GerenciadorDadosMapeado()
+        biblioteca = mapeado.carregar_jogos()
+
+        grupos = [[j.id for j in g] for g in mapeado.relatorio_duplicados(biblioteca)]
+        self.assertEqual(
+            grupos, [[j.id for j in g] for g in dados.relatorio_duplicados(lista)]
+        )
+        self.assertEqual(sorted(map(sorted, grupos)), [[1, 3], [5, 6]])
+        self.assertEqual(
+            [
+                j.id
+                for j in mapeado.encontrar_duplicados(biblioteca, "DARK SOULS", "pc")
+            ],
+            [1, 3],
+        )
@@ -0,0 +1,60 @@
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from src.dados import GerenciadorDados
+from src.dados_mapeados import GerenciadorDadosMapeado
+from src.modelo import Jogo
+
+
+def jogo(titulo, id=None) -> Jogo:
+    return Jogo.de_dict({"ID": id, "Título": titulo, "Plataforma": "PC"})
+
+
+class TesteIds(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.pasta, ignore_errors=True)
+        correcao = mock.patch("src.dados.SAVES_DIR", self.pasta)
+        correcao.start()
+        self.addCleanup(correcao.stop)
+
+    def test_migracao_preserva_ids_validos(self):
+        lista = [jogo("a"), jogo("b", 5), jogo("c", 5), jogo("d", 2), jogo("e", -1)]
+        dados = GerenciadorDados()
+        self.assertEqual(dados._registrar_ids(lista), 3)
+        self.assertEqual([j.id for j in lista], [6, 5, 7, 2, 8])
+        for j in lista:
+            self.assertIs(dados.jogo_por_id(j.id), j)
+        self.assertIsNone(dados.jogo_por_id(1))
+        self.assertIsNone(dados.jogo_por_id("5"))
+
+    def test_ids_sobrevivem_ao_salvar_e_carregar(self):
+        dados = GerenciadorDados()
+        dados.salvar_jogos([jogo("Hades"), jogo("Celeste"), jogo("Inside", 9)])
+        lista = dados.carregar_jogos()
+        self.assertEqual(dados.ids_migrados, 2)
+        ids = [j.id for j in lista]
+        dados.salvar_jogos(lista)
+
+        outro = GerenciadorDados()
+        recarregada = outro.carregar_jogos()
+        self.assertEqual(outro.ids_migrados, 0)
+        self.assertEqual([j.id for j in recarregada], ids)
+
+        novo = jogo("Tunic")
+        outro.registrar_alteracao("adicionar", jogos=[novo])
+        self.assertNotIn(novo.id, ids)
+        self.assertIs(outro.jogo_por_id(novo.id), novo)
+
+    def test_jogo_por_id_mapeado(self):
+        GerenciadorDados().salvar_jogos([jogo("Hades", 4), jogo("Celeste", 2)])
+        mapeado = GerenciadorDadosMapeado()
+        mapeado.carregar_jogos()
+
+        self.assertEqual(mapeado.jogo_por_id(2).titulo, "Celeste")
+        self.assertEqual(mapeado.jogo_por_id(4).titulo, "Hades")
+        self.assertIsNone(mapeado.jogo_por_id(3))
+        self.assertIsNone(mapeado.jogo_por_id("4"))
+        # O modo somente leitura não guarda objetos, só o snapshot.
+        self.assertEqual(mapeado._por_id, {})
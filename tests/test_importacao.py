@@ -0,0 +1,115 @@
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+import openpyxl
+import pandas as pd
+from src.importacao import importar_arquivo, normalizar_lote, validar_lote
+from src.utils import chave_jogo, validar_campos
+
+CABECALHO = [
+    "Título",
+    "Gênero",
+    "Plataforma",
+    "Data",
+    "Estado",
+    "Tempo",
+    "Nota",
+    "Anotação",
+]
+LINHAS = [
+    ["Zelda", "RPG", "Switch", "2023-05-12", "História", "40:5", "9", "x"],
+    ["Metroid", "RPG", "Switch", "01/02/2020", "100%", "12h 30m", "8.0", ""],
+    ["", "RPG", "PC", "01/02/2020", "História", "1h 00m", "5", ""],
+    ["Doom", "Gênero X", "PC", "01/02/2020", "História", "1h 00m", "5", ""],
+    ["Hades", "RPG", "PC", "31/02/2020", "História", "1h 00m", "5", ""],
+    ["Celeste", "RPG", "PC", "01/02/2020", "História", "rápido", "5", ""],
+    ["Portal", "RPG", "PC", "01/02/2020", "História", "3h 00m", "11", ""],
+    ["Outer Wilds", "RPG", "PC", "", "Planejo Jogar", "", "", ""],
+    ["zelda", "RPG", "switch", "01/01/2024", "História", "2h 00m", "7", ""],
+    ["Dark Souls", "RPG", "PC", "01/02/2020", "Platina", "80h 00m", "10", ""],
+]
+
+
+class TesteImportacao(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.pasta, ignore_errors=True)
+
+    def escrever_csv(self, separador=",", linhas=LINHAS) -> str:
+        caminho = os.path.join(self.pasta, "jogos.csv")
+        with open(caminho, "w", encoding="utf-8-sig", newline="") as arquivo:
+            escritor = csv.writer(arquivo, delimiter=separador)
+            escritor.writerow(CABECALHO)
+            escritor.writerows(linhas)
+        return caminho
+
+    def escrever_xlsx(self, linhas=LINHAS) -> str:
+        caminho = os.path.join(self.pasta, "jogos.xlsx")
+        wb = openpyxl.Workbook()
+        wb.active.append(CABECALHO)
+        for linha in linhas:
+            wb.active.append(linha)
+        wb.save(caminho)
+        return caminho
+
+    def verificar(self, resultado, linhas_erro=(4, 5, 6, 7, 8)):
+        self.assertEqual(resultado.linhas, len(LINHAS))
+        self.assertEqual(
+            [j.titulo for j in resultado.jogos], ["Zelda", "Metroid", "Outer Wilds"]
+        )
+        # "Dark Souls" já existe e "zelda"/"switch" repete a primeira linha.
+        self.assertEqual(resultado.duplicados, 2)
+        self.assertEqual([linha for linha, _ in resultado.erros], list(linhas_erro))
+
+        zelda, metroid, pendente = resultado.jogos
+        self.assertEqual(
+            (zelda.data, zelda.tempo, zelda.nota), ("12/05/2023", "40h 05m", "9")
+        )
+        self.assertEqual(metroid.nota, "8")
+        self.assertEqual((pendente.data, pendente.tempo, pendente.nota), ("", "", ""))
+        for jogo in resultado.jogos:
+            self.assertEqual(jogo.extras, {})
+
+    def test_csv(self):
+        existentes = {chave_jogo("dark souls", "PC")}
+        self.verificar(importar_arquivo(self.escrever_csv(), existentes))
+
+    def test_csv_com_ponto_e_virgula(self):
+        existentes = {chave_jogo("dark souls", "PC")}
+        self.verificar(importar_arquivo(self.escrever_csv(";"), existentes))
+
+    def test_xlsx(self):
+        existentes = {chave_jogo("dark souls", "PC")}
+        self.verificar(importar_arquivo(self.escrever_xlsx(), existentes))
+
+    def test_linhas_vazias_sao_ignoradas(self):
+        vazias = LINHAS[:2] + [[None] * 8, ["", " ", None]] + LINHAS[2:] + [[""] * 8]
+        existentes = {chave_jogo("dark souls", "PC")}
+        self.verificar(
+            importar_arquivo(self.escrever_xlsx(vazias), existentes), (6, 7, 8, 9, 10)
+        )
+        self.verificar(
+            importar_arquivo(self.escrever_csv(linhas=vazias), existentes),
+            (6, 7, 8, 9, 10),
+        )
+
+    def test_mesmas_mensagens_do_formulario(self):
+        lote = normalizar_lote(pd.DataFrame(LINHAS, columns=CABECALHO))
+        for (_, linha), erro in zip(lote.iterrows(), validar_lote(lote)):
+            esperado = validar_campos(
+                linha["Título"],
+                linha["Gênero"],
+                linha["Plataforma"],
+                linha["Data de Zeramento"],
+                linha["Tempo Jogado"],
+                linha["Nota"],
+                linha["Forma de Zeramento"],
+            )
+            self.assertEqual(erro, esperado or "")
+
+    def test_cancelamento(self):
+        self.assertIsNone(
+            importar_arquivo(self.escrever_csv(), set(), cancelado=lambda: True)
+        )
@@ -0,0 +1,181 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from src.dados import GerenciadorDados
+from src.modelo import Jogo
+
+
+def jogo(titulo, plataforma="PC", data="01/02/2020", id=None) -> Jogo:
+    return Jogo.de_dict(
+        {
+            "ID": id,
+            "Título": titulo,
+            "Gênero": "RPG",
+            "Plataforma": plataforma,
+            "Data de Zeramento": data,
+            "Forma de Zeramento": "História",
+            "Tempo Jogado": "10h 00m",
+            "Nota": "8",
+        }
+    )
+
+
+def registros(jogos) -> list:
+    return sorted((j.para_dict() for j in jogos), key=lambda r: r["ID"])
+
+
+class TesteJournal(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.pasta, ignore_errors=True)
+        correcao = mock.patch("src.dados.SAVES_DIR", self.pasta)
+        correcao.start()
+        self.addCleanup(correcao.stop)
+
+        self.dados = GerenciadorDados()
+        self.addCleanup(self.dados.encerrar)
+        self.dados.salvar_jogos(
+            [
+                jogo("Zelda", "Switch", "12/05/2023", id=1),
+                jogo("Hades", "PC", "20/09/2021", id=2),
+                jogo("Celeste", "PC", "", id=3),
+            ]
+        )
+        self.lista = self.dados.carregar_jogos()
+
+    def recarregar(self) -> list:
+        return GerenciadorDados().carregar_jogos()
+
+    def alterar(self):
+        novo = jogo("Okami", "PS2")
+        self.dados.registrar_alteracao("adicionar", jogos=[novo])
+        self.lista.append(novo)
+
+        removido = self.dados.jogo_por_id(2)
+        self.dados.registrar_alteracao("remover", jogo=removido)
+        self.lista.remove(removido)
+
+        original = self.dados.jogo_por_id(1)
+        editado = jogo("Zelda: TotK", "Switch", "12/05/2023")
+        self.dados.registrar_alteracao("editar", jogo=original, novo=editado)
+        self.lista[self.lista.index(original)] = editado
+
+        self.dados.registrar_alteracao("hidden_gem", jogo=novo, valor=True)
+        novo["Hidden Gem"] = True
+        self.dados.descarregar()
+
+    def test_reaplica_todas_as_operacoes(self):
+        self.alterar()
+        self.assertEqual(self.dados.entradas_journal, 4)
+        recarregada = self.recarregar()
+        self.assertEqual(registros(recarregada), registros(self.lista))
+        self.assertEqual(
+            sorted(j.titulo for j in recarregada), ["Celeste", "Okami", "Zelda: TotK"]
+        )
+
+    def test_journal_gravado_na_thread_de_salvamento(self):
+        threads = []
+        fsync = os.fsync
+
+        def registrar_fsync(descritor):
+            threads.append(threading.current_thread().name)
+            fsync(descritor)
+
+        with mock.patch("src.dados.os.fsync", registrar_fsync):
+            self.alterar()
+        self.assertTrue(threads)
+        self.assertEqual(set(threads), {"salvamento"})
+
+    def test_limites_do_journal(self):
+        self.assertFalse(self.dados.precisa_compactar())
+        with mock.patch("src.dados.LIMITE_JOURNAL", 4):
+            self.alterar()
+            self.assertTrue(self.dados.precisa_compactar())
+            self.dados.salvar_jogos(self.lista)
+            self.assertFalse(self.dados.precisa_compactar())
+
+        self.dados.registrar_alteracao("hidden_gem", jogo=self.lista[0], valor=True)
+        self.dados.descarregar()
+        self.assertFalse(self.dados.precisa_compactar())
+        with mock.patch("src.dados.LIMITE_BYTES_JOURNAL", 64):
+            self.assertTrue(self.dados.precisa_compactar())
+        self.assertFalse(
+            GerenciadorDados(usar_journal=False).precisa_compactar() is False
+        )
+
+    def test_edicoes_encadeadas_ficam_com_o_ultimo_valor(self):
+        original = self.dados.jogo_por_id(3)
+        for titulo in ("Celeste DX", "Celeste Farewell"):
+            novo = jogo(titulo, data="")
+            self.dados.registrar_alteracao("editar", jogo=original, novo=novo)
+            original = novo
+        self.dados.descarregar()
+        recarregada = self.recarregar()
+        self.assertEqual(len(recarregada), 3)
+        self.assertEqual(
+            [j.titulo for j in recarregada if j.id == 3], ["Celeste Farewell"]
+        )
+
+    def test_salvar_descarta_o_journal(self):
+        self.alterar()
+        self.assertTrue(self.dados.salvar_jogos(self.lista))
+        self.assertFalse(os.path.exists(self.dados.arquivo_journal))
+        self.assertEqual(registros(self.recarregar()), registros(self.lista))
+
+    def test_alteracoes_durante_o_salvamento_continuam_no_journal(self):
+        self.alterar()
+        posicao = self.dados._posicao_journal()
+        copia = list(self.lista)
+
+        tardio = jogo("Outer Wilds")
+        self.dados.registrar_alteracao("adicionar", jogos=[tardio])
+        self.lista.append(tardio)
+
+        self.assertTrue(self.dados.salvar_jogos(copia, posicao))
+        self.assertEqual(self.dados.entradas_journal, 1)
+        self.assertEqual(registros(self.recarregar()), registros(self.lista))
+
+    def test_linha_cortada_no_fim_e_descartada(self):
+        self.alterar()
+        with open(self.dados.arquivo_journal, "a", encoding="utf-8") as arquivo:
+            arquivo.write('{"op": "remover", "seq": 99, "i')
+        tamanho = os.path.getsize(self.dados.arquivo_journal)
+
+        self.assertEqual(registros(self.recarregar()), registros(self.lista))
+        self.assertLess(os.path.getsize(self.dados.arquivo_journal), tamanho)
+
+        # Entradas gravadas depois do reparo também voltam na próxima abertura.
+        dados = GerenciadorDados()
+        lista = dados.carregar_jogos()
+        extra = jogo("Tunic")
+        dados.registrar_alteracao("adicionar", jogos=[extra])
+        dados.encerrar()
+        self.assertEqual(registros(self.recarregar()), registros(lista + [extra]))
+
+    def test_queda_antes_de_trocar_o_arquivo(self):
+        self.alterar()
+        with mock.patch("src.dados.os.replace", side_effect=OSError("queda")):
+            self.assertFalse(self.dados.salvar_jogos(self.lista))
+        self.assertEqual(registros(self.recarregar()), registros(self.lista))
+
+    def test_queda_depois_de_trocar_o_arquivo(self):
+        self.alterar()
+        with mock.patch.object(GerenciadorDados, "_podar_journal"):
+            self.assertTrue(self.dados.salvar_jogos(self.lista))
+        self.assertTrue(os.path.exists(self.dados.arquivo_journal))
+        self.assertEqual(registros(self.recarregar()), registros(self.lista))
+
+    def test_journal_de_outro_arquivo_e_ignorado(self):
+        self.alterar()
+        with open(self.dados.arquivo_journal, encoding="utf-8") as arquivo:
+            linhas = arquivo.readlines()
+        linhas[0] = json.dumps({"base": [1, 2]}) + "\n"
+        with open(self.dados.arquivo_journal, "w", encoding="utf-8") as arquivo:
+            arquivo.writelines(linhas)
+
+        self.assertEqual(len(self.recarregar()), 3)
+        self.assertFalse(os.path.exists(self.dados.arquivo_journal))
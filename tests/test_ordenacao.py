@@ -0,0 +1,158 @@
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from src.dados import GerenciadorDados, ordenar_por_data
+from src.dados_mapeados import GerenciadorDadosMapeado
+from src.modelo import Jogo
+from src.ordenacao import OrdenadorJogos, normalizar_criterios
+
+
+def jogo(
+    titulo, nota="", plataforma="PC", data="", genero="", estado="", tempo="", id=None
+) -> Jogo:
+    return Jogo.de_dict(
+        {
+            "ID": id,
+            "Título": titulo,
+            "Nota": nota,
+            "Plataforma": plataforma,
+            "Data de Zeramento": data,
+            "Gênero": genero,
+            "Estado": estado,
+            "Tempo Jogado": tempo,
+        }
+    )
+
+
+def variados() -> list:
+    # Poucos valores por campo para forçar empates entre os critérios.
+    generos = ["RPG", "ação", "Puzzle"]
+    estados = ["Zerado", "Jogando", "Desistência"]
+    notas = ["", "7", "9.5", "7.0"]
+    datas = ["", "10/02/2021", "01/12/2019", "10/02/2021"]
+    tempos = ["", "10:30", "2:05", "10:30"]
+    return [
+        jogo(
+            "Jogo %d" % (i % 7),
+            notas[i % 4],
+            "PC",
+            datas[(i // 4) % 4],
+            generos[i % 3],
+            estados[(i // 3) % 3],
+            tempos[(i // 2) % 4],
+            i + 1,
+        )
+        for i in range(40)
+    ]
+
+
+def titulos(jogos) -> list:
+    return [j.titulo for j in jogos]
+
+
+class TesteOrdenacao(unittest.TestCase):
+    def test_normalizar_criterios(self):
+        self.assertEqual(normalizar_criterios("nota"), (("nota", True),))
+        self.assertEqual(normalizar_criterios("desconhecido"), ())
+        self.assertEqual(
+            normalizar_criterios([("titulo", 0), ("xyz", True), ("tempo", 1)]),
+            (("titulo", False), ("tempo", True)),
+        )
+
+    def test_titulo_ignora_caixa(self):
+        jogos = [jogo("beta"), jogo("Alfa"), jogo("gama"), jogo("Beta")]
+        self.assertEqual(
+            titulos(OrdenadorJogos("titulo").ordenar(jogos)),
+            ["Alfa", "beta", "Beta", "gama"],
+        )
+
+    def test_nota_decrescente_e_empates_estaveis(self):
+        jogos = [jogo("a", "7"), jogo("b", ""), jogo("c", "9.5"), jogo("d", "7")]
+        self.assertEqual(
+            titulos(OrdenadorJogos("nota").ordenar(jogos)), ["c", "a", "d", "b"]
+        )
+
+    def test_varios_criterios(self):
+        jogos = [
+            jogo("b", plataforma="PS5"),
+            jogo("a", plataforma="pc"),
+            jogo("c", plataforma="PS5"),
+            jogo("d", plataforma="PC"),
+        ]
+        ordenador = OrdenadorJogos([("plataforma", False), ("titulo", True)])
+        self.assertEqual(titulos(ordenador.ordenar(jogos)), ["d", "a", "c", "b"])
+
+    def test_inserir_mantem_a_ordem(self):
+        for criterios in (
+            "data",
+            [("genero", True), ("tempo", False)],
+            [("estado", False), ("titulo", True), ("nota", False)],
+        ):
+            jogos = variados()
+            ordenador = OrdenadorJogos(criterios)
+            lista = ordenador.ordenar(jogos[:25])
+            for novo in jogos[25:]:
+                ordenador.inserir(lista, novo)
+            chaves = [ordenador.chave(j) for j in lista]
+            self.assertEqual(chaves, sorted(chaves), criterios)
+            self.assertEqual(
+                [ordenador.chave(j) for j in ordenador.ordenar(jogos)], chaves
+            )
+
+
+class TestePosicaoNaLista(unittest.TestCase):
+    def test_posicao_com_empates(self):
+        dados = GerenciadorDados()
+        for criterios in (None, "nota", [("genero", False), ("tempo", True)]):
+            jogos = variados()
+            if criterios:
+                lista = dados.ordenar_jogos(jogos, criterios)
+            else:
+                lista = ordenar_por_data(jogos)
+            for i, atual in enumerate(lista):
+                self.assertEqual(dados.posicao_jogo(lista, atual, criterios), i)
+
+    def test_sem_criterios_insere_na_ordem_de_data(self):
+        dados = GerenciadorDados()
+        jogos = variados()
+        lista = ordenar_por_data(jogos[:20])
+        for novo in jogos[20:]:
+            dados.inserir_ordenado(lista, novo)
+        self.assertEqual(lista, ordenar_por_data(lista))
+        self.assertCountEqual(lista, jogos)
+
+    def test_lista_fora_de_ordem(self):
+        dados = GerenciadorDados()
+        lista = variados()
+        self.assertEqual(dados.posicao_jogo(lista, lista[7], "titulo"), 7)
+
+
+class TesteOrdenacaoMapeada(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.pasta, ignore_errors=True)
+        correcao = mock.patch("src.dados.SAVES_DIR", self.pasta)
+        correcao.start()
+        self.addCleanup(correcao.stop)
+
+    def test_mesma_ordem_do_json(self):
+        GerenciadorDados().salvar_jogos(variados())
+        dados = GerenciadorDados()
+        lista = dados.carregar_jogos()
+        mapeado = GerenciadorDadosMapeado()
+        biblioteca = mapeado.carregar_jogos()
+
+        for criterios in (
+            "titulo",
+            "nota",
+            "data",
+            [("genero", False), ("tempo", True)],
+            [("estado", True), ("plataforma", False), ("nota", False)],
+        ):
+            esperado = [j.id for j in dados.ordenar_jogos(lista, criterios)]
+            ordenada = mapeado.ordenar_jogos(biblioteca, criterios)
+            self.assertEqual([j.id for j in ordenada], esperado, criterios)
+            # Listas comuns seguem pelo ordenador genérico.
+            comum = mapeado.ordenar_jogos(list(biblioteca), criterios)
+            self.assertEqual([j.id for j in comum], esperado, criterios)
@@ -0,0 +1,98 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from src.dados import GerenciadorDados
+from src.modelo import Jogo
+from src.snapshot import abrir_snapshot, carregar_snapshot, salvar_snapshot
+
+ASSINATURA = [1234, 5678]
+
+
+def atributos(jogo) -> tuple:
+    return (
+        jogo.para_dict(),
+        jogo.data_ordinal,
+        jogo.ano,
+        jogo.minutos,
+        jogo.nota_valor,
+    )
+
+
+class TesteSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.pasta, ignore_errors=True)
+        self.caminho = os.path.join(self.pasta, "jogos.bin")
+        self.jogos = [
+            Jogo.de_dict(
+                {
+                    "ID": 1,
+                    "Título": "Zelda",
+                    "Gênero": "Aventura",
+                    "Plataforma": "Switch",
+                    "Data de Zeramento": "12/05/2023",
+                    "Forma de Zeramento": "História",
+                    "Tempo Jogado": "40h 30m",
+                    "Nota": "9",
+                    "Hidden Gem": True,
+                }
+            ),
+            Jogo.de_dict({"ID": 2, "Título": "Nota inteira", "Nota": 7}),
+            Jogo.de_dict({"ID": 3, "Título": "Nota real", "Nota": 8.5}),
+            Jogo.de_dict({"Título": "Sem ID", "Hidden Gem": False}),
+            Jogo.de_dict({"ID": 5, "Título": "Ação", "Observação": "ç", "Lista": [1]}),
+            # Tipos fora do comum vão inteiros como JSON.
+            Jogo.de_dict({"ID": 6, "Título": 1999, "Nota": None, "Hidden Gem": "sim"}),
+        ]
+
+    def test_ida_e_volta(self):
+        self.assertTrue(salvar_snapshot(self.caminho, self.jogos, ASSINATURA))
+        carregados = carregar_snapshot(self.caminho, ASSINATURA)
+        self.assertEqual(
+            [atributos(j) for j in carregados], [atributos(j) for j in self.jogos]
+        )
+
+    def test_jogo_avulso_igual_a_lista(self):
+        salvar_snapshot(self.caminho, self.jogos, ASSINATURA)
+        with open(self.caminho, "rb") as arquivo:
+            snapshot = abrir_snapshot(arquivo.read(), ASSINATURA)
+        self.assertEqual(
+            [atributos(j) for j in snapshot.jogos()],
+            [atributos(snapshot.jogo(i)) for i in range(len(snapshot))],
+        )
+
+    def test_assinatura_diferente_invalida(self):
+        salvar_snapshot(self.caminho, self.jogos, ASSINATURA)
+        self.assertIsNone(carregar_snapshot(self.caminho, [1234, 0]))
+
+    def test_arquivo_inexistente_ou_corrompido(self):
+        self.assertIsNone(carregar_snapshot(self.caminho, ASSINATURA))
+        salvar_snapshot(self.caminho, self.jogos, ASSINATURA)
+        with open(self.caminho, "r+b") as arquivo:
+            arquivo.truncate(os.path.getsize(self.caminho) // 2)
+        self.assertIsNone(carregar_snapshot(self.caminho, ASSINATURA))
+
+
+class TesteSnapshotNoCarregamento(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.pasta, ignore_errors=True)
+        correcao = mock.patch("src.dados.SAVES_DIR", self.pasta)
+        correcao.start()
+        self.addCleanup(correcao.stop)
+
+    def test_abre_pelo_snapshot_e_refaz_quando_o_json_muda(self):
+        dados = GerenciadorDados()
+        dados.salvar_jogos([Jogo.de_dict({"ID": 1, "Título": "Zelda"})])
+        self.assertTrue(os.path.exists(dados.arquivo_snapshot))
+
+        with mock.patch.object(GerenciadorDados, "_carregar_json") as json_lido:
+            self.assertEqual([j.titulo for j in dados.carregar_jogos()], ["Zelda"])
+        json_lido.assert_not_called()
+
+        # Editado fora do programa: a assinatura muda e o JSON vale.
+        with open(dados.arquivo_jogos, "w", encoding="utf-8") as arquivo:
+            arquivo.write('[{"ID": 1, "Título": "Hades"}]')
+        self.assertEqual([j.titulo for j in dados.carregar_jogos()], ["Hades"])